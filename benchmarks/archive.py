@@ -0,0 +1,95 @@
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from numpy import array
+
+from components.archive import GameArchive
+from components.board import Board
+from components.dice import Dice
+from components.recorder import OUT_OF_BOARD
+
+
+def play_moves(board, dice, rng):
+    """
+    Plays a game without any console interaction and returns every move.
+
+    Parameters
+    ----------
+    board: Board
+        Board to play on
+    dice: Dice
+        Dice to play with
+    rng: random.Random
+        Random number generator
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        player, dice roll and new position of every move
+    """
+    jumps = board.jump_table().tolist()
+    positions = [0] * board.num_of_players
+    moves = []
+    while True:
+        for player in range(board.num_of_players):
+            while True:
+                dice_roll = rng.randint(dice.min_num, dice.max_num)
+                updated_position = positions[player] + dice_roll
+                if updated_position > board.win_position:
+                    moves.append((player + 1, dice_roll, OUT_OF_BOARD))
+                    break
+                positions[player] = jumps[updated_position]
+                moves.append((player + 1, dice_roll, positions[player]))
+                if dice_roll != dice.max_num:
+                    break
+            if positions[player] == board.win_position:
+                players, dice_rolls, new_positions = array(moves).T
+                return players, dice_rolls, new_positions
+
+
+def run(num_games=20000, num_of_players=4, seed=0):
+    """
+    Measures archiving games and aggregating over the memory mapped archive.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to archive
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the random number generator
+    """
+    board = Board(num_of_players=num_of_players)
+    board.default_setup()
+    dice = Dice()
+    rng = Random(seed)
+    games = [play_moves(board, dice, rng) for _ in range(num_games)]
+
+    with TemporaryDirectory() as directory:
+        archive = GameArchive(directory)
+        start = perf_counter()
+        for players, dice_rolls, positions in games:
+            archive.append(players, dice_rolls, positions, num_of_players, board.win_position, dice.max_num)
+        appended = perf_counter() - start
+
+        archive = GameArchive(directory)
+        start = perf_counter()
+        mean_rounds, histogram = archive.mean_rounds(), archive.roll_histogram()
+        aggregated = perf_counter() - start
+
+        start = perf_counter()
+        for game_id in range(0, num_games, num_games // 100):
+            archive.history(game_id)
+        opened = (perf_counter() - start) / 100
+
+        num_of_moves = len(archive.column('roll'))
+        print(f'>>>> Archived {num_games:,} games with {num_of_moves:,} moves in {appended:.3f}s')
+        print(f'>>>> Aggregated {mean_rounds:.2f} rounds per game and the roll histogram {histogram[1:].tolist()} '
+              f'in {aggregated * 1000:.1f}ms')
+        print(f'>>>> Opened a single game in {opened * 1000:.3f}ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,39 @@
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.board_setup import random_layout
+from components.board_config import load_board
+from components.dice import Dice
+from shared.narration import NULL_SINK
+
+
+def run(rows=1000, columns=1000, num_of_entities=100000):
+    """
+    Measures loading a large board configuration the first time, when it is compiled, and from the cache, without
+    and with its reachability index.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes on the board
+    """
+    ladders, snakes = random_layout(rows * columns, num_of_entities)
+    board_config = {'num_of_rows': rows, 'num_of_columns': columns, 'ladders': ladders, 'snakes': snakes}
+    dice = Dice(narrator=NULL_SINK)
+    for name, options in (('board', {}), ('board and reachability index', {'dice': dice})):
+        with TemporaryDirectory() as cache_dir:
+            timings = []
+            for _ in range(3):
+                start = perf_counter()
+                load_board(board_config, num_of_players=2, cache_dir=cache_dir, narrator=NULL_SINK, **options)
+                timings.append(perf_counter() - start)
+        print(f'>>>> {rows}x{columns} {name} with {num_of_entities:,} ladders and snakes: compiled in '
+              f'{timings[0]:.3f}s, loaded from the cache in {min(timings[1:]):.3f}s')
+
+
+if __name__ == '__main__':
+    run()
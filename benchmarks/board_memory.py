@@ -0,0 +1,81 @@
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from numpy.random import default_rng
+
+from benchmarks.board_setup import random_layout
+from components.board import Board
+from components.ladder import Ladder
+from components.snake import Snake
+from shared.narration import NULL_SINK
+
+
+def traced(function):
+    """
+    Runs a function while tracing its memory allocations.
+
+    Returns
+    -------
+    (object, int, int)
+        result of the function, memory still allocated and peak memory allocated in bytes
+    """
+    start()
+    result = function()
+    current, peak = get_traced_memory()
+    stop()
+    return result, current, peak
+
+
+def build_board(rows, columns, num_of_players, ladders, snakes):
+    board = Board(num_of_players=num_of_players, rows=rows, columns=columns, narrator=NULL_SINK)
+    board.add_ladders(ladders)
+    board.add_snakes(snakes)
+    return board
+
+
+def run(rows=1000, columns=1000, num_of_entities=100000, num_of_players=500, num_of_moves=200000, seed=0):
+    """
+    Measures the memory of a large board, against keeping every ladder and snake as an object in a dict.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes on the board
+    num_of_players: int
+        Number of players on the board
+    num_of_moves: int
+        Number of moves played on the board
+    seed: int
+        Seed for the random number generator
+    """
+    ladders, snakes = random_layout(rows * columns, num_of_entities, seed)
+    board, current, peak = traced(lambda: build_board(rows, columns, num_of_players, ladders, snakes))
+    print(f'>>>> Board of {rows * columns:,} cells with {num_of_entities:,} ladders and snakes and '
+          f'{num_of_players} players: {current / 2 ** 20:.1f}MiB kept, {peak / 2 ** 20:.1f}MiB at peak')
+
+    def entity_dicts():
+        return ({bottom: Ladder(bottom, top) for bottom, top in ladders},
+                {mouth: Snake(mouth, tail) for mouth, tail in snakes})
+    _, current, _ = traced(entity_dicts)
+    print(f'>>>> Same ladders and snakes as objects in dicts: {current / 2 ** 20:.1f}MiB')
+
+    rng = default_rng(seed)
+    players = rng.integers(1, num_of_players + 1, size=num_of_moves).tolist()
+    dice_rolls = rng.integers(1, 7, size=num_of_moves).tolist()
+
+    def play():
+        began = perf_counter()
+        for player, dice_roll in zip(players, dice_rolls):
+            board.advance(player, dice_roll)
+        return perf_counter() - began
+    elapsed, current, peak = traced(play)
+    print(f'>>>> Played {num_of_moves:,} moves in {elapsed:.3f}s, the move history takes '
+          f'{current / 2 ** 20:.1f}MiB, {peak / 2 ** 20:.1f}MiB at peak')
+
+
+if __name__ == '__main__':
+    run()
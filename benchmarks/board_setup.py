@@ -0,0 +1,68 @@
+from time import perf_counter
+
+from numpy.random import default_rng
+
+from components.board import Board
+
+
+def random_layout(win_position, num_of_entities, seed=0):
+    """
+    Draws non overlapping ladders and snakes for a board.
+
+    Parameters
+    ----------
+    win_position: int
+        Win position of the board
+    num_of_entities: int
+        Number of ladders and of snakes to draw
+    seed: int
+        Seed for the random number generator
+
+    Returns
+    -------
+    (list, list)
+        bottom and top of every ladder, mouth and tail of every snake
+    """
+    cells = default_rng(seed).permutation(win_position - 2)[:4 * num_of_entities] + 2
+    starts, ends = cells[:2 * num_of_entities], cells[2 * num_of_entities:]
+    low, high = starts.clip(max=ends), ends.clip(min=starts)
+    ladders = list(zip(low[:num_of_entities].tolist(), high[:num_of_entities].tolist()))
+    snakes = list(zip(high[num_of_entities:].tolist(), low[num_of_entities:].tolist()))
+    return ladders, snakes
+
+
+def run(rows=1000, columns=1000, num_of_entities=50000):
+    """
+    Measures placing ladders and snakes one by one and in batches on a large board.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes to place
+    """
+    ladders, snakes = random_layout(rows * columns, num_of_entities)
+
+    board = Board(num_of_players=2, rows=rows, columns=columns)
+    start = perf_counter()
+    for bottom, top in ladders:
+        board.add_ladder(bottom, top)
+    for mouth, tail in snakes:
+        board.add_snake(mouth, tail)
+    one_by_one = perf_counter() - start
+
+    board = Board(num_of_players=2, rows=rows, columns=columns)
+    start = perf_counter()
+    board.add_ladders(ladders)
+    board.add_snakes(snakes)
+    batched = perf_counter() - start
+
+    print(f'>>>> Placing {num_of_entities:,} ladders and {num_of_entities:,} snakes on a {rows}x{columns} board')
+    print(f'>>>> One by one: {one_by_one:.3f}s, in batches: {batched:.3f}s')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,92 @@
+from os import path as os_path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.board_setup import random_layout
+from components.board import Board
+from components.checkpoint import GameCheckpoint
+from components.dice import Dice
+from components.recorder import OUT_OF_BOARD
+from shared.narration import NULL_SINK
+
+
+def play_moves(board, dice, num_of_moves, checkpoint=None):
+    """
+    Plays moves turn after turn like the console game, without checking for a victory, optionally keeping them
+    in a checkpoint.
+    """
+    player = 1
+    for _ in range(num_of_moves):
+        dice_roll = dice.roll()
+        player_moved = board.move_player(player, dice_roll)
+        if checkpoint is not None:
+            checkpoint.record(player, dice_roll, board.history.position(player) if player_moved else OUT_OF_BOARD)
+        if not player_moved or not dice.got_one_more_roll(dice_roll):
+            player = player % board.num_of_players + 1
+
+
+def new_board(num_of_players, rows, columns, ladders, snakes):
+    board = Board(num_of_players=num_of_players, rows=rows, columns=columns, narrator=NULL_SINK)
+    board.add_ladders(ladders)
+    board.add_snakes(snakes)
+    return board
+
+
+def run(game_lengths=(1000, 10000, 100000, 1000000), num_of_players=10, rows=1000, columns=1000,
+        num_of_entities=50000, seed=0):
+    """
+    Measures the overhead of keeping a checkpoint on every move, and the time to resume an interrupted game
+    against replaying all of its moves.
+
+    Parameters
+    ----------
+    game_lengths: tuple
+        Numbers of moves played before the game is interrupted
+    num_of_players: int
+        Number of players
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes on the board
+    seed: int
+        Seed for the random number generator
+    """
+    ladders, snakes = random_layout(rows * columns, num_of_entities, seed)
+    with TemporaryDirectory() as directory:
+        path = os_path.join(directory, 'checkpoint.npz')
+        for num_of_moves in game_lengths:
+            board = new_board(num_of_players, rows, columns, ladders, snakes)
+            start = perf_counter()
+            play_moves(board, Dice(seed=seed, narrator=NULL_SINK), num_of_moves)
+            without_checkpoint = perf_counter() - start
+
+            board = new_board(num_of_players, rows, columns, ladders, snakes)
+            dice = Dice(seed=seed, narrator=NULL_SINK)
+            checkpoint = GameCheckpoint(path)
+            start = perf_counter()
+            checkpoint.start(board, dice)
+            play_moves(board, dice, num_of_moves, checkpoint)
+            with_checkpoint = perf_counter() - start
+            positions = board.history.current_positions().tolist()
+
+            # The game is interrupted without clearing the checkpoint, and resumed from the files alone
+            start = perf_counter()
+            GameCheckpoint(path).restore(narrator=NULL_SINK)
+            restore = perf_counter() - start
+            board = new_board(num_of_players, rows, columns, ladders, snakes)
+            start = perf_counter()
+            play_moves(board, Dice(seed=seed, narrator=NULL_SINK), num_of_moves)
+            replay = perf_counter() - start
+            assert board.history.current_positions().tolist() == positions
+            checkpoint.clear()
+
+            overhead = (with_checkpoint - without_checkpoint) / num_of_moves * 1e6
+            print(f'>>>> {num_of_moves:,} moves: {overhead:,.2f}us checkpoint overhead per move '
+                  f'({(with_checkpoint / without_checkpoint - 1) * 100:+,.1f}%), resumed in {restore * 1000:,.2f}ms '
+                  f'against {replay * 1000:,.2f}ms replaying the moves, speedup {replay / restore:,.1f}x')
+
+
+if __name__ == '__main__':
+    run()
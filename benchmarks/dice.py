@@ -0,0 +1,52 @@
+from contextlib import redirect_stdout
+from os import devnull
+from random import randint
+from time import perf_counter
+
+from components.dice import Dice
+
+
+def rolls_per_second(roll, count):
+    """
+    Measures how many dice numbers a roll function generates per second.
+
+    Parameters
+    ----------
+    roll: function
+        Function generating one number per call
+    count: int
+        Count of numbers to generate
+
+    Returns
+    -------
+    float
+    """
+    start = perf_counter()
+    for _ in range(count):
+        roll()
+    return count / (perf_counter() - start)
+
+
+def run(count=1000000):
+    """
+    Compares the rolls per second of every dice backend, one roll at a time and in a single batch.
+
+    Parameters
+    ----------
+    count: int
+        Count of numbers to generate with every backend
+    """
+    print(f'>>>> random.randint: {rolls_per_second(lambda: randint(1, 6), count):,.0f} rolls per second')
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        dice_by_backend = {'random': Dice(seed=0), 'pcg64': Dice(seed=0, backend='pcg64'),
+                           'replay': Dice(sequence=Dice(seed=0, backend='pcg64').roll_many(2 * count))}
+    for name, dice in dice_by_backend.items():
+        scalar = rolls_per_second(dice.roll, count)
+        start = perf_counter()
+        dice.roll_many(count)
+        batch = count / (perf_counter() - start)
+        print(f'>>>> {name}: {scalar:,.0f} rolls per second with roll, {batch:,.0f} with roll_many')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,59 @@
+from os import path as os_path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing
+
+from benchmarks.archive import play_moves
+from components.archive import GameArchive
+from components.board import Board
+from components.dice import Dice
+from components.export import HistoryExporter
+from shared.exception import ExportException
+from shared.narration import NULL_SINK
+
+
+def run(num_games=20000, num_of_players=4, row_group_size=1 << 16, seed=0):
+    """
+    Measures streaming an archive of games to Parquet and Arrow IPC files, with the peak memory of the export.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to archive and export
+    num_of_players: int
+        Number of players in every game
+    row_group_size: int
+        Number of moves written at once
+    seed: int
+        Seed for the random number generator
+    """
+    board = Board(num_of_players=num_of_players, narrator=NULL_SINK)
+    board.default_setup()
+    dice = Dice(narrator=NULL_SINK)
+    rng = Random(seed)
+    with TemporaryDirectory() as directory:
+        archive = GameArchive(os_path.join(directory, 'archive'))
+        for _ in range(num_games):
+            archive.append(*play_moves(board, dice, rng), num_of_players, board.win_position, dice.max_num)
+        for file_name in ('moves.parquet', 'moves.arrow'):
+            path = os_path.join(directory, file_name)
+            start_tracing()
+            start = perf_counter()
+            try:
+                with HistoryExporter(path, row_group_size=row_group_size) as exporter:
+                    exporter.add_archive(archive)
+            except ExportException as e:
+                stop_tracing()
+                print(f'>>>> {e.message}')
+                return
+            elapsed = perf_counter() - start
+            peak = get_traced_memory()[1]
+            stop_tracing()
+            print(f'>>>> {file_name}: {exporter.num_of_moves / elapsed:,.0f} moves per second, '
+                  f'{os_path.getsize(path) / exporter.num_of_moves:.2f} bytes per move, '
+                  f'{peak / 1024 ** 2:.1f}MB peak memory')
+
+
+if __name__ == '__main__':
+    run()
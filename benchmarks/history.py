@@ -0,0 +1,69 @@
+from time import perf_counter
+
+from numpy import append, array
+from numpy.random import default_rng
+
+from components.history import MoveHistory
+
+
+def record_with_numpy_append(dice_rolls, num_of_players):
+    """
+    Records moves the way the board used to, appending to a copy of the arrays on every move.
+
+    Parameters
+    ----------
+    dice_rolls: list
+        Dice rolls to record, assigned to the players in turn
+    num_of_players: int
+        Number of players
+    """
+    positions = {f'Player {player}': array([0], dtype=int) for player in range(1, num_of_players + 1)}
+    rolls = {f'Player {player}': array([], dtype=int) for player in range(1, num_of_players + 1)}
+    for move, dice_roll in enumerate(dice_rolls):
+        player = move % num_of_players + 1
+        rolls[f'Player {player}'] = append(rolls[f'Player {player}'], dice_roll)
+        positions[f'Player {player}'] = append(positions[f'Player {player}'], move)
+
+
+def record_with_history(dice_rolls, num_of_players):
+    """
+    Records moves in a move history.
+
+    Parameters
+    ----------
+    dice_rolls: list
+        Dice rolls to record, assigned to the players in turn
+    num_of_players: int
+        Number of players
+    """
+    history = MoveHistory(num_of_players=num_of_players)
+    for move, dice_roll in enumerate(dice_rolls):
+        player = move % num_of_players + 1
+        history.record_roll(player, dice_roll)
+        history.record_position(player, move)
+
+
+def run(num_of_moves=1000000, baseline_moves=100000, num_of_players=4):
+    """
+    Compares recording moves in a move history against appending to NumPy arrays.
+
+    Parameters
+    ----------
+    num_of_moves: int
+        Number of moves to record in a move history
+    baseline_moves: int
+        Number of moves to record with ``numpy.append``, kept smaller since its cost grows quadratically
+    num_of_players: int
+        Number of players
+    """
+    dice_rolls = default_rng(0).integers(1, 6, size=num_of_moves, endpoint=True).tolist()
+    for name, record, moves in (('numpy.append', record_with_numpy_append, baseline_moves),
+                                ('MoveHistory', record_with_history, num_of_moves)):
+        start = perf_counter()
+        record(dice_rolls[:moves], num_of_players)
+        elapsed = perf_counter() - start
+        print(f'>>>> {name}: recorded {moves:,} moves in {elapsed:.3f}s - {moves / elapsed:,.0f} moves per second')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,66 @@
+from contextlib import redirect_stdout
+from os import devnull
+from time import perf_counter
+
+from components.board import Board
+from components.dice import Dice
+from components.instrumentation import INSTRUMENTATION
+from shared.narration import NULL_SINK
+
+
+def play_games(num_games, num_of_players, seed):
+    """
+    Plays games through the console game methods, without any console interaction.
+
+    Returns
+    -------
+    float
+        Time taken in seconds
+    """
+    dice = Dice(seed=seed, narrator=NULL_SINK)
+    start = perf_counter()
+    for _ in range(num_games):
+        board = Board(num_of_players=num_of_players, narrator=NULL_SINK)
+        board.default_setup()
+        winner = 0
+        while not winner:
+            for player in range(1, num_of_players + 1):
+                while True:
+                    dice_roll = dice.roll()
+                    if not board.move_player(player, dice_roll) or not dice.got_one_more_roll(dice_roll):
+                        break
+                if board.check_for_victory(player):
+                    winner = player
+                    break
+    return perf_counter() - start
+
+
+def run(num_games=2000, num_of_players=2, seed=0):
+    """
+    Measures the overhead of the instrumentation on the console game methods, disabled and enabled.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to play
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the random number generator
+    """
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        disabled = play_games(num_games, num_of_players, seed)
+        INSTRUMENTATION.enable()
+        enabled = play_games(num_games, num_of_players, seed)
+        INSTRUMENTATION.disable()
+    print(f'>>>> Played {num_games:,} games in {disabled:.3f}s with the instrumentation disabled and '
+          f'{enabled:.3f}s enabled, {(enabled / disabled - 1) * 100:.1f}% overhead')
+    rates = INSTRUMENTATION.rates()
+    print(f">>>> {INSTRUMENTATION.counters['moves']:,} moves, ladder hit rate {rates['ladder_hits']:.3f}, "
+          f"snake hit rate {rates['snake_hits']:.3f}, overshoot rate {rates['overshoots']:.3f}")
+    for name, histogram in INSTRUMENTATION.histograms.items():
+        print(f'>>>> {name}: {histogram.count:,} calls, {histogram.total / histogram.count * 1e6:.2f}us on average')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,83 @@
+from time import perf_counter
+
+from numpy import sqrt
+
+from benchmarks.vectorized import play_with_move_player
+from components.analytics import MarkovAnalysis
+from components.board import Board
+from components.dice import Dice
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+
+def check_against_played_games(num_games=5000, num_of_players=3):
+    """
+    Compares the exact Markov chain results with games played through the board rules.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to play
+    num_of_players: int
+        Number of players in every game
+
+    Returns
+    -------
+    bool
+        Whether every played statistic lies within four standard errors of the exact value
+    """
+    board = Board(num_of_players=num_of_players, narrator=NULL_SINK)
+    board.default_setup()
+    dice = Dice(narrator=NULL_SINK)
+    analysis = MarkovAnalysis(board, dice)
+    played = play_with_move_player(board, dice, num_games)
+    winners, rounds = played.winners, played.rounds
+
+    expected_rounds = analysis.expected_rounds(num_of_players)
+    rounds_error = rounds.std() / sqrt(num_games)
+    within_bounds = abs(rounds.mean() - expected_rounds) < 4 * rounds_error
+    print(f'>>>> Expected rounds: exact {expected_rounds:.3f}, played {rounds.mean():.3f} ± {rounds_error:.3f}')
+    for seat, probability in enumerate(analysis.win_probabilities(num_of_players), 1):
+        played = (winners == seat).mean()
+        error = sqrt(probability * (1 - probability) / num_games)
+        within_bounds &= abs(played - probability) < 4 * error
+        print(f'>>>> Player {seat} wins: exact {probability:.4f}, played {played:.4f} ± {error:.4f}')
+    print(f'>>>> Played games {"agree" if within_bounds else "DO NOT agree"} with the exact results')
+    return bool(within_bounds)
+
+
+def run(rows=100, columns=120):
+    """
+    Measures the exact analysis of a large board.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    """
+    board = Board(num_of_players=2, rows=rows, columns=columns, narrator=NULL_SINK)
+    for position in range(10, board.win_position - 10, 97):
+        board.add_ladder(position, position + 53)
+    for position in range(50, board.win_position - 10, 89):
+        try:
+            board.add_snake(position, position - 41)
+        except BoardException:
+            continue
+    dice = Dice(narrator=NULL_SINK)
+
+    start = perf_counter()
+    analysis = MarkovAnalysis(board, dice)
+    expected_turns = analysis.expected_turns()
+    solved = perf_counter()
+    distribution = analysis.turn_distribution()
+    finished = perf_counter()
+    print(f'>>>> Board with {board.win_position} squares, {len(board.ladders)} ladders and {len(board.snakes)} snakes')
+    print(f'>>>> Expected turns {expected_turns:.2f} solved in {solved - start:.3f}s')
+    print(f'>>>> Turn distribution over {len(distribution)} turns computed in {finished - solved:.3f}s')
+
+
+if __name__ == '__main__':
+    check_against_played_games()
+    run()
@@ -0,0 +1,53 @@
+from time import perf_counter
+
+from benchmarks.board_setup import random_layout
+from components.board import Board
+from components.dice import Dice
+from components.multiplayer import MultiplayerGame
+from components.simulation import simulate
+from shared.narration import NULL_SINK
+
+
+def run(player_counts=(10, 100, 1000, 10000, 100000), rows=1000, columns=1000, num_of_entities=50000,
+        num_of_rounds=20, seed=0):
+    """
+    Measures the rounds per second of a game against its number of players, played in vectorized rounds and
+    player by player.
+
+    Parameters
+    ----------
+    player_counts: tuple
+        Numbers of players to measure
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes on the board
+    num_of_rounds: int
+        Number of rounds played, unless a player wins before
+    seed: int
+        Seed for the random number generator
+    """
+    ladders, snakes = random_layout(rows * columns, num_of_entities, seed)
+    dice = Dice(narrator=NULL_SINK)
+    for num_of_players in player_counts:
+        board = Board(num_of_players=num_of_players, rows=rows, columns=columns, narrator=NULL_SINK)
+        board.add_ladders(ladders)
+        board.add_snakes(snakes)
+
+        # A single game played player by player, the way the console game loops over the players, both ways are
+        # timed from the setup of the game
+        start = perf_counter()
+        played = simulate(board, dice, 1, seed, max_rounds=num_of_rounds)
+        in_order = int(played.rounds[0]) / (perf_counter() - start)
+        start = perf_counter()
+        game = MultiplayerGame(board, dice, seed=seed)
+        game.play(max_rounds=num_of_rounds)
+        vectorized = game.rounds / (perf_counter() - start)
+        print(f'>>>> {num_of_players:,} players: {vectorized:,.1f} rounds per second vectorized, '
+              f'{in_order:,.1f} player by player, speedup {vectorized / in_order:,.1f}x')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,74 @@
+from contextlib import redirect_stdout
+from os import devnull
+from time import perf_counter
+
+from components.board import Board
+from components.dice import Dice
+from shared.narration import ConsoleSink, NullSink, StructuredSink
+
+
+def play_games(narrator, num_games, num_of_players, seed):
+    """
+    Plays games narrated to a sink, following the turns of the console game without any console interaction.
+
+    Parameters
+    ----------
+    narrator: ConsoleSink, NullSink, StructuredSink
+        Sink of the narration of the games
+    num_games: int
+        Number of games to play
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the dice
+
+    Returns
+    -------
+    float
+        Time taken in seconds
+    """
+    dice = Dice(seed=seed, narrator=narrator)
+    start = perf_counter()
+    for _ in range(num_games):
+        board = Board(num_of_players=num_of_players, narrator=narrator)
+        board.default_setup()
+        winner = 0
+        while not winner:
+            for player in range(1, num_of_players + 1):
+                narrator.emit('turn', player=player)
+                while True:
+                    dice_roll = dice.roll()
+                    narrator.emit('roll', player=player, dice_roll=dice_roll)
+                    if not board.move_player(player, dice_roll) or not dice.got_one_more_roll(dice_roll):
+                        break
+                    narrator.emit('bonus_roll', player=player)
+                won = board.check_for_victory(player)
+                narrator.flush()
+                if won:
+                    winner = player
+                    break
+    return perf_counter() - start
+
+
+def run(num_games=2000, num_of_players=2, seed=0):
+    """
+    Compares the cost of the same games narrated to every sink.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to play
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the random number generator
+    """
+    sinks = {'console': ConsoleSink(), 'structured': StructuredSink(handler=lambda event: None), 'null': NullSink()}
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        timings = {name: play_games(narrator, num_games, num_of_players, seed) for name, narrator in sinks.items()}
+    for name, elapsed in timings.items():
+        print(f'>>>> {name} sink: {num_games:,} games in {elapsed:.3f}s, {elapsed / num_games * 1e6:,.0f}us per game')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,33 @@
+from os import cpu_count
+
+from components.optimizer import BoardOptimizer
+from shared.constants import DEFAULT_BOARD, DEFAULT_DICE
+
+
+def run(target_rounds=30, target_variance=300, steps=100, seed=0):
+    """
+    Searches a board for a target game length, reporting the evaluations per second with one and every core.
+
+    Parameters
+    ----------
+    target_rounds: float
+        Target expected number of rounds of a two player game
+    target_variance: float
+        Target variance of the number of rounds
+    steps: int
+        Number of annealing steps
+    seed: int
+        Seed for the random number generator
+    """
+    for workers in sorted({1, cpu_count()}):
+        optimizer = BoardOptimizer(DEFAULT_DICE, num_of_players=2, target_rounds=target_rounds,
+                                   target_variance=target_variance, seed=seed, workers=workers, proposals=4)
+        result = optimizer.optimize(DEFAULT_BOARD, steps=steps)
+        print(f'>>>> {workers} workers: {result.evaluations:,} boards evaluated in {result.seconds:.2f}s, '
+              f'{result.evaluations_per_second:,.0f} evaluations per second')
+    print(f'>>>> Best board: {result.mean_rounds:.2f} rounds expected with a variance of {result.variance:.1f}, '
+          f'score {result.score:.5f}')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,67 @@
+from random import Random
+from time import perf_counter
+
+from benchmarks.board_setup import random_layout
+from components.board import Board
+from components.dice import Dice
+from components.reachability import ReachabilityIndex
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+
+def run(rows=1000, columns=1000, num_of_entities=100000, num_of_additions=200, seed=0):
+    """
+    Measures building the reachability index of a large board, against repairing it as ladders and snakes are added.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes on the board
+    num_of_additions: int
+        Number of ladders and snakes added one by one after the index is built
+    seed: int
+        Seed for the random number generator
+    """
+    dice = Dice(narrator=NULL_SINK)
+    board = Board(num_of_players=1, narrator=NULL_SINK)
+    board.default_setup()
+    index = board.reachability(dice)
+    print(f'>>>> Default board: {index.min_turns[0]} turns at least to win, '
+          f'{len(index.dead_cells())} dead cells, {len(index.traps())} traps')
+
+    board = Board(num_of_players=1, rows=rows, columns=columns, narrator=NULL_SINK)
+    ladders, snakes = random_layout(rows * columns, num_of_entities, seed)
+    board.add_ladders(ladders)
+    board.add_snakes(snakes)
+    start = perf_counter()
+    index = board.reachability(dice)
+    built = perf_counter() - start
+    print(f'>>>> Index of {rows * columns:,} cells built in {built:.3f}s, '
+          f'{index.min_turns[0]} turns at least to win')
+
+    rng = Random(seed)
+    added = 0
+    start = perf_counter()
+    while added < num_of_additions:
+        first, second = rng.randint(2, board.win_position - 1), rng.randint(2, board.win_position - 1)
+        try:
+            if added % 2:
+                board.add_snake(max(first, second), min(first, second))
+            else:
+                board.add_ladder(min(first, second), max(first, second))
+        except BoardException:
+            continue
+        added += 1
+    repaired = (perf_counter() - start) / num_of_additions
+    print(f'>>>> Index repaired in {repaired * 1000:.2f}ms per added ladder or snake, '
+          f'{built / repaired:,.0f}x faster than building it again')
+    rebuilt = ReachabilityIndex(board, dice)
+    assert (rebuilt.min_turns == index.min_turns).all() and (rebuilt.reachable == index.reachable).all()
+
+
+if __name__ == '__main__':
+    run()
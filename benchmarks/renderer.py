@@ -0,0 +1,64 @@
+from io import StringIO
+from random import Random
+from time import perf_counter
+
+from benchmarks.board_setup import random_layout
+from components.board import Board
+from components.history import MoveHistory
+from components.renderer import BoardRenderer
+from shared.narration import NULL_SINK
+
+
+def run(rows=1000, columns=1000, num_of_entities=100000, num_of_players=4, num_of_turns=20000, seed=0):
+    """
+    Measures the frames per second of drawing a large board while it is played, against redrawing the whole board.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    num_of_entities: int
+        Number of ladders and of snakes on the board
+    num_of_players: int
+        Number of players on the board
+    num_of_turns: int
+        Number of turns played, a frame is drawn after every turn
+    seed: int
+        Seed for the random number generator
+    """
+    board = Board(num_of_players=num_of_players, rows=rows, columns=columns, narrator=NULL_SINK)
+    ladders, snakes = random_layout(rows * columns, num_of_entities, seed)
+    board.add_ladders(ladders)
+    board.add_snakes(snakes)
+    start = perf_counter()
+    renderer = BoardRenderer(board, viewport_rows=40, viewport_columns=20)
+    print(f'>>>> Coordinates of {rows * columns:,} cells computed in {perf_counter() - start:.3f}s')
+
+    start = perf_counter()
+    BoardRenderer(board, viewport_rows=rows, viewport_columns=columns).frame()
+    full_frame = perf_counter() - start
+    print(f'>>>> Redrawing the whole board: {1 / full_frame:.2f} frames per second')
+
+    for followed in ('the active player', 'player 1'):
+        rng = Random(seed)
+        board.history = MoveHistory(num_of_players)
+        terminal = StringIO()
+        timings = {'viewport': 0.0, 'changed cells': 0.0}
+        for turn in range(num_of_turns):
+            player = turn % num_of_players + 1
+            board.advance(player, rng.randint(1, 6))
+            renderer.follow(player if followed == 'the active player' else 1)
+            start = perf_counter()
+            renderer.frame()
+            timings['viewport'] += perf_counter() - start
+            start = perf_counter()
+            renderer.draw(terminal)
+            timings['changed cells'] += perf_counter() - start
+        print(f'>>>> Following {followed}: ' + ', '.join(f'redrawing the {name} at {num_of_turns / elapsed:,.0f} '
+                                                       f'frames per second' for name, elapsed in timings.items()))
+
+
+if __name__ == '__main__':
+    run()
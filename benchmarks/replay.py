@@ -0,0 +1,55 @@
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.archive import play_moves
+from components.archive import GameArchive
+from components.board import Board
+from components.dice import Dice
+from components.replay import GameReplay
+
+
+def run(num_games=20000, num_of_players=4, seed=0):
+    """
+    Measures replaying, seeking and auditing recorded games.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to audit
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the random number generator
+    """
+    board = Board(num_of_players=num_of_players)
+    board.default_setup()
+    dice = Dice()
+    rng = Random(seed)
+    games = [play_moves(board, dice, rng) for _ in range(num_games)]
+    replay = GameReplay(board, dice)
+
+    longest = max(games, key=lambda moves: len(moves[0]))
+    start = perf_counter()
+    replay.replay(longest[1].tolist())
+    replayed = perf_counter() - start
+    start = perf_counter()
+    for turn in range(100):
+        replay.seek(turn)
+    sought = (perf_counter() - start) / 100
+    print(f'>>>> Replayed a game of {len(longest[1])} rolls in {replayed * 1000:.3f}ms, '
+          f'seeking a turn takes {sought * 1000:.3f}ms')
+
+    with TemporaryDirectory() as directory:
+        archive = GameArchive(directory)
+        for players, dice_rolls, positions in games:
+            archive.append(players, dice_rolls, positions, num_of_players, board.win_position, dice.max_num)
+        start = perf_counter()
+        wrong_games = replay.audit(archive)
+        audited = perf_counter() - start
+        print(f'>>>> Audited {num_games:,} archived games with {len(archive.column("roll")):,} moves in '
+              f'{audited:.3f}s, {len(wrong_games)} games break the rules')
+
+
+if __name__ == '__main__':
+    run()
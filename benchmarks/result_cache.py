@@ -0,0 +1,55 @@
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from components.optimizer import BoardOptimizer
+from components.result_cache import ResultCache, analyse_board
+from shared.constants import DEFAULT_BOARD, DEFAULT_DICE
+
+
+def run(num_of_variants=200, num_of_queries=2000, memory_sizes=(16 * 1024 ** 2, 1024 ** 2), seed=0):
+    """
+    Measures answering analyses of board variants cold, from the memory tier and from the disk tier of the cache.
+
+    Parameters
+    ----------
+    num_of_variants: int
+        Number of variants of the default board asked for
+    num_of_queries: int
+        Number of analyses asked for once every variant was analysed
+    memory_sizes: tuple
+        Sizes of the memory tier to compare, in bytes
+    seed: int
+        Seed for the random number generator
+    """
+    optimizer = BoardOptimizer(DEFAULT_DICE, num_of_players=2, target_rounds=1, seed=seed, workers=1)
+    variants = [DEFAULT_BOARD]
+    while len(variants) < num_of_variants:
+        variants.append(optimizer.propose(variants[-1]))
+    for max_bytes in memory_sizes:
+        rng = Random(seed)
+        with TemporaryDirectory() as directory:
+            cache = ResultCache(max_bytes=max_bytes, directory=directory)
+            start = perf_counter()
+            for variant in variants:
+                analyse_board(variant, cache=cache)
+            cold = (perf_counter() - start) / num_of_variants
+            start = perf_counter()
+            for _ in range(num_of_queries):
+                analyse_board(rng.choice(variants), cache=cache)
+            warm = (perf_counter() - start) / num_of_queries
+            print(f'>>>> {max_bytes / 1024 ** 2:.0f}MB memory tier: cold queries {cold * 1000:.2f}ms, '
+                  f'warm queries {warm * 1000:.3f}ms, {cold / warm:,.0f}x faster')
+            print(f'>>>> {cache.hits} memory hits, {cache.disk_hits} disk hits, {cache.misses} misses, '
+                  f'{len(cache)} results in {cache.num_of_bytes / 1024 ** 2:.1f}MB of memory')
+
+            cache.clear()
+            start = perf_counter()
+            for variant in variants:
+                analyse_board(variant, cache=cache)
+            disk = (perf_counter() - start) / num_of_variants
+            print(f'>>>> Queries from the disk tier after a restart: {disk * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    run()
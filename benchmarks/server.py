@@ -0,0 +1,56 @@
+from asyncio import create_task, gather, run as run_loop
+from time import perf_counter
+
+from numpy import array, percentile
+
+from components.server import GameServer
+
+
+async def play_table(server, client, latencies, table):
+    """
+    Plays a table of the server until a player wins, timing every request.
+    """
+    outcome = {'winner': 0, 'next_player': table['next_player']}
+    while not outcome['winner']:
+        start = perf_counter()
+        outcome = await client.request({'action': 'roll', 'table': table['table'],
+                                        'player': outcome['next_player']})
+        latencies.append(perf_counter() - start)
+    server.handle({'action': 'close', 'table': table['table']})
+
+
+async def play_tables(num_tables):
+    """
+    Plays many tables at once through local clients of a single server.
+    """
+    server = GameServer()
+    client = server.connect()
+    tables = [server.handle({'action': 'create', 'num_of_players': 2, 'seed': seed}) for seed in range(num_tables)]
+    dispatcher = create_task(server.run())
+    latencies = []
+    start = perf_counter()
+    try:
+        await gather(*(play_table(server, client, latencies, table) for table in tables))
+    finally:
+        dispatcher.cancel()
+    return perf_counter() - start, array(latencies)
+
+
+def run(table_counts=(1000, 10000)):
+    """
+    Measures the latency of roll requests with many tables played at once on one server.
+
+    Parameters
+    ----------
+    table_counts: tuple
+        Numbers of concurrent tables to measure
+    """
+    for num_tables in table_counts:
+        elapsed, latencies = run_loop(play_tables(num_tables))
+        p50, p99 = percentile(latencies, [50, 99]) * 1000
+        print(f'>>>> {num_tables:,} tables played {len(latencies):,} rolls in {elapsed:.2f}s, '
+              f'{len(latencies) / elapsed:,.0f} rolls/s, latency p50 {p50:.3f}ms p99 {p99:.3f}ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+from time import perf_counter
+
+from components.board import Board
+from components.dice import Dice
+from components.simulation import simulate
+
+
+def run(num_games=20000, num_of_players=2, seed=0):
+    """
+    Measures the throughput of the headless simulation on the default board.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to simulate
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the simulation
+
+    Returns
+    -------
+    float
+        Simulated games per second
+    """
+    board = Board(num_of_players=num_of_players)
+    board.default_setup()
+    dice = Dice()
+    start = perf_counter()
+    result = simulate(board, dice, num_games, seed=seed)
+    elapsed = perf_counter() - start
+    games_per_second = num_games / elapsed
+    print(f'>>>> Simulated {num_games} games of {num_of_players} players in {elapsed:.3f}s '
+          f'- {games_per_second:,.0f} games per second')
+    print(f'>>>> Average of {result.rounds.mean():.2f} rounds and {result.rolls.mean():.2f} rolls per game')
+    return games_per_second
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,67 @@
+from statistics import median
+from subprocess import run as run_process
+from sys import executable, exit
+
+# Import time allowed for the game before the menu is shown, about three times the 8ms it measures
+IMPORT_BUDGET_MS = 25
+# Modules which must only be loaded once a game is set up, or statistics or analyses are asked for
+DEFERRED_MODULES = ('numpy', 'pandas', 'matplotlib', 'seaborn', 'scipy')
+
+
+def measure_import(module):
+    """
+    Measures the import of a module in a fresh interpreter with ``-X importtime``.
+
+    Parameters
+    ----------
+    module: str
+        Name of the module to import
+
+    Returns
+    -------
+    (float, set)
+        cumulative import time of the module in milliseconds and names of all the imported modules
+    """
+    process = run_process([executable, '-X', 'importtime', '-c', f'import {module}'],
+                          capture_output=True, text=True, check=True)
+    cumulative, imported = 0, set()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        imported.add(name.strip().split('.')[0])
+        if name.strip() == module:
+            cumulative = int(cumulative_us) / 1000
+    return cumulative, imported
+
+
+def run(module='app', repeat=5):
+    """
+    Checks the import time of the game against its budget.
+
+    Parameters
+    ----------
+    module: str
+        Name of the module to import
+    repeat: int
+        Number of fresh interpreters to measure, the median is checked
+
+    Returns
+    -------
+    bool
+        Whether the import stays within its budget without loading the deferred modules
+    """
+    timings, imported = [], set()
+    for _ in range(repeat):
+        cumulative, imported = measure_import(module)
+        timings.append(cumulative)
+    import_time = median(timings)
+    loaded = sorted(imported.intersection(DEFERRED_MODULES))
+    print(f'>>>> Importing {module} takes {import_time:.1f}ms, budget is {IMPORT_BUDGET_MS}ms')
+    if loaded:
+        print(f'>>>> Modules loaded at startup which should be deferred: {", ".join(loaded)}')
+    return import_time <= IMPORT_BUDGET_MS and not loaded
+
+
+if __name__ == '__main__':
+    exit(0 if run() else 1)
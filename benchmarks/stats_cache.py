@@ -0,0 +1,64 @@
+from contextlib import redirect_stdout
+from os import devnull, path as os_path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.archive import play_moves
+from components.archive import GameArchive
+from components.board import Board
+from components.dice import Dice
+from components.stats_cache import AnalyticsCache, ArchiveAnalytics
+from shared.constants import GAME_DATA_FILE
+
+
+def run(num_games=5000, num_new_games=50, num_of_players=4, seed=0):
+    """
+    Measures loading the analytics of a saved game cold and from the cache, and updating the aggregates of an
+    archive with new games against ingesting the whole archive again.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games in the archive
+    num_new_games: int
+        Number of games archived after the first update
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the random number generator
+    """
+    cache = AnalyticsCache()
+    start = perf_counter()
+    analytics = cache.load(GAME_DATA_FILE)
+    analytics.hit_counts()
+    cold = perf_counter() - start
+    start = perf_counter()
+    cache.load(GAME_DATA_FILE).hit_counts()
+    warm = perf_counter() - start
+    print(f'>>>> Analytics of {GAME_DATA_FILE}: {cold * 1000:.2f}ms cold, {warm * 1000:.3f}ms from the cache')
+
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        board = Board(num_of_players=num_of_players)
+        board.default_setup()
+        dice = Dice()
+    rng = Random(seed)
+    with TemporaryDirectory() as directory:
+        archive = GameArchive(os_path.join(directory, 'archive'))
+        for _ in range(num_games):
+            archive.append(*play_moves(board, dice, rng), num_of_players, board.win_position, dice.max_num)
+        aggregates = ArchiveAnalytics(GameArchive(archive.directory))
+        start = perf_counter()
+        aggregates.update()
+        full = perf_counter() - start
+        for _ in range(num_new_games):
+            archive.append(*play_moves(board, dice, rng), num_of_players, board.win_position, dice.max_num)
+        start = perf_counter()
+        aggregates.update()
+        incremental = perf_counter() - start
+    print(f'>>>> Ingesting {num_games:,} archived games took {full:.3f}s, '
+          f'{num_new_games} new games {incremental * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    run()
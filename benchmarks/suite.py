@@ -0,0 +1,327 @@
+from argparse import ArgumentParser
+from contextlib import contextmanager, redirect_stdout
+from gc import collect
+from itertools import product
+from json import dump, load
+from os import chdir, devnull, getcwd, makedirs, path as os_path
+from random import Random
+from statistics import median
+from sys import exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start as start_tracing, stop as stop_tracing, take_snapshot
+
+import builtins
+
+from benchmarks.board_setup import random_layout
+from components.board import Board
+from components.dice import Dice
+from components.game import Game
+from shared.narration import CONSOLE, NULL_SINK
+
+BASELINE_FILE = os_path.join(os_path.dirname(__file__), 'baseline.json')
+# Slowdown against the baseline, in percent, above which a run fails, widened by the noise of both measures
+REGRESSION_THRESHOLD = 25
+NOISE_FACTOR = 3
+# Shortest time a timed sample lasts, a case too quick for it is run several times per sample
+MIN_SAMPLE_SECONDS = 0.1
+
+
+class ScriptedInput:
+    def __init__(self, answers, default=None):
+        """
+        Answers the prompts of the console with a script while in use, so interactive code runs unchanged.
+
+        Parameters
+        ----------
+        answers: list
+            Answers given to the prompts in order
+        default: str
+            Answer given once the script is over, default value raises EOFError like a closed console
+        """
+        self.answers = iter(answers)
+        self.default = default
+        self.num_of_prompts = 0
+        self.__console_input = None
+
+    def __call__(self, prompt=''):
+        self.num_of_prompts += 1
+        answer = next(self.answers, self.default)
+        if answer is None:
+            raise EOFError(f'No scripted answer left for the prompt {prompt!r}')
+        return answer
+
+    def __enter__(self):
+        self.__console_input = builtins.input
+        builtins.input = self
+        return self
+
+    def __exit__(self, *exc_info):
+        builtins.input = self.__console_input
+
+
+@contextmanager
+def isolated_run():
+    """
+    Runs the code within it in an empty working directory with a data folder, printing nothing, so the files saved
+    by the game are thrown away.
+    """
+    working_directory = getcwd()
+    with TemporaryDirectory() as directory, open(devnull, 'w') as sink, redirect_stdout(sink):
+        makedirs(os_path.join(directory, 'data'))
+        chdir(directory)
+        try:
+            yield directory
+        finally:
+            chdir(working_directory)
+
+
+def played_board(rows, columns, players, rolls, seed):
+    """
+    Board with a random layout and a history of random moves, without any console interaction.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows on the board
+    columns: int
+        Number of columns on the board
+    players: int
+        Number of players
+    rolls: int
+        Number of dice rolls of every player
+    seed: int
+        Seed for the random number generator
+
+    Returns
+    -------
+    Board
+    """
+    board = Board(num_of_players=players, rows=rows, columns=columns, narrator=NULL_SINK)
+    ladders, snakes = random_layout(board.win_position, board.win_position // 20, seed)
+    board.add_ladders(ladders)
+    board.add_snakes(snakes)
+    rng = Random(seed)
+    for _ in range(rolls):
+        for player in range(1, players + 1):
+            dice_roll = rng.randint(1, 6)
+            board.history.record_roll(player, dice_roll)
+            board.history.record_position(player, rng.randint(1, board.win_position))
+    return board
+
+
+def move_player(rows, columns, players, moves, seed=0):
+    """
+    ``Board.move_player`` on a board with a random layout.
+    """
+    board = played_board(rows, columns, players, 0, seed)
+    rng = Random(seed)
+    script = [(rng.randint(1, players), rng.randint(1, 6)) for _ in range(moves)]
+
+    def run():
+        for player, dice_roll in script:
+            board.move_player(player, dice_roll)
+    return run
+
+
+def manual_setup(rows, columns, entities, seed=0):
+    """
+    ``Board.manual_setup`` answered by a script, validating every ladder and snake with ``add_ladder`` and
+    ``add_snake``.
+    """
+    board = Board(num_of_players=2, rows=rows, columns=columns, narrator=CONSOLE)
+    ladders, snakes = random_layout(board.win_position, entities, seed)
+    answers = [str(len(ladders)), *(f'{bottom},{top}' for bottom, top in ladders),
+               str(len(snakes)), *(f'{mouth},{tail}' for mouth, tail in snakes)]
+
+    def run():
+        with ScriptedInput(answers):
+            board.manual_setup()
+    return run
+
+
+def save_the_play(players, rolls, seed=0):
+    """
+    ``Board.save_the_play`` of a game with a number of rolls for every player.
+    """
+    # pandas is loaded by the first save, so a small game is saved first, out of the measure
+    played_board(10, 10, players, 1, seed).save_the_play()
+    board = played_board(10, 10, players, rolls, seed)
+    return board.save_the_play
+
+
+def pretty_print(players, rolls, seed=0):
+    """
+    ``GameStats.pretty_print`` of a game with a number of rolls for every player.
+    """
+    from components.stats import GameStats
+
+    board = played_board(10, 10, players, rolls, seed)
+    return GameStats(history=board.history, win_position=board.win_position).pretty_print
+
+
+def console_game(players, seed=0):
+    """
+    A whole console game on the default board, from the first prompt to the saved play, answered by a script.
+    """
+    game = Game()
+
+    def run():
+        with ScriptedInput([str(players)], default=''):
+            game.set_num_of_players()
+            game.set_board()
+            game.dice = Dice(seed=seed, narrator=game.narrator)
+            game.play()
+    return run
+
+
+# Every case is measured for every combination of its parameters
+CASES = {
+    'move_player': (move_player, {'rows, columns': [(10, 10), (100, 100), (1000, 1000)], 'players': [2, 1000],
+                                  'moves': [20000]}),
+    'manual_setup': (manual_setup, {'rows, columns, entities': [(10, 10, 5), (100, 100, 500),
+                                                                (1000, 1000, 5000)]}),
+    'save_the_play': (save_the_play, {'players, rolls': [(2, 100), (2, 10000), (1000, 100)]}),
+    'pretty_print': (pretty_print, {'players, rolls': [(2, 100), (2, 10000), (100, 100)]}),
+    'console_game': (console_game, {'players': [2, 10, 1000]}),
+}
+
+
+def parameter_grid(parameters):
+    """
+    Combinations of the parameters of a case.
+
+    Parameters
+    ----------
+    parameters: dict
+        Values of the parameters keyed by name, names joined by commas take tuples of values together
+
+    Yields
+    ------
+    dict
+    """
+    names = [[name.strip() for name in key.split(',')] for key in parameters]
+    for values in product(*parameters.values()):
+        combination = {}
+        for group, value in zip(names, values):
+            combination.update(zip(group, value if len(group) > 1 else (value,)))
+        yield combination
+
+
+def measure(case, parameters, repeat):
+    """
+    Measures a case, each run set up anew and isolated.
+
+    A timed sample sets the case up and runs it until the runs last at least ``MIN_SAMPLE_SECONDS`` in total, so
+    quick cases are not measured at the resolution of the timer and the scheduler. The time of a sample is the
+    mean time of its runs, set ups left out.
+
+    Parameters
+    ----------
+    case: callable
+        Sets a case up with its parameters and returns the code to measure
+    parameters: dict
+        Parameters of the case
+    repeat: int
+        Number of timed samples, their median is kept
+
+    Returns
+    -------
+    dict
+        Wall time in seconds, its noise as the median absolute deviation of the samples in percent of the median,
+        peak traced memory in bytes and number of memory blocks the run allocated and still held when it returned
+    """
+    samples = []
+    for _ in range(repeat):
+        with isolated_run():
+            elapsed, runs = 0.0, 0
+            collect()
+            while elapsed < MIN_SAMPLE_SECONDS:
+                run = case(**parameters)
+                start = perf_counter()
+                run()
+                elapsed += perf_counter() - start
+                runs += 1
+            samples.append(elapsed / runs)
+    seconds = median(samples)
+    noise = median(abs(sample - seconds) for sample in samples) / seconds * 100
+    # Memory is measured apart, tracing slows the run down
+    with isolated_run():
+        run = case(**parameters)
+        collect()
+        start_tracing()
+        try:
+            run()
+            peak = get_traced_memory()[1]
+            # Only the blocks allocated since tracing started are traced, the ones freed during the run are gone
+            snapshot = take_snapshot()
+        finally:
+            stop_tracing()
+    allocations = sum(statistic.count for statistic in snapshot.statistics('filename'))
+    return {'seconds': seconds, 'noise': noise, 'peak_bytes': peak, 'allocated_blocks': allocations}
+
+
+def run(baseline_file=BASELINE_FILE, threshold=REGRESSION_THRESHOLD, save=False, only=None, repeat=11):
+    """
+    Runs every case of the suite and compares the wall times with the baseline.
+
+    Parameters
+    ----------
+    baseline_file: str
+        JSON file of the baseline results
+    threshold: float
+        Slowdown against the baseline, in percent, above which a case fails, widened by ``NOISE_FACTOR`` times the
+        noise of the baseline and of the run
+    save: bool
+        Whether the results are saved as the new baseline, merged with the cases not run
+    only: list
+        Names of the cases to run, default value runs all of them
+    repeat: int
+        Number of timed samples of every case
+
+    Returns
+    -------
+    bool
+        Whether no case is slower than its baseline beyond the threshold
+    """
+    baseline = {}
+    if os_path.exists(baseline_file):
+        with open(baseline_file) as file:
+            baseline = load(file)
+    results, regressions = {}, []
+    for name, (case, parameters) in CASES.items():
+        if only and name not in only:
+            continue
+        for combination in parameter_grid(parameters):
+            case_id = f"{name}[{','.join(f'{key}={value}' for key, value in combination.items())}]"
+            result = measure(case, combination, repeat)
+            results[case_id] = result
+            line = (f'>>>> {case_id}: {result["seconds"] * 1000:,.3f}ms, {result["noise"]:.1f}% noise, '
+                    f'{result["peak_bytes"] / 1024 ** 2:,.2f}MB peak, {result["allocated_blocks"]:,} blocks allocated')
+            if case_id in baseline:
+                change = (result['seconds'] / baseline[case_id]['seconds'] - 1) * 100
+                allowed = threshold + NOISE_FACTOR * (baseline[case_id].get('noise', 0) + result['noise'])
+                line += f', {change:+.1f}% against the baseline ({allowed:.0f}% allowed)'
+                if change > allowed:
+                    regressions.append(case_id)
+                    line += ' - REGRESSION'
+            print(line)
+    if save:
+        with open(baseline_file, 'w') as file:
+            dump({**baseline, **results}, file, indent=2, sort_keys=True)
+        print(f'>>>> Baseline saved to {baseline_file}')
+    if regressions:
+        print(f'>>>> {len(regressions)} cases slower than the baseline by more than {threshold}% and their noise')
+    return not regressions
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Benchmark suite of the hot paths, checked against a JSON baseline.')
+    parser.add_argument('cases', nargs='*', help=f'cases to run, among {", ".join(CASES)}')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='JSON file of the baseline results')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='slowdown in percent above which a case fails, before adding the noise')
+    parser.add_argument('--save', action='store_true', help='save the results as the new baseline')
+    parser.add_argument('--repeat', type=int, default=11, help='number of timed samples of every case')
+    arguments = parser.parse_args()
+    exit(0 if run(arguments.baseline, arguments.threshold, arguments.save, arguments.cases, arguments.repeat) else 1)
@@ -0,0 +1,35 @@
+from os import cpu_count
+from time import perf_counter
+
+from components.tournament import run_tournament
+from shared.constants import DEFAULT_BOARD, DEFAULT_DICE
+
+
+def run(num_games=400000, num_of_players=2, seed=0):
+    """
+    Measures how a tournament scales with the number of worker processes.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to play
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed of the tournament
+    """
+    results = {}
+    for workers in sorted({1, 2, 4, cpu_count()}):
+        start = perf_counter()
+        stats = run_tournament(DEFAULT_BOARD, DEFAULT_DICE, num_games, num_of_players=num_of_players, seed=seed,
+                               workers=workers)
+        elapsed = perf_counter() - start
+        results[workers] = (stats.win_counts.tolist(), stats.round_counts.tolist(), stats.num_of_rolls)
+        print(f'>>>> {workers} workers: {num_games / elapsed:,.0f} games per second, '
+              f'{stats.mean_rounds():.3f} rounds per game')
+    identical = len(set(map(repr, results.values()))) == 1
+    print(f'>>>> Results are {"identical" if identical else "DIFFERENT"} for every number of workers')
+
+
+if __name__ == '__main__':
+    run()
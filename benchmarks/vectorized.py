@@ -0,0 +1,96 @@
+from time import perf_counter
+
+from numpy import array, int32
+
+from components.board import Board
+from components.dice import Dice
+from components.simulation import SimulationResult, simulate_batch
+from shared.narration import NULL_SINK
+
+
+def play_with_move_player(board, dice, num_games):
+    """
+    Plays games through ``Board.move_player`` and ``Board.check_for_victory``, the way the console game does,
+    without waiting for inputs or narrating the games. The history of the board is cleared between the games.
+
+    Parameters
+    ----------
+    board: Board
+        Board to play on, its number of players is used for every game
+    dice: Dice
+        Dice to play with
+    num_games: int
+        Number of games to play
+
+    Returns
+    -------
+    SimulationResult
+    """
+    num_of_players = board.num_of_players
+    winners, rounds, rolls = [], [], []
+    for _ in range(num_games):
+        board.history.clear()
+        winner, num_of_rounds, num_of_rolls = None, 0, 0
+        while winner is None:
+            num_of_rounds += 1
+            for player in range(1, num_of_players + 1):
+                while True:
+                    dice_roll = dice.roll()
+                    num_of_rolls += 1
+                    player_moved = board.move_player(player, dice_roll)
+                    if not dice.got_one_more_roll(dice_roll) or not player_moved:
+                        break
+                if board.check_for_victory(player):
+                    winner = player
+                    break
+        winners.append(winner)
+        rounds.append(num_of_rounds)
+        rolls.append(num_of_rolls)
+    return SimulationResult(winners=array(winners, dtype=int32), rounds=array(rounds, dtype=int32),
+                            rolls=array(rolls, dtype=int32))
+
+
+def run(num_games=200000, baseline_games=200, num_of_players=2, seed=0):
+    """
+    Compares the lockstep NumPy simulation against playing through ``Board.move_player`` in a loop.
+
+    Parameters
+    ----------
+    num_games: int
+        Number of games to simulate with NumPy
+    baseline_games: int
+        Number of games to play through ``Board.move_player``
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed for the simulation
+
+    Returns
+    -------
+    float
+        Speedup in dice rolls per second
+    """
+    board = Board(num_of_players=num_of_players, narrator=NULL_SINK)
+    board.default_setup()
+    dice = Dice(narrator=NULL_SINK)
+
+    start = perf_counter()
+    baseline_rolls = int(play_with_move_player(board, dice, baseline_games).rolls.sum())
+    baseline_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    result = simulate_batch(board, dice, num_games, seed=seed)
+    elapsed = perf_counter() - start
+
+    baseline_rate = baseline_rolls / baseline_elapsed
+    rate = int(result.rolls.sum()) / elapsed
+    print(f'>>>> Board.move_player loop: {baseline_games / baseline_elapsed:,.0f} games per second, '
+          f'{baseline_rate:,.0f} rolls per second')
+    print(f'>>>> NumPy lockstep simulation: {num_games / elapsed:,.0f} games per second, '
+          f'{rate:,.0f} rolls per second')
+    print(f'>>>> Speedup: {rate / baseline_rate:,.1f}x')
+    return rate / baseline_rate
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,194 @@
+from numpy import arange, array, concatenate, cumsum, minimum, ones, repeat, sort, tile, zeros
+from scipy.sparse import csr_matrix, identity
+from scipy.sparse.csgraph import breadth_first_order
+from scipy.sparse.linalg import bicgstab, LinearOperator, spilu
+
+from shared.exception import BoardException
+
+
+class MarkovAnalysis:
+    def __init__(self, board, dice, tolerance=1e-12):
+        """
+        Exact analysis of a board as an absorbing Markov chain, without playing any game.
+
+        The chain follows the rules of the console game: a roll moving a player out of the board ends the turn
+        and keeps the player in place, ladders and snakes are followed from the landing position, and rolling
+        the maximum number on the dice rewards one more roll within the same turn.
+
+        Parameters
+        ----------
+        board: Board
+            Board to analyse
+        dice: Dice
+            Dice to play with
+        tolerance: float
+            Probability mass below which the remaining turns are ignored
+        """
+        self.win_position = board.win_position
+        self.tolerance = tolerance
+        self.__turn_distribution = None
+
+        num_of_states = self.win_position + 1
+        faces = arange(dice.min_num, dice.max_num + 1)
+        probability = 1 / len(faces)
+        positions = repeat(arange(self.win_position), len(faces))
+        dice_rolls = tile(faces, self.win_position)
+        updated_positions = positions + dice_rolls
+        moved = updated_positions <= self.win_position
+        new_positions = positions.copy()
+        new_positions[moved] = board.jump_table()[minimum(updated_positions, self.win_position)][moved]
+        turn_over = ~moved | (dice_rolls != dice.max_num)
+
+        # Transposed per-roll transition matrices, a turn ends on a roll without a bonus or moving out of the board.
+        # A bonus roll reaching the win position is followed by a roll moving out of the board, so it ends the turn.
+        bonus = ~turn_over & (new_positions != self.win_position)
+        ending_rolls = self.__matrix(new_positions[~bonus], positions[~bonus], probability, num_of_states)
+        bonus_rolls = self.__matrix(new_positions[bonus], positions[bonus], probability, num_of_states)
+
+        # Per-turn transition matrix, summing over every chain of bonus rolls followed by a roll ending the turn
+        turns = ending_rolls + self.__matrix([self.win_position], [self.win_position], 1, num_of_states)
+        chains = bonus_rolls
+        while chains.nnz and chains.max() > tolerance:
+            turns = turns + ending_rolls @ chains
+            chains = bonus_rolls @ chains
+        self.__turns = turns.tocsr()
+
+    @staticmethod
+    def __matrix(rows, columns, probability, size):
+        return csr_matrix((ones(len(rows)) * probability, (rows, columns)), shape=(size, size))
+
+    def play_a_turn(self, distribution):
+        """
+        Advances a distribution over positions by one turn of a player.
+
+        Parameters
+        ----------
+        distribution: numpy.ndarray
+            Probability of being at every position from 0 to the win position at the start of the turn
+
+        Returns
+        -------
+        numpy.ndarray
+            Probability of being at every position at the end of the turn
+        """
+        return self.__turns @ distribution
+
+    def expected_turns(self, position=0, rtol=1e-10):
+        """
+        Computes the expected number of turns a single player needs to win.
+
+        The linear system of the absorbing chain is solved iteratively with BiCGSTAB, preconditioned with an
+        incomplete LU factorization, a direct solver fills the sparse matrix in and gets slow on large boards.
+
+        Parameters
+        ----------
+        position: int
+            Position of the player at the start of the turn, default value is the start of the board
+        rtol: float
+            Relative tolerance of the residual of the linear system
+
+        Returns
+        -------
+        float
+        """
+        if self.win_position == position:
+            return 0.0
+        # Only the positions a player can stand on from the given one are solved for, the others may be dead ends
+        # like the landing positions of snakes near the end of the board, which would make the system singular
+        states = breadth_first_order(self.__turns.T.tocsr(), position, return_predecessors=False)
+        states = sort(states[states != self.win_position])
+        transient_turns = self.__turns[states][:, states].T
+        system = identity(len(states), format='csc') - transient_turns.tocsc()
+        try:
+            preconditioner = spilu(system, drop_tol=1e-5, fill_factor=10)
+            expected, info = bicgstab(system.tocsr(), ones(len(states)), rtol=rtol, atol=0.0,
+                                      M=LinearOperator(system.shape, preconditioner.solve))
+        except RuntimeError:
+            # A singular system, a player can get stuck away from the win position
+            info = -1
+        if info != 0:
+            raise BoardException('The expected number of turns does not converge, a player may never win on '
+                                 'this board')
+        return float(expected[states.searchsorted(position)])
+
+    def turn_distribution(self, max_turns=1000000):
+        """
+        Computes the distribution of the number of turns a single player needs to win.
+
+        Parameters
+        ----------
+        max_turns: int
+            Number of turns after which the distribution is truncated
+
+        Returns
+        -------
+        numpy.ndarray
+            Probability of winning in exactly t turns, indexed by t
+        """
+        if self.__turn_distribution is None:
+            distribution = zeros(self.win_position + 1)
+            distribution[0] = 1
+            won = [distribution[self.win_position]]
+            while distribution[:self.win_position].sum() > self.tolerance and len(won) <= max_turns:
+                distribution = self.play_a_turn(distribution)
+                won.append(distribution[self.win_position])
+            won = minimum(array(won), 1)
+            self.__turn_distribution = concatenate([won[:1], won[1:] - won[:-1]])
+        return self.__turn_distribution
+
+    def round_distribution(self, num_of_players):
+        """
+        Computes the distribution of the number of rounds a game lasts.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players in the game
+
+        Returns
+        -------
+        numpy.ndarray
+            Probability of the game ending in exactly t rounds, indexed by t
+        """
+        not_finished = self.__not_won(num_of_players)
+        return concatenate([1 - not_finished[:1], not_finished[:-1] - not_finished[1:]])
+
+    def expected_rounds(self, num_of_players):
+        """
+        Computes the expected number of rounds a game lasts.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players in the game
+
+        Returns
+        -------
+        float
+        """
+        return float(self.__not_won(num_of_players).sum())
+
+    def win_probabilities(self, num_of_players):
+        """
+        Computes the probability of winning the game for every player seat.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players in the game
+
+        Returns
+        -------
+        numpy.ndarray
+            Probability of winning indexed by the player seat, starting from the first player at index 0
+        """
+        turns = self.turn_distribution()
+        not_won = 1 - cumsum(turns)
+        not_won_before = concatenate([[1.0], not_won[:-1]])
+        return concatenate([
+            [(turns * not_won ** (seat - 1) * not_won_before ** (num_of_players - seat)).sum()]
+            for seat in range(1, num_of_players + 1)
+        ])
+
+    def __not_won(self, num_of_players):
+        return (1 - cumsum(self.turn_distribution())) ** num_of_players
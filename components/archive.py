@@ -0,0 +1,216 @@
+from os import makedirs, path as os_path
+
+from numpy import bincount, concatenate, dtype, int32, memmap, zeros
+
+from .history import MoveHistory
+from .recorder import GameRecordReader, RECORD_DTYPE
+
+# Every column of the archive is a flat file of little endian int32, one value per dice roll of every game
+ARCHIVE_COLUMNS = ('player', 'roll', 'position')
+ARCHIVE_INDEX_DTYPE = dtype([('offset', '<i8'), ('length', '<i8'), ('num_of_players', '<i4'),
+                             ('win_position', '<i4'), ('max_num', '<i4'), ('winner', '<i4'), ('rounds', '<i4')])
+
+
+class GameArchive:
+    def __init__(self, directory):
+        """
+        Archive of many games, stored as memory mapped columns of moves with an index of the games.
+
+        Parameters
+        ----------
+        directory: str
+            Directory of the archive, created if it does not exist
+        """
+        self.directory = directory
+        makedirs(directory, exist_ok=True)
+        self.__index = None
+        self.__columns = None
+
+    def refresh(self):
+        """
+        Maps the archive again, to see the games appended by another archive object or process.
+        """
+        self.__index = self.__columns = None
+
+    def __file(self, name):
+        return os_path.join(self.directory, f'{name}.bin')
+
+    @property
+    def index(self):
+        """
+        Index of the archived games, with the offset and number of moves of every game in the columns.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        if self.__index is None:
+            self.__index = self.__map('index', ARCHIVE_INDEX_DTYPE)
+        return self.__index
+
+    def column(self, name):
+        """
+        Memory mapped column of all the archived moves.
+
+        Parameters
+        ----------
+        name: str
+            Name of the column, one of player, roll and position
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        if self.__columns is None:
+            num_of_moves = int(self.index['offset'][-1] + self.index['length'][-1]) if len(self) else 0
+            self.__columns = {column: self.__map(column, dtype('<i4'))[:num_of_moves] for column in ARCHIVE_COLUMNS}
+        return self.__columns[name]
+
+    def __map(self, name, data_type):
+        file = self.__file(name)
+        if not os_path.exists(file) or os_path.getsize(file) < data_type.itemsize:
+            return zeros(0, dtype=data_type)
+        return memmap(file, dtype=data_type, mode='r', shape=(os_path.getsize(file) // data_type.itemsize,))
+
+    def __len__(self):
+        return len(self.index)
+
+    def append(self, players, dice_rolls, positions, num_of_players, win_position, max_num):
+        """
+        Appends a game to the archive.
+
+        The moves are written before the index, so an interrupted append leaves the archive unchanged.
+
+        Parameters
+        ----------
+        players: numpy.ndarray
+            Player id of every move
+        dice_rolls: numpy.ndarray
+            Number got on the dice in every move
+        positions: numpy.ndarray
+            New position of the player after every move, negative when the roll moved the player out of the board
+        num_of_players: int
+            Number of players in the game
+        win_position: int
+            Win position of the board
+        max_num: int
+            Maximum number on the dice, rewarding one more dice roll
+        """
+        offset = int(self.index['offset'][-1] + self.index['length'][-1]) if len(self) else 0
+        entry = zeros(1, dtype=ARCHIVE_INDEX_DTYPE)
+        entry['offset'] = offset
+        entry['length'] = len(players)
+        entry['num_of_players'] = num_of_players
+        entry['win_position'] = win_position
+        entry['max_num'] = max_num
+        if len(players):
+            turns = int((players[1:] != players[:-1]).sum()) + 1
+            entry['rounds'] = -(-turns // num_of_players)
+            if positions[-1] == win_position or (len(positions) > 1 and positions[-2] == win_position):
+                entry['winner'] = players[-1]
+        self.__index = self.__columns = None
+        for name, values in zip(ARCHIVE_COLUMNS, (players, dice_rolls, positions)):
+            with open(self.__file(name), 'ab') as file:
+                # Moves left over by an interrupted append are overwritten
+                file.truncate(offset * 4)
+                file.write(values.astype('<i4').tobytes())
+        with open(self.__file('index'), 'ab') as file:
+            file.truncate(len(self.index) * ARCHIVE_INDEX_DTYPE.itemsize)
+            file.write(entry.tobytes())
+        self.__index = None
+
+    def append_record(self, record_path):
+        """
+        Appends a game saved in a record file to the archive.
+
+        Parameters
+        ----------
+        record_path: str
+            Path of the record file written by a GameRecorder
+        """
+        reader = GameRecordReader(record_path)
+        moves = concatenate([zeros(0, dtype=RECORD_DTYPE), *reader.batches()])
+        self.append(moves['player'], moves['roll'], moves['position'], reader.num_of_players, reader.win_position,
+                    reader.max_num)
+
+    def moves(self, start, stop=None):
+        """
+        Moves of a range of games, as views on the memory mapped columns.
+
+        Parameters
+        ----------
+        start: int
+            Id of the first game
+        stop: int
+            Id after the last game, default value is the game after the first one
+
+        Returns
+        -------
+        dict
+            Column name to the moves of the games in the range
+        """
+        games = self.index[start:start + 1 if stop is None else stop]
+        if not len(games):
+            return {name: self.column(name)[:0] for name in ARCHIVE_COLUMNS}
+        first, last = int(games['offset'][0]), int(games['offset'][-1] + games['length'][-1])
+        return {name: self.column(name)[first:last] for name in ARCHIVE_COLUMNS}
+
+    def history(self, game_id):
+        """
+        Loads an archived game in a move history.
+
+        Parameters
+        ----------
+        game_id: int
+            Id of the game, in the order the games were archived
+
+        Returns
+        -------
+        MoveHistory
+        """
+        moves = self.moves(game_id)
+        history = MoveHistory(num_of_players=int(self.index['num_of_players'][game_id]))
+        history.extend(moves['player'], moves['roll'], moves['position'])
+        return history
+
+    def mean_rounds(self):
+        """
+        Average number of rounds of the archived games.
+
+        Returns
+        -------
+        float
+        """
+        return float(self.index['rounds'].mean()) if len(self) else 0.0
+
+    def mean_rolls(self):
+        """
+        Average number of dice rolls of the archived games.
+
+        Returns
+        -------
+        float
+        """
+        return float(self.index['length'].mean()) if len(self) else 0.0
+
+    def roll_histogram(self):
+        """
+        Counts the occurrences of every number on the dice over all the archived games.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of occurrences indexed by the number on the dice
+        """
+        return bincount(self.column('roll'))
+
+    def win_counts(self):
+        """
+        Counts the games won by every player seat over all the archived games.
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of won games indexed by player id, index 0 counts the games without a winner
+        """
+        return bincount(self.index['winner'].astype(int32))
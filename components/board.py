@@ -1,17 +1,61 @@
+from collections.abc import Mapping
 from json import dump
 
-from numpy import append, array
-from pandas import concat, DataFrame
+from numpy import arange, array, clip, count_nonzero, int8, int32, logical_or, minimum, nonzero, unique, zeros
 
+from .history import MoveHistory
 from .ladder import Ladder
+from .reachability import ReachabilityIndex
 from .snake import Snake
 from shared.exception import BoardException
+from shared.narration import CONSOLE
 from shared.utils import enter_a_valid_number
-from shared.constants import DEFAULT_BOARD, GAME_DATA_FILE
+from shared.constants import DEFAULT_BOARD, DEFAULT_DICE, GAME_DATA_FILE
+
+# Flags of the occupancy index, telling which ends of ladders and snakes are on a position
+LADDER_BOTTOM = 1
+LADDER_TOP = 2
+SNAKE_MOUTH = 4
+SNAKE_TAIL = 8
+
+
+class BoardEntities(Mapping):
+    def __init__(self, board, flag, entity):
+        """
+        Read only mapping of the ladders or snakes of a board, keyed by their starting position.
+
+        The entities are not stored, they are built on access from the jump table and occupancy index of the board.
+
+        Parameters
+        ----------
+        board: Board
+            Board of the entities
+        flag: int
+            Occupancy flag of the starting position of the entities
+        entity: type
+            Class of the entities, either Ladder or Snake
+        """
+        self.board = board
+        self.flag = flag
+        self.entity = entity
+
+    def __contains__(self, position):
+        return 0 <= position <= self.board.win_position and bool(self.board.occupancy[position] & self.flag)
+
+    def __getitem__(self, position):
+        if position not in self:
+            raise KeyError(position)
+        return self.entity(position, int(self.board.jumps[position]))
+
+    def __iter__(self):
+        return iter(nonzero(self.board.occupancy & self.flag)[0].tolist())
+
+    def __len__(self):
+        return int(count_nonzero(self.board.occupancy & self.flag))
 
 
 class Board:
-    def __init__(self, num_of_players, rows=10, columns=10):
+    def __init__(self, num_of_players, rows=10, columns=10, narrator=None):
         """
         Initializes a game board.
 
@@ -23,14 +67,55 @@ class Board:
             Number of rows on the board, default value is 10 rows
         columns: int
             Number of columns on the board, default value is 10 columns
+        narrator: ConsoleSink, NullSink, StructuredSink
+            Sink of the narration of the game, default value narrates on the console
         """
         self.rows = rows
         self.columns = columns
         self.win_position = self.rows * self.columns
-        self.ladders = {}
-        self.snakes = {}
-        self.player_positions = {f'Player {player}': array([0], dtype=int) for player in range(1, num_of_players + 1)}
-        self.player_dice_rolls = {f'Player {player}': array([], dtype=int) for player in range(1, num_of_players + 1)}
+        self.num_of_players = num_of_players
+        self.occupancy = zeros(self.win_position + 1, dtype=int8)
+        # Final position on the board indexed by the landing position, the only storage of ladders and snakes
+        self.jumps = arange(self.win_position + 1, dtype=int32)
+        self.ladders = BoardEntities(self, LADDER_BOTTOM, Ladder)
+        self.snakes = BoardEntities(self, SNAKE_MOUTH, Snake)
+        self.history = MoveHistory(num_of_players=num_of_players)
+        self.recorder = None
+        self.__indexes = {}
+        self.narrator = CONSOLE if narrator is None else narrator
+
+    @property
+    def player_positions(self):
+        """
+        Positions of every player throughout the game, keyed by player name.
+
+        Returns
+        -------
+        dict
+        """
+        return {f'Player {player}': self.history.positions(player) for player in range(1, self.num_of_players + 1)}
+
+    @property
+    def current_positions(self):
+        """
+        Current position of every player, indexed by player id minus one.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.history.current_positions()
+
+    @property
+    def player_dice_rolls(self):
+        """
+        Dice rolls of every player throughout the game, keyed by player name.
+
+        Returns
+        -------
+        dict
+        """
+        return {f'Player {player}': self.history.rolls(player) for player in range(1, self.num_of_players + 1)}
 
     def add_ladder(self, bottom, top):
         """
@@ -45,7 +130,10 @@ class Board:
         """
         ladder = Ladder(bottom=bottom, top=top)
         if self.__is_valid_ladder(ladder):
-            self.ladders[bottom] = ladder
+            self.jumps[bottom] = top
+            self.occupancy[bottom] |= LADDER_BOTTOM
+            self.occupancy[top] |= LADDER_TOP
+            self.__update_indexes([bottom])
 
     def add_snake(self, mouth, tail):
         """
@@ -60,7 +148,162 @@ class Board:
         """
         snake = Snake(mouth=mouth, tail=tail)
         if self.__is_valid_snake(snake):
-            self.snakes[mouth] = snake
+            self.jumps[mouth] = tail
+            self.occupancy[mouth] |= SNAKE_MOUTH
+            self.occupancy[tail] |= SNAKE_TAIL
+            self.__update_indexes([mouth])
+
+    def add_ladders(self, pairs):
+        """
+        Adds a batch of ladders on the board, either all of them or none.
+
+        Parameters
+        ----------
+        pairs: list
+            Bottom and top positions of every ladder
+        """
+        bottoms, tops = self.__unzip(pairs)
+        win = self.win_position
+        outside = (1 > tops) | (tops > win) | (1 > bottoms) | (bottoms > win)
+        bottom_flags = self.occupancy[clip(bottoms, 0, win)]
+        top_flags = self.occupancy[clip(tops, 0, win)]
+        valid = ~outside & (bottoms < tops) & (bottom_flags == 0) & ((top_flags & (LADDER_BOTTOM | SNAKE_MOUTH)) == 0)
+        placed = self.__place_batch(valid, [(bottoms, bottoms), (bottoms, tops), (tops, bottoms)])
+        self.__raise_conflicts('Ladder', bottoms, tops, [
+            (tops == bottoms, lambda bottom, top: f'A ladder bottom and top cannot be at the same location - {bottom}'),
+            (outside, lambda bottom, top: f'A ladder can be placed within the board between 1 and {win}'),
+            (bottoms > tops, lambda bottom, top: f"A ladder's top should always be up from it's bottom"),
+            ((bottom_flags & LADDER_BOTTOM).astype(bool) | placed[0],
+             lambda bottom, top: f'A ladder bottom already present at the specified bottom location - {bottom}'),
+            ((bottom_flags & SNAKE_MOUTH).astype(bool),
+             lambda bottom, top: f'A snake mouth already exists at the specified bottom location - {bottom}'),
+            ((bottom_flags & LADDER_TOP).astype(bool) | placed[1],
+             lambda bottom, top: f'A ladder top already present at the specified bottom location - {bottom}'),
+            ((bottom_flags & SNAKE_TAIL).astype(bool),
+             lambda bottom, top: f'A snake tail already exists at the specified bottom location - {bottom}'),
+            ((top_flags & LADDER_BOTTOM).astype(bool) | placed[2],
+             lambda bottom, top: f'A ladder bottom already present at the specified top location - {top}'),
+            ((top_flags & SNAKE_MOUTH).astype(bool),
+             lambda bottom, top: f'A snake mouth already exists at the specified top location - {top}'),
+        ])
+        self.jumps[bottoms] = tops
+        self.occupancy[bottoms] |= LADDER_BOTTOM
+        self.occupancy[tops] |= LADDER_TOP
+        self.__update_indexes(bottoms.tolist())
+
+    def add_snakes(self, pairs):
+        """
+        Adds a batch of snakes on the board, either all of them or none.
+
+        Parameters
+        ----------
+        pairs: list
+            Mouth and tail positions of every snake
+        """
+        mouths, tails = self.__unzip(pairs)
+        win = self.win_position
+        outside = (1 > mouths) | (mouths > win) | (1 > tails) | (tails > win)
+        mouth_flags = self.occupancy[clip(mouths, 0, win)]
+        tail_flags = self.occupancy[clip(tails, 0, win)]
+        valid = (~outside & (tails < mouths) & (mouths != win) & (mouth_flags == 0) &
+                 ((tail_flags & (LADDER_BOTTOM | SNAKE_MOUTH)) == 0))
+        placed = self.__place_batch(valid, [(mouths, mouths), (mouths, tails), (tails, mouths)])
+        self.__raise_conflicts('Snake', mouths, tails, [
+            (mouths == tails, lambda mouth, tail: f'A snake mouth and tail cannot be at the same location - {mouth}'),
+            (outside, lambda mouth, tail: f'A snake can be placed within the board between 1 and {win}'),
+            (tails > mouths, lambda mouth, tail: f"A snake's mouth should always be up from it's tail"),
+            (mouths == win, lambda mouth, tail: f"A snake mouth can't be present at the winning position"),
+            ((mouth_flags & LADDER_BOTTOM).astype(bool),
+             lambda mouth, tail: f'A ladder bottom already exists at the specified mouth location - {mouth}'),
+            ((mouth_flags & SNAKE_MOUTH).astype(bool) | placed[0],
+             lambda mouth, tail: f'A snake mouth already exists at the specified mouth location - {mouth}'),
+            ((mouth_flags & LADDER_TOP).astype(bool),
+             lambda mouth, tail: f'A ladder top already exists at the specified mouth location - {mouth}'),
+            ((mouth_flags & SNAKE_TAIL).astype(bool) | placed[1],
+             lambda mouth, tail: f'A snake tail already exists at the specified mouth location - {mouth}'),
+            ((tail_flags & LADDER_BOTTOM).astype(bool),
+             lambda mouth, tail: f'A ladder bottom already exists at the specified tail location - {tail}'),
+            ((tail_flags & SNAKE_MOUTH).astype(bool) | placed[2],
+             lambda mouth, tail: f'A snake mouth already exists at the specified tail location - {tail}'),
+        ])
+        self.jumps[mouths] = tails
+        self.occupancy[mouths] |= SNAKE_MOUTH
+        self.occupancy[tails] |= SNAKE_TAIL
+        self.__update_indexes(mouths.tolist())
+
+    @staticmethod
+    def __unzip(pairs):
+        pairs = array(list(pairs), dtype=int).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
+
+    def __place_batch(self, valid, collisions):
+        """
+        Finds the entities of a batch colliding with an entity placed before them in the same batch.
+
+        Entities are placed in their order in the batch, skipping the ones colliding with an earlier entity,
+        the same way as adding them one by one. Collisions are first looked for with every valid entity placed,
+        in a single sorted pass over the ends of the batch, and only when a valid entity collides, which skips
+        it and may free the way for a later one, the batch is placed again one entity after the other.
+
+        Parameters
+        ----------
+        valid: numpy.ndarray
+            Whether an entity passed the checks not involving the rest of the batch
+        collisions: list
+            Pairs of the end checked of every entity and the end of the earlier entities it cannot be placed on
+
+        Returns
+        -------
+        list
+            Mask of the entities colliding with an earlier entity, for every pair of ends
+        """
+        if not valid.any():
+            return [zeros(len(valid), dtype=bool) for _ in collisions]
+        index = arange(len(valid))
+        collided = []
+        for checked, occupied in collisions:
+            # Earliest valid entity with an end on every occupied position, the first occurrence in batch order
+            positions, first = unique(occupied[valid], return_index=True)
+            found = minimum(positions.searchsorted(checked), len(positions) - 1)
+            collided.append((positions[found] == checked) & (index[valid][first][found] < index))
+        if not (valid & logical_or.reduce(collided)).any():
+            return collided
+
+        collided = [zeros(len(valid), dtype=bool) for _ in collisions]
+        ends = [(checked.tolist(), occupied.tolist(), set()) for checked, occupied in collisions]
+        for i, is_valid in enumerate(valid.tolist()):
+            for mask, (checked, _, placed) in zip(collided, ends):
+                mask[i] = checked[i] in placed
+            if is_valid and not any(mask[i] for mask in collided):
+                for _, occupied, placed in ends:
+                    placed.add(occupied[i])
+        return collided
+
+    @staticmethod
+    def __raise_conflicts(name, first_ends, second_ends, rules):
+        """
+        Raises a single exception listing every entity of a batch breaking a rule.
+
+        Parameters
+        ----------
+        name: str
+            Name of the entities in the batch
+        first_ends: numpy.ndarray
+            Starting positions of the entities
+        second_ends: numpy.ndarray
+            Ending positions of the entities
+        rules: list
+            Mask of the entities breaking a rule and the message of the rule, the first broken rule is reported
+        """
+        conflicts = zeros(len(first_ends), dtype=bool)
+        messages = {}
+        for broken, message in rules:
+            for i in nonzero(broken & ~conflicts)[0].tolist():
+                messages[i] = message(int(first_ends[i]), int(second_ends[i]))
+            conflicts |= broken
+        if messages:
+            raise BoardException('\n'.join(f'{name} {i + 1} ({first_ends[i]}, {second_ends[i]}): {messages[i]}'
+                                           for i in sorted(messages)))
 
     def __is_valid_ladder(self, ladder):
         """
@@ -81,17 +324,19 @@ class Board:
             raise BoardException(f'A ladder can be placed within the board between 1 and {self.win_position}')
         if ladder.bottom > ladder.top:
             raise BoardException(f"A ladder's top should always be up from it's bottom")
-        if ladder.bottom in self.ladders:
+        bottom_flags = self.occupancy[ladder.bottom]
+        if bottom_flags & LADDER_BOTTOM:
             raise BoardException(f'A ladder bottom already present at the specified bottom location - {ladder.bottom}')
-        if ladder.bottom in self.snakes:
+        if bottom_flags & SNAKE_MOUTH:
             raise BoardException(f'A snake mouth already exists at the specified bottom location - {ladder.bottom}')
-        if ladder.bottom in [ladder.top for ladder in self.ladders.values()]:
+        if bottom_flags & LADDER_TOP:
             raise BoardException(f'A ladder top already present at the specified bottom location - {ladder.bottom}')
-        if ladder.bottom in [snake.tail for snake in self.snakes.values()]:
+        if bottom_flags & SNAKE_TAIL:
             raise BoardException(f'A snake tail already exists at the specified bottom location - {ladder.bottom}')
-        if ladder.top in self.ladders:
+        top_flags = self.occupancy[ladder.top]
+        if top_flags & LADDER_BOTTOM:
             raise BoardException(f'A ladder bottom already present at the specified top location - {ladder.top}')
-        if ladder.top in self.snakes:
+        if top_flags & SNAKE_MOUTH:
             raise BoardException(f'A snake mouth already exists at the specified top location - {ladder.top}')
         return True
 
@@ -116,17 +361,19 @@ class Board:
             raise BoardException(f"A snake's mouth should always be up from it's tail")
         if snake.mouth == self.win_position:
             raise BoardException(f"A snake mouth can't be present at the winning position")
-        if snake.mouth in self.ladders:
+        mouth_flags = self.occupancy[snake.mouth]
+        if mouth_flags & LADDER_BOTTOM:
             raise BoardException(f'A ladder bottom already exists at the specified mouth location - {snake.mouth}')
-        if snake.mouth in self.snakes:
+        if mouth_flags & SNAKE_MOUTH:
             raise BoardException(f'A snake mouth already exists at the specified mouth location - {snake.mouth}')
-        if snake.mouth in [ladder.top for ladder in self.ladders.values()]:
+        if mouth_flags & LADDER_TOP:
             raise BoardException(f'A ladder top already exists at the specified mouth location - {snake.mouth}')
-        if snake.mouth in [snake.tail for snake in self.snakes.values()]:
+        if mouth_flags & SNAKE_TAIL:
             raise BoardException(f'A snake tail already exists at the specified mouth location - {snake.mouth}')
-        if snake.tail in self.ladders:
+        tail_flags = self.occupancy[snake.tail]
+        if tail_flags & LADDER_BOTTOM:
             raise BoardException(f'A ladder bottom already exists at the specified tail location - {snake.tail}')
-        if snake.tail in self.snakes:
+        if tail_flags & SNAKE_MOUTH:
             raise BoardException(f'A snake mouth already exists at the specified tail location - {snake.tail}')
         return True
 
@@ -134,23 +381,22 @@ class Board:
         """
         Sets a board with default configurations
         """
-        print(f'>>>> Loading with default board configurations - {self.rows} rows and {self.columns} columns')
-        for bottom, top in DEFAULT_BOARD['ladders']:
-            self.add_ladder(bottom, top)
-
-        for mouth, tail in DEFAULT_BOARD['snakes']:
-            self.add_snake(mouth, tail)
-        print('>>>> Board setup completed')
-        print(f'>>>> Reach {self.win_position} on the board to win the game')
+        self.narrator.emit('default_board', rows=self.rows, columns=self.columns)
+        self.add_ladders(DEFAULT_BOARD['ladders'])
+        self.add_snakes(DEFAULT_BOARD['snakes'])
+        self.narrator.emit('board_ready', win_position=self.win_position)
+        self.narrator.flush()
 
     def manual_setup(self):
         """
         Prompts user to set a board with custom configurations
         """
-        print(f'>>>> Manually configuring the board with {self.rows} rows and {self.columns} columns')
+        self.narrator.emit('manual_board', rows=self.rows, columns=self.columns)
         if self.win_position == 1:
-            print('>>>> Since there is only one block on the board, skipping the snakes and ladders configuration')
+            self.narrator.emit('single_block_board')
+            self.narrator.flush()
             return
+        self.narrator.flush()
         num_of_ladders = enter_a_valid_number('\tQ. How many ladders do you want on board? ')
         if num_of_ladders > 0:
             print('\tFor ladders, bottom and top positions will be provided as comma separated, e.g. 2,98')
@@ -180,8 +426,60 @@ class Board:
                     print(f'\t>>>> {e.message}')
                 except Exception:
                     print(f'\t>>>> Provide correct inputs for snake {i + 1}')
-        print('>>>> Board setup completed')
-        print(f'>>>> Reach {self.win_position} on the board to win the game')
+        self.narrator.emit('board_ready', win_position=self.win_position)
+        self.narrator.flush()
+
+    def reachability(self, dice, cache_path=None):
+        """
+        Reachability index of the board for a dice, built on first use and kept up to date as ladders and snakes
+        are added.
+
+        Parameters
+        ----------
+        dice: Dice
+            Dice to play with
+        cache_path: str
+            File the index is read from on first use, or written to once built, default value builds it in memory
+
+        Returns
+        -------
+        ReachabilityIndex
+        """
+        key = (dice.min_num, dice.max_num)
+        if key not in self.__indexes:
+            self.__indexes[key] = ReachabilityIndex(self, dice, cache_path)
+        return self.__indexes[key]
+
+    def reachable(self, dice):
+        """
+        Bitmap of the positions a player can stand on with a dice, read from the reachability index of the board.
+
+        Parameters
+        ----------
+        dice: Dice
+            Dice to play with
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.reachability(dice).reachable
+
+    def __update_indexes(self, landings):
+        if landings:
+            for index in self.__indexes.values():
+                index.update(landings)
+
+    def jump_table(self):
+        """
+        Copy of the dense table of final positions.
+
+        Returns
+        -------
+        numpy.ndarray
+            Final position on the board indexed by the landing position, from 0 to the win position
+        """
+        return self.jumps.astype(int)
 
     def move_player(self, player, dice_roll):
         """
@@ -198,27 +496,48 @@ class Board:
         -------
         bool
         """
-        self.player_dice_rolls[f'Player {player}'] = append(self.player_dice_rolls[f'Player {player}'], int(dice_roll))
-        current_position = self.player_positions[f'Player {player}'][-1]
-        print(f'>>>> Player {player} is currently at {current_position} on the board')
-        updated_position = current_position + dice_roll
-        if updated_position > self.win_position:
-            print(f'>>>> This dice roll is moving the Player {player} out of the board, try again')
+        current_position = self.history.position(player)
+        self.narrator.emit('position', player=player, position=current_position)
+        new_position = self.advance(player, dice_roll)
+        if new_position is None:
+            self.narrator.emit('overshoot', player=player)
             return False
-        print(f'>>>> Moving Player {player} from {current_position} to new position: {updated_position} on the board')
-        if updated_position in self.ladders:
-            new_position = self.ladders[updated_position].top
-            print(f'>>>> WOW! Found a ladder at the new position {updated_position}, '
-                  f'jumping to {new_position} on the board')
-        elif updated_position in self.snakes:
-            new_position = self.snakes[updated_position].tail
-            print(f'>>>> OUCH! Found a snake at the new position {updated_position}, '
-                  f'falling to {new_position} on the board')
-        else:
-            new_position = updated_position
-        self.player_positions[f'Player {player}'] = append(self.player_positions[f'Player {player}'], new_position)
+        updated_position = current_position + dice_roll
+        self.narrator.emit('move', player=player, position=current_position, updated_position=updated_position)
+        if new_position > updated_position:
+            self.narrator.emit('ladder', player=player, updated_position=updated_position, new_position=new_position)
+        elif new_position < updated_position:
+            self.narrator.emit('snake', player=player, updated_position=updated_position, new_position=new_position)
         return True
 
+    def advance(self, player, dice_roll):
+        """
+        Moves a player on the board based on the rolled dice, without any narration.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+        dice_roll: int
+            Number got on rolling the dice
+
+        Returns
+        -------
+        int, None
+            New position of the player, None if the dice roll is moving the player out of the board
+        """
+        self.history.record_roll(player, dice_roll)
+        updated_position = self.history.position(player) + dice_roll
+        if updated_position > self.win_position:
+            if self.recorder is not None:
+                self.recorder.record(player, dice_roll)
+            return None
+        new_position = int(self.jumps[updated_position])
+        self.history.record_position(player, new_position)
+        if self.recorder is not None:
+            self.recorder.record(player, dice_roll, new_position)
+        return new_position
+
     def check_for_victory(self, player):
         """
         Checks whether the player has reached at the win position or not.
@@ -232,23 +551,30 @@ class Board:
         -------
         bool
         """
-        if self.player_positions[f'Player {player}'][-1] == self.win_position:
-            print(f'>>>> HURRAYYYYY! Player {player} won the game')
+        if self.history.position(player) == self.win_position:
+            self.narrator.emit('victory', player=player)
             return True
         return False
 
-    def save_the_play(self):
+    def save_the_play(self, max_num=DEFAULT_DICE['max']):
         """
-        Saves the current game play as a json file.
+        Saves the current game play as a json file, along with the remaining moves of the game record.
+
+        Parameters
+        ----------
+        max_num: int
+            Maximum number on the dice the game was played with
         """
+        if self.recorder is not None:
+            self.recorder.close()
+        # pandas is slow to import and only needed to save the play, so it is not loaded for the game play
+        from pandas import DataFrame, Series
+
         game_data = {}
-        moves_df = DataFrame()
-        rolls_df = DataFrame()
-        for player, positions in self.player_positions.items():
-            moves_df = concat([moves_df, DataFrame(data={player: positions.astype(int)})], axis=1)
-        for player, data in self.player_dice_rolls.items():
-            rolls_df = concat([rolls_df, DataFrame(data={player: data.astype(int)})], axis=1)
+        moves_df = DataFrame(data={player: Series(positions) for player, positions in self.player_positions.items()})
+        rolls_df = DataFrame(data={player: Series(rolls) for player, rolls in self.player_dice_rolls.items()})
         game_data['moves'] = moves_df.to_json(orient='records')
         game_data['rolls'] = rolls_df.to_json(orient='records')
+        game_data['max_num'] = max_num
         with open(GAME_DATA_FILE, 'w') as file:
             dump(game_data, file)
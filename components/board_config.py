@@ -0,0 +1,276 @@
+from hashlib import sha256
+from json import dump, load
+from os import makedirs, path as os_path, replace
+from struct import Struct
+
+from numpy import array, int32, int8, lexsort, memmap, uint8
+
+from .board import Board
+from shared.constants import BOARD_CACHE_DIR
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+# A compiled board is a header, followed by the jump table and the occupancy index
+COMPILED_BOARD_MAGIC = b'SNLBRD02'
+COMPILED_BOARD_HEADER = Struct('<8sii')
+DICE_CONFIG_HEADER = Struct('<ii')
+BOARD_CONFIG_KEYS = ('num_of_rows', 'num_of_columns', 'ladders', 'snakes')
+
+
+def load_board_config(config_path):
+    """
+    Loads a board configuration from a JSON or TOML file, shaped like ``DEFAULT_BOARD``.
+
+    Parameters
+    ----------
+    config_path: str
+        Path of the file, the format is told by its .json or .toml extension
+
+    Returns
+    -------
+    dict
+    """
+    if config_path.endswith('.toml'):
+        try:
+            from tomllib import load as load_toml
+        except ImportError:
+            try:
+                from tomli import load as load_toml
+            except ImportError:
+                raise BoardException('Reading a TOML board configuration needs Python 3.11 or the tomli package')
+        with open(config_path, 'rb') as file:
+            board_config = load_toml(file)
+    else:
+        with open(config_path) as file:
+            board_config = load(file)
+    return check_board_config(board_config, config_path)
+
+
+def check_board_config(board_config, source='given'):
+    """
+    Checks the structure of a board configuration, the ladders and snakes are validated when placed on the board.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    source: str
+        Where the configuration comes from, for the error messages
+
+    Returns
+    -------
+    dict
+        Configuration with only the keys of a board configuration
+    """
+    if not isinstance(board_config, dict):
+        raise BoardException(f'The board configuration {source} should have {", ".join(BOARD_CONFIG_KEYS)}')
+    missing = [key for key in BOARD_CONFIG_KEYS if key not in board_config]
+    if missing:
+        raise BoardException(f'The board configuration {source} misses {", ".join(missing)}')
+    for key in ('num_of_rows', 'num_of_columns'):
+        if not is_integer(board_config[key]) or board_config[key] < 1:
+            raise BoardException(f'{key} of the board configuration {source} should be a positive integer')
+    for key in ('ladders', 'snakes'):
+        pairs = board_config[key]
+        if not isinstance(pairs, (list, tuple)) or not all(
+                isinstance(pair, (list, tuple)) and len(pair) == 2 and all(map(is_integer, pair)) for pair in pairs):
+            raise BoardException(f'{key} of the board configuration {source} should be a list of pairs of positions')
+    return {key: board_config[key] for key in BOARD_CONFIG_KEYS}
+
+
+def is_integer(value):
+    """
+    Whether a value read from a configuration file is an integer, booleans excluded.
+
+    Parameters
+    ----------
+    value: object
+        Value to check
+
+    Returns
+    -------
+    bool
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def save_board_config(board_config, config_path):
+    """
+    Saves a board configuration to a JSON or TOML file.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    config_path: str
+        Path of the file, the format is told by its .json or .toml extension
+    """
+    ladders = [[int(bottom), int(top)] for bottom, top in board_config['ladders']]
+    snakes = [[int(mouth), int(tail)] for mouth, tail in board_config['snakes']]
+    with open(config_path, 'w') as file:
+        if config_path.endswith('.toml'):
+            file.write(f"num_of_rows = {board_config['num_of_rows']}\n"
+                       f"num_of_columns = {board_config['num_of_columns']}\n"
+                       f'ladders = {ladders}\n'
+                       f'snakes = {snakes}\n')
+        else:
+            dump({'num_of_rows': board_config['num_of_rows'], 'num_of_columns': board_config['num_of_columns'],
+                  'ladders': ladders, 'snakes': snakes}, file)
+
+
+def board_config_of(board):
+    """
+    Configuration of a board, e.g. to save a board set up manually.
+
+    Parameters
+    ----------
+    board: Board
+        Board to describe
+
+    Returns
+    -------
+    dict
+    """
+    return {'num_of_rows': board.rows, 'num_of_columns': board.columns,
+            'ladders': [(bottom, ladder.top) for bottom, ladder in board.ladders.items()],
+            'snakes': [(mouth, snake.tail) for mouth, snake in board.snakes.items()]}
+
+
+def build_board(board_config, num_of_players, narrator=None):
+    """
+    Builds a board from a configuration shaped like ``DEFAULT_BOARD``.
+
+    Parameters
+    ----------
+    board_config: dict
+        Number of rows and columns, ladders and snakes of the board
+    num_of_players: int
+        Number of players
+    narrator: ConsoleSink, NullSink, StructuredSink
+        Sink of the narration of the game, default value narrates on the console
+
+    Returns
+    -------
+    Board
+    """
+    board = Board(num_of_players=num_of_players, rows=board_config['num_of_rows'],
+                  columns=board_config['num_of_columns'], narrator=narrator)
+    board.add_ladders(board_config['ladders'])
+    board.add_snakes(board_config['snakes'])
+    return board
+
+
+def board_config_hash(board_config, dice_config=None):
+    """
+    Content hash of a board configuration, the order of the ladders and snakes does not matter.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    dice_config: dict
+        Minimum and maximum numbers of the dice, hashed along for results depending on the dice, default value
+        hashes the board only
+
+    Returns
+    -------
+    str
+    """
+    digest = sha256(COMPILED_BOARD_HEADER.pack(COMPILED_BOARD_MAGIC, int(board_config['num_of_rows']),
+                                              int(board_config['num_of_columns'])))
+    if dice_config is not None:
+        digest.update(DICE_CONFIG_HEADER.pack(int(dice_config['min']), int(dice_config['max'])))
+    for pairs in (board_config['ladders'], board_config['snakes']):
+        pairs = array(list(pairs), dtype='<i8').reshape(-1, 2)
+        digest.update(len(pairs).to_bytes(8, 'little'))
+        digest.update(pairs[lexsort((pairs[:, 1], pairs[:, 0]))].tobytes())
+    return digest.hexdigest()
+
+
+def compile_board(board_config, compiled_path):
+    """
+    Validates a board configuration and compiles it into a binary file.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    compiled_path: str
+        Path of the compiled board, written at once so it is never seen half written
+    """
+    board = build_board(board_config, num_of_players=1, narrator=NULL_SINK)
+    temp_path = f'{compiled_path}.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(COMPILED_BOARD_HEADER.pack(COMPILED_BOARD_MAGIC, board.rows, board.columns))
+        file.write(board.jumps.astype('<i4').tobytes())
+        file.write(board.occupancy.tobytes())
+    replace(temp_path, compiled_path)
+
+
+def load_compiled_board(compiled_path, num_of_players, narrator=None):
+    """
+    Loads a compiled board with a single memory mapped read, without validating it again.
+
+    Parameters
+    ----------
+    compiled_path: str
+        Path of the compiled board
+    num_of_players: int
+        Number of players
+    narrator: ConsoleSink, NullSink, StructuredSink
+        Sink of the narration of the game, default value narrates on the console
+
+    Returns
+    -------
+    Board
+    """
+    data = memmap(compiled_path, dtype=uint8, mode='c')
+    magic, rows, columns = COMPILED_BOARD_HEADER.unpack(bytes(data[:COMPILED_BOARD_HEADER.size]))
+    size = rows * columns + 1
+    if magic != COMPILED_BOARD_MAGIC or len(data) != COMPILED_BOARD_HEADER.size + 5 * size:
+        raise BoardException(f'{compiled_path} is not a compiled board')
+    jumps_end = COMPILED_BOARD_HEADER.size + 4 * size
+    board = Board(num_of_players=num_of_players, rows=rows, columns=columns, narrator=narrator)
+    board.jumps = data[COMPILED_BOARD_HEADER.size:jumps_end].view(int32)
+    board.occupancy = data[jumps_end:jumps_end + size].view(int8)
+    return board
+
+
+def load_board(board_config, num_of_players, cache_dir=BOARD_CACHE_DIR, narrator=None, dice=None):
+    """
+    Loads a board from its configuration, compiling it on the first load and reusing the compiled board afterwards.
+
+    Compiled boards are cached by the content hash of their configuration, and their reachability indexes by the
+    content hash of the configuration and the dice, next to them.
+
+    Parameters
+    ----------
+    board_config: dict, str
+        Configuration of the board shaped like ``DEFAULT_BOARD``, or the path of a JSON or TOML configuration file
+    num_of_players: int
+        Number of players
+    cache_dir: str
+        Directory of the compiled boards
+    narrator: ConsoleSink, NullSink, StructuredSink
+        Sink of the narration of the game, default value narrates on the console
+    dice: Dice
+        Dice the reachability index of the board is compiled and cached for, default value leaves the index to be
+        built on first use
+
+    Returns
+    -------
+    Board
+    """
+    if isinstance(board_config, str):
+        board_config = load_board_config(board_config)
+    else:
+        board_config = check_board_config(board_config)
+    makedirs(cache_dir, exist_ok=True)
+    compiled_path = os_path.join(cache_dir, f'{board_config_hash(board_config)}.bin')
+    if not os_path.exists(compiled_path):
+        compile_board(board_config, compiled_path)
+    board = load_compiled_board(compiled_path, num_of_players, narrator)
+    if dice is not None:
+        dice_config = {'min': dice.min_num, 'max': dice.max_num}
+        board.reachability(dice, os_path.join(cache_dir, f'{board_config_hash(board_config, dice_config)}.reach'))
+    return board
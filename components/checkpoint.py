@@ -0,0 +1,245 @@
+from array import array
+from json import dumps, loads
+from os import fsync, path as os_path, remove, replace
+from struct import Struct
+
+from numpy import array as numpy_array, concatenate, frombuffer, int8, int32, int64, load, savez, zeros
+
+from .board import Board
+from .dice import Dice
+from .recorder import OUT_OF_BOARD, RECORD_DTYPE
+from shared.constants import GAME_CHECKPOINT_FILE
+
+# A delta file starts with a header naming the snapshot it follows, then one record per dice roll like a record file
+DELTA_MAGIC = b'SNLDLT01'
+DELTA_HEADER = Struct('<8sq')
+DELTA_MOVE = Struct('<iii')
+
+
+class GameCheckpoint:
+    def __init__(self, path=GAME_CHECKPOINT_FILE, snapshot_every=256, sync=False):
+        """
+        Keeps an interrupted game resumable, with full snapshots of the game and the moves played since the last one.
+
+        The board does not change during a game, so it is written once next to the snapshot. A snapshot holds every
+        move, whose turn it is and the state of the dice, random number generator included, and replaces the
+        previous one at once by renaming a temporary file. Every move is then
+        appended to a delta file, which is started anew after every snapshot. A snapshot is taken again once the
+        delta holds enough moves, at least a quarter of the moves in the snapshot, so resuming only replays a
+        fraction of the game.
+
+        Parameters
+        ----------
+        path: str
+            Path of the snapshot, the board and delta files are next to it with .board.npz and .delta extensions
+        snapshot_every: int
+            Least number of moves after which a snapshot is taken again
+        sync: bool
+            Whether every write is also synced to the disk, default value is to leave it to the operating system
+        """
+        self.path = path
+        self.board_path = f'{os_path.splitext(path)[0]}.board.npz'
+        self.delta_path = f'{os_path.splitext(path)[0]}.delta'
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        self.board = None
+        self.dice = None
+        self.generation = 0
+        self.__moves = array('i')
+        self.__num_of_deltas = 0
+        self.__delta = None
+
+    def exists(self):
+        """
+        Whether an interrupted game can be resumed.
+
+        Returns
+        -------
+        bool
+        """
+        return os_path.exists(self.path)
+
+    def start(self, board, dice):
+        """
+        Starts keeping a new game, replacing the game kept before.
+
+        Parameters
+        ----------
+        board: Board
+            Board of the game, set up
+        dice: Dice
+            Dice of the game
+        """
+        # The kept game is forgotten first, so a crash before the first snapshot leaves no game to resume
+        self.clear()
+        self.board, self.dice = board, dice
+        self.generation = 0
+        self.__moves = array('i')
+        shape = numpy_array([board.num_of_players, board.rows, board.columns], dtype=int64)
+        self.__write(self.board_path, shape=shape, jumps=board.jumps, occupancy=board.occupancy)
+        self.snapshot(next_player=1, bonus_pending=False)
+
+    def record(self, player, dice_roll, position=OUT_OF_BOARD):
+        """
+        Records a move of a player, taking a snapshot once enough moves were recorded since the last one.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+        dice_roll: int
+            Number got on rolling the dice
+        position: int
+            New position of the player, default value is for a roll moving the player out of the board
+        """
+        self.__moves.extend((player, dice_roll, position))
+        self.__num_of_deltas += 1
+        # Snapshots get rarer as the game grows, so writing them costs a constant time per move on average
+        if self.__num_of_deltas >= max(self.snapshot_every, len(self.__moves) // 12):
+            self.snapshot(*self.next_turn(player, dice_roll, position))
+            return
+        self.__delta.write(DELTA_MOVE.pack(player, dice_roll, position))
+        self.__flush(self.__delta)
+
+    def next_turn(self, player, dice_roll, position):
+        """
+        Whose turn it is after a move, and whether it is a bonus roll.
+
+        Parameters
+        ----------
+        player: int
+            Player id of the move
+        dice_roll: int
+            Number got on the dice in the move
+        position: int
+            New position of the player, negative when the roll moved the player out of the board
+
+        Returns
+        -------
+        (int, bool)
+            id of the player to roll next and whether it is a bonus roll of the same turn
+        """
+        if position >= 0 and dice_roll == self.dice.max_num:
+            return player, True
+        return player % self.board.num_of_players + 1, False
+
+    def snapshot(self, next_player, bonus_pending):
+        """
+        Writes a full snapshot of the game and starts a new delta file.
+
+        Parameters
+        ----------
+        next_player: int
+            Id of the player to roll next
+        bonus_pending: bool
+            Whether the next roll is a bonus roll of the same turn
+        """
+        self.generation += 1
+        self.__write(self.path, meta=numpy_array([self.generation, next_player, int(bonus_pending)], dtype=int64),
+                     moves=self.moves(), dice=numpy_array(dumps(self.dice.get_state())))
+        # Moves of an older delta file are already in the snapshot, and left out by their generation
+        if self.__delta is not None:
+            self.__delta.close()
+        self.__delta = open(self.delta_path, 'wb')
+        self.__delta.write(DELTA_HEADER.pack(DELTA_MAGIC, self.generation))
+        self.__flush(self.__delta)
+        self.__num_of_deltas = 0
+
+    def __write(self, path, **arrays):
+        # Written at once, so a file is never seen half written
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as file:
+            savez(file, **arrays)
+            self.__flush(file)
+        replace(temp_path, path)
+
+    def __flush(self, file):
+        file.flush()
+        if self.sync:
+            fsync(file.fileno())
+
+    def restore(self, narrator=None):
+        """
+        Restores the kept game, to go on recording its moves.
+
+        Parameters
+        ----------
+        narrator: ConsoleSink, NullSink, StructuredSink
+            Sink of the narration of the game, default value narrates on the console
+
+        Returns
+        -------
+        (int, bool)
+            id of the player to roll next and whether it is a bonus roll of the same turn
+        """
+        with load(self.board_path) as data:
+            num_of_players, rows, columns = data['shape'].tolist()
+            board = Board(num_of_players=num_of_players, rows=rows, columns=columns, narrator=narrator)
+            board.jumps = data['jumps'].astype(int32)
+            board.occupancy = data['occupancy'].astype(int8)
+        with load(self.path) as data:
+            generation, next_player, bonus_pending = data['meta'].tolist()
+            moves = data['moves']
+            dice = Dice.from_state(loads(str(data['dice'])), narrator=narrator)
+        deltas = self.__read_deltas(generation)
+        # The dice rolled the moves of the delta after the snapshot, so it is rolled again the same way
+        for dice_roll in deltas['roll'].tolist():
+            if dice.roll() != dice_roll:
+                raise ValueError(f'{self.delta_path} does not follow the dice of {self.path}')
+        moves = concatenate([moves, deltas])
+        board.history.extend(moves['player'], moves['roll'], moves['position'])
+
+        self.board, self.dice = board, dice
+        self.generation = generation
+        self.__moves = array('i')
+        self.__moves.frombytes(moves.astype(RECORD_DTYPE).tobytes())
+        if len(deltas):
+            next_player, bonus_pending = self.next_turn(*deltas[-1].tolist())
+        # Snapshot again, so recording starts from a clean delta file
+        self.snapshot(next_player, bool(bonus_pending))
+        return next_player, bool(bonus_pending)
+
+    def __read_deltas(self, generation):
+        """
+        Moves of the delta file following a snapshot, a partially written move at the end of the file is left out.
+
+        Parameters
+        ----------
+        generation: int
+            Generation of the snapshot
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array of the player, roll and position of every move
+        """
+        if not os_path.exists(self.delta_path):
+            return zeros(0, dtype=RECORD_DTYPE)
+        with open(self.delta_path, 'rb') as file:
+            data = file.read()
+        if len(data) < DELTA_HEADER.size or DELTA_HEADER.unpack(data[:DELTA_HEADER.size]) != (DELTA_MAGIC, generation):
+            return zeros(0, dtype=RECORD_DTYPE)
+        data = data[DELTA_HEADER.size:]
+        return frombuffer(data, dtype=RECORD_DTYPE, count=len(data) // RECORD_DTYPE.itemsize).copy()
+
+    def moves(self):
+        """
+        Every move of the kept game.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array of the player, roll and position of every move
+        """
+        return frombuffer(self.__moves.tobytes(), dtype=RECORD_DTYPE)
+
+    def clear(self):
+        """
+        Forgets the kept game, once it is over.
+        """
+        if self.__delta is not None:
+            self.__delta.close()
+            self.__delta = None
+        for path in (self.path, self.board_path, self.delta_path):
+            if os_path.exists(path):
+                remove(path)
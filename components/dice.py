@@ -1,8 +1,186 @@
-from random import randint
+from random import Random
+
+from numpy import array, concatenate
+from numpy.random import Generator, PCG64
+
+from shared.narration import CONSOLE
+
+
+class RandomBackend:
+    def __init__(self, seed=None):
+        """
+        Draws dice numbers with the random module of the standard library.
+
+        Parameters
+        ----------
+        seed: int
+            Seed for the random number generator
+        """
+        self.generator = Random(seed)
+
+    def draw(self, min_num, max_num, size):
+        """
+        Draws numbers between a minimum and a maximum, both included.
+
+        Parameters
+        ----------
+        min_num: int
+            Minimum number to draw
+        max_num: int
+            Maximum number to draw
+        size: int
+            Count of numbers to draw
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return array(self.generator.choices(range(min_num, max_num + 1), k=size), dtype=int)
+
+    def get_state(self):
+        """
+        State of the random number generator, as JSON serializable data.
+
+        Returns
+        -------
+        list
+        """
+        version, internal_state, gauss_next = self.generator.getstate()
+        return [version, list(internal_state), gauss_next]
+
+    def set_state(self, state):
+        """
+        Restores a state of the random number generator.
+
+        Parameters
+        ----------
+        state: list
+            State returned by ``get_state``
+        """
+        version, internal_state, gauss_next = state
+        self.generator.setstate((version, tuple(internal_state), gauss_next))
+
+
+class PCG64Backend:
+    def __init__(self, seed=None):
+        """
+        Draws dice numbers with the PCG64 generator of NumPy.
+
+        Parameters
+        ----------
+        seed: int, numpy.random.SeedSequence
+            Seed for the random number generator
+        """
+        self.generator = Generator(PCG64(seed))
+
+    def draw(self, min_num, max_num, size):
+        """
+        Draws numbers between a minimum and a maximum, both included.
+
+        Parameters
+        ----------
+        min_num: int
+            Minimum number to draw
+        max_num: int
+            Maximum number to draw
+        size: int
+            Count of numbers to draw
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.generator.integers(min_num, max_num, size=size, endpoint=True)
+
+    def get_state(self):
+        """
+        State of the random number generator, as JSON serializable data.
+
+        Returns
+        -------
+        dict
+        """
+        return self.generator.bit_generator.state
+
+    def set_state(self, state):
+        """
+        Restores a state of the random number generator.
+
+        Parameters
+        ----------
+        state: dict
+            State returned by ``get_state``
+        """
+        self.generator.bit_generator.state = state
+
+
+class ReplayBackend:
+    def __init__(self, sequence):
+        """
+        Replays a fixed sequence of dice numbers.
+
+        Parameters
+        ----------
+        sequence: list
+            Numbers to replay in order
+        """
+        self.sequence = array(sequence, dtype=int)
+        self.position = 0
+
+    def draw(self, min_num, max_num, size):
+        """
+        Draws the next numbers of the sequence, fewer than asked for once the sequence runs out.
+
+        Parameters
+        ----------
+        min_num: int
+            Minimum number on the dice, unused
+        max_num: int
+            Maximum number on the dice, unused
+        size: int
+            Count of numbers to draw
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        numbers = self.sequence[self.position:self.position + size]
+        self.position += len(numbers)
+        return numbers
+
+    def get_state(self):
+        """
+        Sequence and position in it, as JSON serializable data.
+
+        Returns
+        -------
+        dict
+        """
+        return {'sequence': self.sequence.tolist(), 'position': self.position}
+
+    def set_state(self, state):
+        """
+        Restores a sequence and position in it.
+
+        Parameters
+        ----------
+        state: dict
+            State returned by ``get_state``
+        """
+        self.sequence = array(state['sequence'], dtype=int)
+        self.position = state['position']
+
+
+DICE_BACKENDS = {
+    'random': RandomBackend,
+    'pcg64': PCG64Backend,
+    'replay': ReplayBackend,
+}
 
 
 class Dice:
-    def __init__(self, min_num=1, max_num=6):
+    def __init__(self, min_num=1, max_num=6, seed=None, backend='random', sequence=None, buffer_size=256,
+                 narrator=None):
         """
         Initializes a dice to play with.
 
@@ -12,11 +190,29 @@ class Dice:
             Minimum number to get on the dice
         max_num: int
             Maximum number to get on the dice, also getting the maximum number will reward a one more dice roll
+        seed: int
+            Seed for the random number generator, rolls are reproducible for the same seed
+        backend: str
+            Random number generator to roll with, either random or pcg64, ignored when a sequence is given
+        sequence: list
+            Fixed sequence of numbers to replay instead of rolling randomly
+        buffer_size: int
+            Count of numbers drawn at once and served one by one to the rolls
+        narrator: ConsoleSink, NullSink, StructuredSink
+            Sink of the narration of the dice setup, default value narrates on the console
         """
         self.min_num = min_num
         self.max_num = max_num
-        print(f'>>>> Setting up a dice with {self.min_num} and {self.max_num} as minimum and maximum numbers to get,'
-              f' also getting a {self.max_num} will reward one more dice roll')
+        self.buffer_size = buffer_size
+        if sequence is not None:
+            self.backend = ReplayBackend(sequence)
+        else:
+            self.backend = DICE_BACKENDS[backend](seed)
+        self.__buffer = []
+        self.__next = 0
+        narrator = CONSOLE if narrator is None else narrator
+        narrator.emit('dice_ready', min_num=self.min_num, max_num=self.max_num)
+        narrator.flush()
 
     def roll(self):
         """
@@ -26,7 +222,73 @@ class Dice:
         -------
         int
         """
-        return randint(self.min_num, self.max_num)
+        if self.__next == len(self.__buffer):
+            self.__buffer = self.backend.draw(self.min_num, self.max_num, self.buffer_size).tolist()
+            self.__next = 0
+            if not self.__buffer:
+                raise IndexError('No more numbers left to roll on the dice')
+        number = self.__buffer[self.__next]
+        self.__next += 1
+        return number
+
+    def roll_many(self, count):
+        """
+        Generates many random numbers between minimum and maximum dice numbers at once.
+
+        Parameters
+        ----------
+        count: int
+            Count of numbers to generate
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        buffered = self.__buffer[self.__next:self.__next + count]
+        self.__next += len(buffered)
+        drawn = self.backend.draw(self.min_num, self.max_num, count - len(buffered))
+        if len(buffered) + len(drawn) < count:
+            raise IndexError('No more numbers left to roll on the dice')
+        return concatenate([array(buffered, dtype=drawn.dtype), drawn])
+
+    def get_state(self):
+        """
+        Whole state of the dice, numbers drawn but not rolled yet included, as JSON serializable data.
+
+        Returns
+        -------
+        dict
+        """
+        backend = next(name for name, backend in DICE_BACKENDS.items() if isinstance(self.backend, backend))
+        return {'min_num': self.min_num, 'max_num': self.max_num, 'buffer_size': self.buffer_size,
+                'backend': backend, 'generator': self.backend.get_state(),
+                'buffer': [int(number) for number in self.__buffer[self.__next:]]}
+
+    @classmethod
+    def from_state(cls, state, narrator=None):
+        """
+        Dice rolling the same numbers as the dice a state was taken from.
+
+        Parameters
+        ----------
+        state: dict
+            State returned by ``get_state``
+        narrator: ConsoleSink, NullSink, StructuredSink
+            Sink of the narration of the dice setup, default value narrates on the console
+
+        Returns
+        -------
+        Dice
+        """
+        if state['backend'] == 'replay':
+            dice = cls(state['min_num'], state['max_num'], sequence=[], buffer_size=state['buffer_size'],
+                       narrator=narrator)
+        else:
+            dice = cls(state['min_num'], state['max_num'], backend=state['backend'], buffer_size=state['buffer_size'],
+                       narrator=narrator)
+        dice.backend.set_state(state['generator'])
+        dice.__buffer = list(state['buffer'])
+        return dice
 
     def got_one_more_roll(self, rolled_number):
         """
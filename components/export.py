@@ -0,0 +1,244 @@
+from os import path as os_path
+
+from numpy import arange, array, concatenate, cumsum, int32, int64, maximum, ones, repeat, where, zeros
+
+from .recorder import GameRecordReader, RECORD_DTYPE
+from shared.exception import ExportException
+
+# Every exported move is one row, the event tells what happened after moving by the roll, and bonus whether the
+# roll was rewarded with one more roll, which can happen along with any event but an overshoot
+EXPORT_COLUMNS = ('game_id', 'turn', 'player', 'roll', 'from', 'to', 'bonus', 'event')
+EXPORT_EVENTS = ('move', 'ladder', 'snake', 'overshoot')
+EXPORT_FORMATS = {'.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow'}
+
+
+def export_columns(game_ids, players, dice_rolls, positions, max_nums):
+    """
+    Derives the exported columns of a sequence of moves of one or more games, in the order they were played.
+
+    Parameters
+    ----------
+    game_ids: numpy.ndarray
+        Game id of every move, the moves of a game are contiguous
+    players: numpy.ndarray
+        Player id of every move
+    dice_rolls: numpy.ndarray
+        Number got on the dice in every move
+    positions: numpy.ndarray
+        New position of the player after every move, negative when the roll moved the player out of the board
+    max_nums: numpy.ndarray, int
+        Maximum number on the dice of the game of every move, rewarding one more dice roll
+
+    Returns
+    -------
+    dict
+        Column name to the values of every move, events are given as indices in ``EXPORT_EVENTS``
+    """
+    num_of_moves = len(players)
+    game_ids = game_ids.astype(int64)
+    players, dice_rolls, positions = players.astype(int32), dice_rolls.astype(int32), positions.astype(int32)
+    moved = positions >= 0
+
+    # The moves of every player of every game are grouped together, keeping their order, to find where the
+    # player came from: the last position before the move, overshooting rolls leaving it unchanged
+    order = (game_ids * (int(players.max(initial=0)) + 1) + players).argsort(kind='stable')
+    grouped_moved = moved[order]
+    group_start = ones(num_of_moves, dtype=bool)
+    if num_of_moves:
+        group_start[1:] = (game_ids[order][1:] != game_ids[order][:-1]) | (players[order][1:] != players[order][:-1])
+    last_moved = maximum.accumulate(where(grouped_moved | group_start, arange(num_of_moves), 0))
+    to_grouped = where(grouped_moved[last_moved], positions[order][last_moved], 0)
+    from_grouped = zeros(num_of_moves, dtype=int32)
+    from_grouped[1:] = to_grouped[:-1]
+    from_grouped[group_start] = 0
+    from_positions, to_positions = zeros(num_of_moves, dtype=int32), zeros(num_of_moves, dtype=int32)
+    from_positions[order], to_positions[order] = from_grouped, to_grouped
+
+    landings = from_positions + dice_rolls
+    bonus = moved & (dice_rolls == max_nums)
+    events = zeros(num_of_moves, dtype=int32)
+    events[moved & (to_positions > landings)] = EXPORT_EVENTS.index('ladder')
+    events[moved & (to_positions < landings)] = EXPORT_EVENTS.index('snake')
+    events[~moved] = EXPORT_EVENTS.index('overshoot')
+
+    # A turn starts with the first move of a game and after every move not rewarded with one more roll
+    turn_start = ones(num_of_moves, dtype=bool)
+    if num_of_moves:
+        turn_start[1:] = ~bonus[:-1] | (game_ids[1:] != game_ids[:-1])
+    turns = cumsum(turn_start, dtype=int32)
+    game_start = turn_start.copy()
+    if num_of_moves:
+        game_start[1:] = game_ids[1:] != game_ids[:-1]
+    starts = maximum.accumulate(where(game_start, arange(num_of_moves), 0))
+    turns -= turns[starts] - 1
+    return {'game_id': game_ids, 'turn': turns, 'player': players, 'roll': dice_rolls, 'from': from_positions,
+            'to': to_positions, 'bonus': bonus, 'event': events}
+
+
+class HistoryExporter:
+    def __init__(self, path, file_format=None, row_group_size=1 << 20):
+        """
+        Streams the moves of finished games to a columnar file, Parquet or Arrow IPC, in bounded memory.
+
+        Moves are buffered until a row group is full, which is then written and dropped from memory, so the size
+        of the exported data is only bounded by the disk. Needs the pyarrow package.
+
+        Parameters
+        ----------
+        path: str
+            Path of the exported file, overwritten if it already exists
+        file_format: str
+            Either parquet or arrow, default value is given by the extension of the path
+        row_group_size: int
+            Number of moves written at once, as a Parquet row group or an Arrow record batch
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ExportException('Exporting game data needs the pyarrow package, install it with '
+                                  '`pip install pyarrow`')
+        if file_format is None:
+            file_format = EXPORT_FORMATS.get(os_path.splitext(path)[1].lower())
+        if file_format not in ('parquet', 'arrow'):
+            raise ExportException(f'Cannot tell the export format of {path}, use a .parquet or .arrow file')
+        self.path = path
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.num_of_games = 0
+        self.num_of_moves = 0
+        self.__pyarrow = pyarrow
+        self.schema = pyarrow.schema([('game_id', pyarrow.int64()), ('turn', pyarrow.int32()),
+                                      ('player', pyarrow.int32()), ('roll', pyarrow.int32()),
+                                      ('from', pyarrow.int32()), ('to', pyarrow.int32()), ('bonus', pyarrow.bool_()),
+                                      ('event', pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))])
+        self.__events = pyarrow.array(EXPORT_EVENTS, type=pyarrow.string())
+        self.__buffer = []
+        self.__buffered = 0
+        if file_format == 'parquet':
+            from pyarrow.parquet import ParquetWriter
+            self.__writer = ParquetWriter(path, self.schema)
+        else:
+            from pyarrow.ipc import new_file
+            self.__writer = new_file(path, self.schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_moves(self, game_ids, players, dice_rolls, positions, max_nums):
+        """
+        Adds the moves of one or more finished games, in the order they were played.
+
+        Parameters
+        ----------
+        game_ids: numpy.ndarray
+            Game id of every move, the moves of a game are contiguous
+        players: numpy.ndarray
+            Player id of every move
+        dice_rolls: numpy.ndarray
+            Number got on the dice in every move
+        positions: numpy.ndarray
+            New position of the player after every move, negative when the roll moved the player out of the board
+        max_nums: numpy.ndarray, int
+            Maximum number on the dice of the game of every move, rewarding one more dice roll
+        """
+        self.__buffer.append(export_columns(game_ids, players, dice_rolls, positions, max_nums))
+        self.__buffered += len(players)
+        self.num_of_moves += len(players)
+        if self.__buffered >= self.row_group_size:
+            self.flush()
+
+    def add_game(self, players, dice_rolls, positions, max_num, game_id=None):
+        """
+        Adds the moves of a finished game.
+
+        Parameters
+        ----------
+        players: numpy.ndarray
+            Player id of every move
+        dice_rolls: numpy.ndarray
+            Number got on the dice in every move
+        positions: numpy.ndarray
+            New position of the player after every move, negative when the roll moved the player out of the board
+        max_num: int
+            Maximum number on the dice the game was played with, rewarding one more dice roll
+        game_id: int
+            Id of the game, default value is the number of games added before it
+        """
+        game_id = self.num_of_games if game_id is None else game_id
+        self.add_moves(repeat(array(game_id, dtype=int64), len(players)), players, dice_rolls, positions, max_num)
+        self.num_of_games += 1
+
+    def add_record(self, record_path, game_id=None):
+        """
+        Adds the moves of a game saved in a record file.
+
+        Parameters
+        ----------
+        record_path: str
+            Path of the record file written by a GameRecorder
+        game_id: int
+            Id of the game, default value is the number of games added before it
+        """
+        reader = GameRecordReader(record_path)
+        moves = concatenate([zeros(0, dtype=RECORD_DTYPE), *reader.batches()])
+        self.add_game(moves['player'], moves['roll'], moves['position'], reader.max_num, game_id)
+
+    def add_archive(self, archive, start=0, stop=None):
+        """
+        Adds a range of archived games, reading at most about a row group of moves from the archive at once.
+
+        The maximum number on the dice of every game is read from the archive index.
+
+        Parameters
+        ----------
+        archive: GameArchive
+            Archive of games, games keep their archive id
+        start: int
+            Id of the first game
+        stop: int
+            Id after the last game, default value is after the last archived game
+        """
+        stop = len(archive) if stop is None else stop
+        ends = (archive.index['offset'] + archive.index['length'])[start:stop]
+        while start < stop:
+            first = int(archive.index['offset'][start])
+            # Whole games only, at least one of them
+            batch_stop = start + max(int(ends.searchsorted(first + self.row_group_size - self.__buffered,
+                                                           side='right')), 1)
+            moves = archive.moves(start, batch_stop)
+            lengths = archive.index['length'][start:batch_stop]
+            self.add_moves(repeat(arange(start, batch_stop, dtype=int64), lengths), moves['player'], moves['roll'],
+                           moves['position'], repeat(archive.index['max_num'][start:batch_stop], lengths))
+            self.num_of_games += batch_stop - start
+            ends = ends[batch_stop - start:]
+            start = batch_stop
+
+    def flush(self):
+        """
+        Writes the buffered moves as a row group.
+        """
+        if not self.__buffered:
+            return
+        pyarrow = self.__pyarrow
+        columns = {name: concatenate([batch[name] for batch in self.__buffer]) for name in EXPORT_COLUMNS}
+        arrays = [pyarrow.array(columns[name], type=self.schema.field(name).type) for name in EXPORT_COLUMNS[:-1]]
+        arrays.append(pyarrow.DictionaryArray.from_arrays(pyarrow.array(columns['event']), self.__events))
+        batch = pyarrow.record_batch(arrays, schema=self.schema)
+        if self.file_format == 'parquet':
+            self.__writer.write_table(pyarrow.Table.from_batches([batch]), row_group_size=len(batch))
+        else:
+            self.__writer.write_batch(batch)
+        self.__buffer = []
+        self.__buffered = 0
+
+    def close(self):
+        """
+        Writes the remaining moves and closes the exported file.
+        """
+        if self.__writer is not None:
+            self.flush()
+            self.__writer.close()
+            self.__writer = None
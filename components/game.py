@@ -1,37 +1,115 @@
-from components.board import Board
-from components.dice import Dice
-from components.stats import GameStats
+from shared.narration import CONSOLE
 from shared.utils import enter_a_valid_number_or_default
-from shared.constants import DEFAULT_BOARD, DEFAULT_DICE
+from shared.constants import DEFAULT_BOARD, DEFAULT_DICE, GAME_ARCHIVE_DIR, GAME_RECORD_FILE
+from shared.exception import BoardException
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, narrator=CONSOLE):
         self.board = None
         self.dice = None
         self.num_of_players = 0
+        self.narrator = narrator
+        self.__checkpoint = None
+
+    @property
+    def checkpoint(self):
+        """
+        Checkpoint of the game in progress, created on first use.
+
+        The game components are built on NumPy, which is slow to import, so they are only loaded once a game is
+        set up or resumed and the menu shows without waiting for them.
+
+        Returns
+        -------
+        GameCheckpoint
+        """
+        if self.__checkpoint is None:
+            from components.checkpoint import GameCheckpoint
+            self.__checkpoint = GameCheckpoint()
+        return self.__checkpoint
 
     def play(self):
         """
-        Game play on the board.
+        Game play on the board, every move is recorded as it happens and the finished game is archived.
+        """
+        self.checkpoint.start(self.board, self.dice)
+        self.__play(player=1, bonus_pending=False)
+
+    def resume(self):
+        """
+        Resumes the interrupted game kept in the checkpoint, from the dice roll it stopped at.
+        """
+        player, bonus_pending = self.checkpoint.restore(narrator=self.narrator)
+        self.board, self.dice = self.checkpoint.board, self.checkpoint.dice
+        self.num_of_players = self.board.num_of_players
+        self.__play(player, bonus_pending)
+
+    def __play(self, player, bonus_pending):
+        """
+        Plays the game from a turn, the moves already played are recorded again in the record file.
+
+        Parameters
+        ----------
+        player: int
+            Id of the player to roll next
+        bonus_pending: bool
+            Whether the next roll is a bonus roll of the same turn
+        """
+        from components.archive import GameArchive
+        from components.recorder import GameRecorder
+
+        with GameRecorder(GAME_RECORD_FILE, num_of_players=self.num_of_players,
+                          win_position=self.board.win_position, max_num=self.dice.max_num) as recorder:
+            recorder.extend(self.checkpoint.moves())
+            self.board.recorder = recorder
+            self.__play_turns(player, bonus_pending)
+        GameArchive(GAME_ARCHIVE_DIR).append_record(GAME_RECORD_FILE)
+        self.checkpoint.clear()
+
+    def __play_turns(self, player, bonus_pending):
+        """
+        Plays the turns of all the players until one of them wins.
+
+        Parameters
+        ----------
+        player: int
+            Id of the player to roll first
+        bonus_pending: bool
+            Whether the first roll is a bonus roll of the turn
         """
+        from components.recorder import OUT_OF_BOARD
+
+        previous_player = (player - 2) % self.num_of_players + 1
+        if not bonus_pending and self.board.history.position(previous_player) == self.board.win_position:
+            # The game was interrupted after its winning move, before it was saved
+            self.board.check_for_victory(previous_player)
+            self.narrator.flush()
+            self.board.save_the_play(self.dice.max_num)
+            return
         while True:
-            for player in range(1, self.num_of_players + 1):
-                print(f"\n>>>> Player {player}'s turn")
-                while True:
-                    roll = input('\tPress enter to roll a dice ')
-                    if roll == '':
-                        dice_roll = self.dice.roll()
-                        print(f'>>>> Player {player} rolled a dice and got {dice_roll}')
-                        player_moved = self.board.move_player(player, dice_roll)
-                        if not self.dice.got_one_more_roll(dice_roll) or not player_moved:
-                            break
-                        print(f'>>>> GREAT! One more turn for Player {player}')
-                    else:
-                        print('>>>> Please roll a dice to move forward')
-                if self.board.check_for_victory(player):
-                    self.board.save_the_play()
-                    return
+            self.narrator.emit('bonus_roll' if bonus_pending else 'turn', player=player)
+            while True:
+                # The narration of the turn so far is written at once, before waiting for the player
+                self.narrator.flush()
+                roll = input('\tPress enter to roll a dice ')
+                if roll == '':
+                    dice_roll = self.dice.roll()
+                    self.narrator.emit('roll', player=player, dice_roll=dice_roll)
+                    player_moved = self.board.move_player(player, dice_roll)
+                    self.checkpoint.record(player, dice_roll,
+                                           self.board.history.position(player) if player_moved else OUT_OF_BOARD)
+                    if not self.dice.got_one_more_roll(dice_roll) or not player_moved:
+                        break
+                    self.narrator.emit('bonus_roll', player=player)
+                else:
+                    self.narrator.emit('roll_prompt')
+            won = self.board.check_for_victory(player)
+            self.narrator.flush()
+            if won:
+                self.board.save_the_play(self.dice.max_num)
+                return
+            player, bonus_pending = player % self.num_of_players + 1, False
 
     def set_board(self, custom=False):
         """
@@ -42,12 +120,29 @@ class Game:
         custom: bool
             Want to set the board manually
         """
+        from components.board import Board
+        from components.board_config import load_board
+
         if custom:
+            config_path = input('\tQ. Board configuration file to load (press enter to configure manually): ').strip()
+            if config_path:
+                try:
+                    self.board = load_board(config_path, num_of_players=self.num_of_players, narrator=self.narrator)
+                    self.narrator.emit('loaded_board', path=config_path, rows=self.board.rows,
+                                       columns=self.board.columns)
+                    self.narrator.emit('board_ready', win_position=self.board.win_position)
+                    self.narrator.flush()
+                    return
+                except (OSError, ValueError):
+                    print(f'\t>>>> Could not read {config_path}, configuring the board manually')
+                except BoardException as e:
+                    print(f'\t>>>> {e.message}, configuring the board manually')
             rows, columns = self.get_num_of_rows_and_columns()
-            self.board = Board(num_of_players=self.num_of_players, rows=rows, columns=columns)
+            self.board = Board(num_of_players=self.num_of_players, rows=rows, columns=columns,
+                               narrator=self.narrator)
             self.board.manual_setup()
         else:
-            self.board = Board(num_of_players=self.num_of_players)
+            self.board = Board(num_of_players=self.num_of_players, narrator=self.narrator)
             self.board.default_setup()
 
     def set_dice(self, custom=False):
@@ -59,11 +154,13 @@ class Game:
         custom: bool
             Want to set the dice manually
         """
+        from components.dice import Dice
+
         if custom:
             min_num, max_num = self.get_min_and_max_for_dice()
-            self.dice = Dice(min_num=min_num, max_num=max_num)
+            self.dice = Dice(min_num=min_num, max_num=max_num, narrator=self.narrator)
         else:
-            self.dice = Dice()
+            self.dice = Dice(narrator=self.narrator)
 
     def set_num_of_players(self):
         """
@@ -133,8 +230,10 @@ class Game:
             print('\t1. Start a game')
             print('\t2. Configure and Play')
             print('\t3. Load last game statistics')
-            print('\t4. Exit')
-            user_selection = input('\nEnter your choice (1-4): ')
+            print('\t4. Resume an interrupted game')
+            print('\t5. Play on a game server')
+            print('\t6. Exit')
+            user_selection = input('\nEnter your choice (1-6): ')
             print()
 
             if user_selection == '1':
@@ -161,12 +260,49 @@ class Game:
                     break
             elif user_selection == '3':
                 print('>>>> Loading last game statistics')
+                # The statistics pull in pandas and the plotting stack, so they are only loaded when asked for
+                from components.stats import GameStats
                 game_stats = GameStats()
-                if game_stats.game_json is None:
+                if game_stats.analytics is None:
                     continue
                 game_stats.load_menu()
                 break
             elif user_selection == '4':
+                if not self.checkpoint.exists():
+                    print('>>>> No interrupted game to resume')
+                    continue
+                print('>>>> Resuming the interrupted game')
+                self.resume()
+                user_selection = input('\nWant to play again (y): ')
+                if user_selection == 'y':
+                    continue
+                else:
+                    break
+            elif user_selection == '5':
+                print('>>>> Playing on a game server')
+                address = input('\tQ. Server address as host:port (press enter to host the game here): ').strip()
+                host, port = None, None
+                if address:
+                    host, _, port = address.rpartition(':')
+                    if not host or not port.isdigit():
+                        print(f'>>>> {address} is not a valid host:port address')
+                        continue
+                    port = int(port)
+                self.set_num_of_players()
+                # The server runs on asyncio, which is only loaded when playing on a server
+                from asyncio import run
+                from components.server import play_on_server
+                try:
+                    run(play_on_server(self.num_of_players, host, port))
+                except OSError as e:
+                    print(f'>>>> Could not play on the server at {address}: {e}')
+                    continue
+                user_selection = input('\nWant to play again (y): ')
+                if user_selection == 'y':
+                    continue
+                else:
+                    break
+            elif user_selection == '6':
                 exit()
             else:
-                print('>>>> Select an available choice between 1 and 4')
\ No newline at end of file
+                print('>>>> Select an available choice between 1 and 6')
\ No newline at end of file
@@ -0,0 +1,172 @@
+from numpy import int32, zeros
+
+
+class MoveHistory:
+    def __init__(self, num_of_players, capacity=64):
+        """
+        Stores the dice rolls and positions of all the players in contiguous integer arrays.
+
+        Every player owns a row of a rolls array and of a positions array. The rows are doubled in length
+        whenever a player runs out of space, so recording a move costs amortized constant time.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players
+        capacity: int
+            Number of rolls every player can record before the arrays are grown
+        """
+        self.num_of_players = num_of_players
+        self.__rolls = zeros((num_of_players, capacity), dtype=int32)
+        self.__positions = zeros((num_of_players, capacity + 1), dtype=int32)
+        self.__num_of_rolls = [0] * num_of_players
+        self.__num_of_positions = [1] * num_of_players
+        self.__current = zeros(num_of_players, dtype=int32)
+
+    def record_roll(self, player, dice_roll):
+        """
+        Records a dice roll of a player.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+        dice_roll: int
+            Number got on rolling the dice
+        """
+        index = player - 1
+        count = self.__num_of_rolls[index]
+        if count == self.__rolls.shape[1]:
+            self.__rolls = self.__grow(self.__rolls)
+        self.__rolls[index, count] = dice_roll
+        self.__num_of_rolls[index] = count + 1
+
+    def record_position(self, player, position):
+        """
+        Records a new position of a player on the board.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+        position: int
+            New position of the player on the board
+        """
+        index = player - 1
+        count = self.__num_of_positions[index]
+        if count == self.__positions.shape[1]:
+            self.__positions = self.__grow(self.__positions)
+        self.__positions[index, count] = position
+        self.__num_of_positions[index] = count + 1
+        self.__current[index] = position
+
+    def extend(self, players, dice_rolls, positions):
+        """
+        Records a sequence of moves at once.
+
+        Parameters
+        ----------
+        players: numpy.ndarray
+            Player id of every move
+        dice_rolls: numpy.ndarray
+            Number got on the dice in every move
+        positions: numpy.ndarray
+            New position of the player after every move, negative when the roll moved the player out of the board
+        """
+        for player in range(1, self.num_of_players + 1):
+            index = player - 1
+            moves = players == player
+            self.__rolls, self.__num_of_rolls[index] = self.__append(
+                self.__rolls, index, self.__num_of_rolls[index], dice_rolls[moves])
+            self.__positions, self.__num_of_positions[index] = self.__append(
+                self.__positions, index, self.__num_of_positions[index], positions[moves & (positions >= 0)])
+            self.__current[index] = self.__positions[index, self.__num_of_positions[index] - 1]
+
+    def clear(self):
+        """
+        Forgets every move, keeping the arrays allocated for the next game.
+        """
+        self.__num_of_rolls = [0] * self.num_of_players
+        self.__num_of_positions = [1] * self.num_of_players
+        self.__current[:] = 0
+
+    @classmethod
+    def __append(cls, data, index, count, values):
+        while count + len(values) > data.shape[1]:
+            data = cls.__grow(data)
+        data[index, count:count + len(values)] = values
+        return data, count + len(values)
+
+    @staticmethod
+    def __grow(data):
+        grown = zeros((data.shape[0], 2 * data.shape[1]), dtype=data.dtype)
+        grown[:, :data.shape[1]] = data
+        return grown
+
+    def position(self, player):
+        """
+        Current position of a player on the board.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+
+        Returns
+        -------
+        int
+        """
+        return int(self.__current[player - 1])
+
+    def current_positions(self):
+        """
+        Current position of every player on the board.
+
+        Returns
+        -------
+        numpy.ndarray
+            Positions indexed by player id minus one
+        """
+        return self.__current.copy()
+
+    def rolls(self, player):
+        """
+        All the dice rolls of a player, as a view valid until the next recorded roll.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        index = player - 1
+        return self.__rolls[index, :self.__num_of_rolls[index]]
+
+    def positions(self, player):
+        """
+        All the positions of a player starting from 0, as a view valid until the next recorded position.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        index = player - 1
+        return self.__positions[index, :self.__num_of_positions[index]]
+
+    def num_of_rolls(self):
+        """
+        Total number of dice rolls recorded for all the players.
+
+        Returns
+        -------
+        int
+        """
+        return sum(self.__num_of_rolls)
@@ -0,0 +1,273 @@
+from bisect import bisect_left
+from functools import wraps
+from json import dumps
+from time import perf_counter
+
+from .board import Board
+from .dice import Dice
+
+# Upper bounds in seconds of the latency histogram buckets, the last bucket counts everything slower
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+METRIC_PREFIX = 'snakes_and_ladders'
+
+# Hot path methods timed while the instrumentation is enabled, with the name of their latency histogram
+TIMED_METHODS = (
+    (Dice, 'roll', 'dice_roll'),
+    (Board, 'move_player', 'board_move_player'),
+    (Board, 'check_for_victory', 'board_check_for_victory'),
+    (Board, 'save_the_play', 'board_save_the_play'),
+)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Histogram of latencies over fixed buckets.
+
+        Parameters
+        ----------
+        buckets: tuple
+            Sorted upper bounds of the buckets in seconds
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds):
+        """
+        Adds a latency to the histogram.
+
+        Parameters
+        ----------
+        seconds: float
+            Measured latency
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def to_dict(self):
+        """
+        Histogram as a dict, the bucket counts are not cumulative.
+
+        Returns
+        -------
+        dict
+        """
+        return {'count': self.count, 'sum': self.total,
+                'buckets': dict(zip([*map(str, self.buckets), '+Inf'], self.counts))}
+
+
+class Instrumentation:
+    def __init__(self):
+        """
+        Counters and latency histograms of the hot paths of a game.
+
+        The instrumented methods are only wrapped while enabled, so a disabled instrumentation costs nothing.
+        """
+        self.enabled = False
+        self.counters = {}
+        self.histograms = {}
+        self.__originals = {}
+
+    def enable(self):
+        """
+        Starts timing the hot path methods and counting the moves.
+        """
+        if self.enabled:
+            return
+        for owner, name, metric in TIMED_METHODS:
+            self.__patch(owner, name, self.__timed(getattr(owner, name), metric))
+        self.__patch(Board, 'advance', self.__counted(Board.advance))
+        self.enabled = True
+
+    def disable(self):
+        """
+        Restores the original methods, the collected statistics are kept.
+        """
+        for (owner, name), method in self.__originals.items():
+            setattr(owner, name, method)
+        self.__originals = {}
+        self.enabled = False
+
+    def reset(self):
+        """
+        Clears the collected statistics.
+        """
+        self.counters = {}
+        self.histograms = {}
+
+    def __patch(self, owner, name, wrapper):
+        self.__originals[(owner, name)] = getattr(owner, name)
+        setattr(owner, name, wrapper)
+
+    def __timed(self, method, metric):
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.observe(metric, perf_counter() - start)
+        return timed
+
+    def __counted(self, advance):
+        @wraps(advance)
+        def counted(board, player, dice_roll):
+            updated_position = board.history.position(player) + dice_roll
+            new_position = advance(board, player, dice_roll)
+            self.count('moves')
+            if new_position is None:
+                self.count('overshoots')
+            elif new_position > updated_position:
+                self.count('ladder_hits')
+            elif new_position < updated_position:
+                self.count('snake_hits')
+            return new_position
+        return counted
+
+    def count(self, name, value=1):
+        """
+        Increments a counter.
+
+        Parameters
+        ----------
+        name: str
+            Name of the counter
+        value: int
+            Increment of the counter
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, seconds):
+        """
+        Adds a latency to a histogram.
+
+        Parameters
+        ----------
+        name: str
+            Name of the histogram
+        seconds: float
+            Measured latency
+        """
+        if name not in self.histograms:
+            self.histograms[name] = LatencyHistogram()
+        self.histograms[name].observe(seconds)
+
+    def rates(self):
+        """
+        Share of the moves hitting a ladder, hitting a snake or overshooting the board.
+
+        Returns
+        -------
+        dict
+        """
+        moves = self.counters.get('moves', 0)
+        return {name: self.counters.get(name, 0) / moves if moves else 0.0
+                for name in ('ladder_hits', 'snake_hits', 'overshoots')}
+
+    def to_dict(self):
+        """
+        Snapshot of the collected statistics.
+
+        Returns
+        -------
+        dict
+        """
+        return {'counters': dict(self.counters), 'rates': self.rates(),
+                'histograms': {name: histogram.to_dict() for name, histogram in self.histograms.items()}}
+
+    def to_json(self):
+        """
+        Snapshot of the collected statistics as JSON.
+
+        Returns
+        -------
+        str
+        """
+        return dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Snapshot of the collected statistics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'# TYPE {METRIC_PREFIX}_{name}_total counter')
+            lines.append(f'{METRIC_PREFIX}_{name}_total {value}')
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f'{METRIC_PREFIX}_{name}_seconds'
+            lines.append(f'# TYPE {metric} histogram')
+            cumulative = 0
+            for bound, count in zip([*map(repr, histogram.buckets), '+Inf'], histogram.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum {histogram.total}')
+            lines.append(f'{metric}_count {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+class ProfileCapture:
+    def __init__(self, profile_file=None, trace_memory=False, top=10):
+        """
+        Captures a cProfile profile and optionally the memory allocations of the code run within it, meant for a
+        single game.
+
+        Parameters
+        ----------
+        profile_file: str
+            File to dump the profile to, readable with pstats, default value keeps it in memory only
+        trace_memory: bool
+            Want to trace the memory allocations with tracemalloc
+        top: int
+            Number of entries shown by the report
+        """
+        self.profile_file = profile_file
+        self.trace_memory = trace_memory
+        self.top = top
+        self.profile = None
+        self.snapshot = None
+
+    def __enter__(self):
+        from cProfile import Profile
+        if self.trace_memory:
+            from tracemalloc import start
+            start()
+        self.profile = Profile()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profile.disable()
+        if self.trace_memory:
+            from tracemalloc import stop, take_snapshot
+            self.snapshot = take_snapshot()
+            stop()
+        if self.profile_file is not None:
+            self.profile.dump_stats(self.profile_file)
+
+    def report(self):
+        """
+        Most expensive functions by cumulative time and, when traced, the lines allocating the most memory.
+
+        Returns
+        -------
+        str
+        """
+        from io import StringIO
+        from pstats import Stats
+        stream = StringIO()
+        Stats(self.profile, stream=stream).sort_stats('cumulative').print_stats(self.top)
+        if self.snapshot is not None:
+            stream.write('Top memory allocations\n')
+            for statistic in self.snapshot.statistics('lineno')[:self.top]:
+                stream.write(f'{statistic}\n')
+        return stream.getvalue()
+
+
+INSTRUMENTATION = Instrumentation()
@@ -1,4 +1,6 @@
 class Ladder:
+    __slots__ = ('bottom', 'top')
+
     def __init__(self, bottom, top):
         """
         Initializes a ladder for the game.
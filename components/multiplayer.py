@@ -0,0 +1,90 @@
+from numpy import arange, flatnonzero, int32, int64, minimum, where, zeros
+from numpy.random import default_rng
+
+
+class MultiplayerGame:
+    def __init__(self, board, dice, seed=None):
+        """
+        Game of many players on a board, with the state of every player kept in NumPy arrays, one entry per player.
+
+        A round is played in a single vectorized step: all the players roll at once, and the players rolling the
+        maximum number roll again until their turns are over. Players do not interact on the board, so the turns
+        of a round only depend on each other through the victory: the first player ending a turn on the win
+        position, in turn order, wins and the players after them do not play the round.
+
+        Parameters
+        ----------
+        board: Board
+            Board to play on, its number of players is used for the game
+        dice: Dice
+            Dice to play with
+        seed: int, numpy.random.SeedSequence
+            Seed for the random number generator, games are reproducible for the same seed
+        """
+        self.num_of_players = board.num_of_players
+        self.win_position = board.win_position
+        self.jumps = board.jumps.copy()
+        self.min_num, self.max_num = dice.min_num, dice.max_num
+        self.rng = default_rng(seed)
+        self.positions = zeros(self.num_of_players, dtype=int32)
+        self.roll_counts = zeros(self.num_of_players, dtype=int64)
+        self.bonus_rolls = zeros(self.num_of_players, dtype=int64)
+        self.rounds = 0
+        self.winner = 0
+
+    def play_round(self):
+        """
+        Plays a round, every player taking a turn in order until one of them wins.
+
+        Returns
+        -------
+        int
+            Id of the winning player, 0 if nobody won yet
+        """
+        if self.winner:
+            return self.winner
+        positions = self.positions.copy()
+        rolls = zeros(self.num_of_players, dtype=int32)
+        bonus_rolls = zeros(self.num_of_players, dtype=int32)
+        # Players still rolling in their turn, one more roll each for every step of the longest bonus chain
+        rolling = arange(self.num_of_players)
+        while len(rolling):
+            dice_rolls = self.rng.integers(self.min_num, self.max_num, size=len(rolling), endpoint=True,
+                                           dtype=int32)
+            current_positions = positions[rolling]
+            updated_positions = current_positions + dice_rolls
+            moved = updated_positions <= self.win_position
+            positions[rolling] = where(moved, self.jumps[minimum(updated_positions, self.win_position)],
+                                       current_positions)
+            rolls[rolling] += 1
+            rolling = rolling[moved & (dice_rolls == self.max_num)]
+            bonus_rolls[rolling] += 1
+
+        # Turns after the first winning one are never played
+        winners = flatnonzero(positions == self.win_position)
+        played = winners[0] + 1 if len(winners) else self.num_of_players
+        self.positions[:played] = positions[:played]
+        self.roll_counts[:played] += rolls[:played]
+        self.bonus_rolls[:played] += bonus_rolls[:played]
+        self.rounds += 1
+        if len(winners):
+            self.winner = int(winners[0]) + 1
+        return self.winner
+
+    def play(self, max_rounds=None):
+        """
+        Plays rounds until a player wins.
+
+        Parameters
+        ----------
+        max_rounds: int
+            Number of rounds after which the game is stopped, default value is to play until a player wins
+
+        Returns
+        -------
+        int
+            Id of the winning player, 0 if the game was stopped before anybody won
+        """
+        while not self.winner and self.rounds != max_rounds:
+            self.play_round()
+        return self.winner
@@ -0,0 +1,260 @@
+from concurrent.futures import ProcessPoolExecutor
+from math import exp
+from os import cpu_count
+from random import Random
+from time import perf_counter
+
+from numpy import arange
+
+from .analytics import MarkovAnalysis
+from .board_config import build_board
+from .dice import Dice
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+
+class OptimizationResult:
+    def __init__(self, board_config, score, mean_rounds, variance, evaluations, seconds):
+        """
+        Best board found by an optimization.
+
+        Parameters
+        ----------
+        board_config: dict
+            Configuration of the best board, shaped like ``DEFAULT_BOARD``
+        score: float
+            Distance of the best board to the targets, 0 is a perfect match
+        mean_rounds: float
+            Expected number of rounds of a game on the best board
+        variance: float
+            Variance of the number of rounds of a game on the best board
+        evaluations: int
+            Number of boards evaluated
+        seconds: float
+            Time taken by the optimization
+        """
+        self.board_config = board_config
+        self.score = score
+        self.mean_rounds = mean_rounds
+        self.variance = variance
+        self.evaluations = evaluations
+        self.seconds = seconds
+
+    @property
+    def evaluations_per_second(self):
+        """
+        Number of boards evaluated per second.
+
+        Returns
+        -------
+        float
+        """
+        return self.evaluations / self.seconds if self.seconds else 0.0
+
+
+def board_analysis(board_config, dice_config, num_of_players, tolerance=1e-12):
+    """
+    Markov analysis of a board built from its configuration, played with a dice.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    dice_config: dict
+        Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+    num_of_players: int
+        Number of players in every game
+    tolerance: float
+        Probability mass below which the remaining turns are ignored
+
+    Returns
+    -------
+    MarkovAnalysis
+    """
+    board = build_board(board_config, num_of_players, narrator=NULL_SINK)
+    dice = Dice(min_num=dice_config['min'], max_num=dice_config['max'], narrator=NULL_SINK)
+    return MarkovAnalysis(board, dice, tolerance=tolerance)
+
+
+def round_moments(rounds):
+    """
+    Mean and variance of the number of rounds of a game.
+
+    Parameters
+    ----------
+    rounds: numpy.ndarray
+        Probability of a game lasting every number of rounds
+
+    Returns
+    -------
+    (float, float)
+        mean and variance of the number of rounds
+    """
+    num_of_rounds = arange(len(rounds))
+    mean = float((rounds * num_of_rounds).sum())
+    return mean, float((rounds * num_of_rounds ** 2).sum()) - mean ** 2
+
+
+def evaluate_board(board_config, dice_config, num_of_players):
+    """
+    Computes the exact mean and variance of the number of rounds of a game on a board.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    dice_config: dict
+        Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+    num_of_players: int
+        Number of players in every game
+
+    Returns
+    -------
+    (float, float)
+        mean and variance of the number of rounds
+    """
+    analysis = board_analysis(board_config, dice_config, num_of_players, tolerance=1e-9)
+    return round_moments(analysis.round_distribution(num_of_players))
+
+
+class BoardOptimizer:
+    def __init__(self, dice_config, num_of_players, target_rounds, target_variance=None, variance_weight=1.0,
+                 seed=None, workers=None, proposals=None):
+        """
+        Searches placements of ladders and snakes for a target game length with simulated annealing.
+
+        Every step moves one end of a random ladder or snake to a random cell, a batch of such moves is proposed
+        and evaluated at once over a pool of processes, and the best of them is accepted or rejected like a single
+        annealing move. Boards are scored exactly with a Markov analysis, so no game is played.
+
+        Parameters
+        ----------
+        dice_config: dict
+            Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+        num_of_players: int
+            Number of players in every game
+        target_rounds: float
+            Target expected number of rounds of a game
+        target_variance: float
+            Target variance of the number of rounds, default value only targets the expected number of rounds
+        variance_weight: float
+            Weight of the variance against the expected number of rounds in the score
+        seed: int
+            Seed for the random number generator, the search is reproducible for the same seed
+        workers: int
+            Number of processes evaluating the proposals, default value is the number of cores
+        proposals: int
+            Number of moves proposed at every step, default value is the number of workers
+        """
+        self.dice_config = dice_config
+        self.num_of_players = num_of_players
+        self.target_rounds = target_rounds
+        self.target_variance = target_variance
+        self.variance_weight = variance_weight
+        self.rng = Random(seed)
+        self.workers = workers or cpu_count()
+        self.proposals = proposals or self.workers
+
+    def score(self, mean_rounds, variance):
+        """
+        Relative squared distance of a board to the targets.
+
+        Parameters
+        ----------
+        mean_rounds: float
+            Expected number of rounds of a game on the board
+        variance: float
+            Variance of the number of rounds of a game on the board
+
+        Returns
+        -------
+        float
+        """
+        score = ((mean_rounds - self.target_rounds) / self.target_rounds) ** 2
+        if self.target_variance is not None:
+            score += self.variance_weight * ((variance - self.target_variance) / self.target_variance) ** 2
+        return score
+
+    def propose(self, board_config, max_attempts=100):
+        """
+        Moves one end of a random ladder or snake of a board to a random cell, keeping the board valid.
+
+        Parameters
+        ----------
+        board_config: dict
+            Configuration of the board, shaped like ``DEFAULT_BOARD``
+        max_attempts: int
+            Number of moves tried before giving up
+
+        Returns
+        -------
+        dict
+            Configuration of the moved board, the same board if no valid move was found
+        """
+        win_position = board_config['num_of_rows'] * board_config['num_of_columns']
+        kinds = [kind for kind in ('ladders', 'snakes') if board_config[kind]]
+        if not kinds or win_position < 4:
+            return board_config
+        for _ in range(max_attempts):
+            kind = self.rng.choice(kinds)
+            entities = list(board_config[kind])
+            index = self.rng.randrange(len(entities))
+            ends = list(entities[index])
+            ends[self.rng.randrange(2)] = self.rng.randint(2, win_position - 1)
+            low, high = min(ends), max(ends)
+            entities[index] = (low, high) if kind == 'ladders' else (high, low)
+            candidate = {**board_config, kind: entities}
+            try:
+                build_board(candidate, num_of_players=1, narrator=NULL_SINK)
+            except BoardException:
+                continue
+            return candidate
+        return board_config
+
+    def optimize(self, board_config, steps=200, temperature=0.01, cooling=0.98):
+        """
+        Searches a board close to the targets, starting from a valid board.
+
+        Parameters
+        ----------
+        board_config: dict
+            Configuration of the starting board, shaped like ``DEFAULT_BOARD``
+        steps: int
+            Number of annealing steps
+        temperature: float
+            Starting temperature, the probability of accepting a worse board scales with exp(-loss / temperature)
+        cooling: float
+            Factor applied to the temperature after every step
+
+        Returns
+        -------
+        OptimizationResult
+        """
+        start = perf_counter()
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            current = board_config
+            current_stats = evaluate_board(current, self.dice_config, self.num_of_players)
+            current_score = self.score(*current_stats)
+            best, best_stats, best_score = current, current_stats, current_score
+            evaluations = 1
+            for _ in range(steps):
+                candidates = [self.propose(current) for _ in range(self.proposals)]
+                arguments = ([self.dice_config] * len(candidates), [self.num_of_players] * len(candidates))
+                if executor is None:
+                    candidate_stats = list(map(evaluate_board, candidates, *arguments))
+                else:
+                    candidate_stats = list(executor.map(evaluate_board, candidates, *arguments))
+                evaluations += len(candidates)
+                scores = [self.score(*stats) for stats in candidate_stats]
+                chosen = min(range(len(candidates)), key=scores.__getitem__)
+                loss = scores[chosen] - current_score
+                if loss <= 0 or self.rng.random() < exp(-loss / temperature):
+                    current, current_stats, current_score = candidates[chosen], candidate_stats[chosen], scores[chosen]
+                    if current_score < best_score:
+                        best, best_stats, best_score = current, current_stats, current_score
+                temperature *= cooling
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return OptimizationResult(best, best_score, best_stats[0], best_stats[1], evaluations, perf_counter() - start)
@@ -0,0 +1,346 @@
+from heapq import heappop, heappush
+from os import path as os_path, replace
+from struct import Struct
+
+from numpy import arange, concatenate, full, int32, int64, iinfo, lexsort, memmap, nonzero, ones, stack, uint8
+
+UNREACHABLE = iinfo(int64).max
+# A cached index is a header, followed by the distances and shortest path trees from the start and to the victory
+REACHABILITY_MAGIC = b'SNLRCH01'
+REACHABILITY_HEADER = Struct('<8siii')
+
+
+class ReachabilityIndex:
+    def __init__(self, board, dice, cache_path=None):
+        """
+        Index of what a player can do on a board: where ladders and snakes finally lead, which cells can be stood
+        on and the minimum number of turns to win from every cell.
+
+        Cells are the nodes of a graph with an edge for every roll, to the final position after following the
+        ladders and snakes. Rolls ending the turn weigh a turn, while rolling the maximum number on the dice keeps
+        the turn going and only weighs a tie breaker, so a shortest path is counted in turns. An extra node stands
+        for the victory, reached by ending a turn on the win position. The distances from the start and to the
+        victory are computed once, and repaired around the changed cells when ladders or snakes are added.
+
+        Parameters
+        ----------
+        board: Board
+            Board to index
+        dice: Dice
+            Dice to play with
+        cache_path: str
+            File the distances are read from with a single memory mapped read when it holds them, and written to
+            once computed otherwise, default value computes them without caching them
+        """
+        self.board = board
+        self.min_num = dice.min_num
+        self.max_num = dice.max_num
+        self.win_position = board.win_position
+        self.victory = self.win_position + 1
+        # A turn weighs more than any number of rolls within turns, so distances are exact integers
+        self.turn = self.win_position + 2
+        # Ladders and snakes are validated so none starts where another ends, a landing position leads to its final
+        # position at once
+        self.destinations = board.jumps.astype(int32)
+        self.__landings = {}
+        for landing in nonzero(self.destinations != arange(self.win_position + 1))[0].tolist():
+            self.__landings.setdefault(int(self.destinations[landing]), []).append(landing)
+        if cache_path is None or not self.__load(cache_path):
+            self.__build()
+            if cache_path is not None:
+                self.__save(cache_path)
+
+    def __header(self):
+        return REACHABILITY_HEADER.pack(REACHABILITY_MAGIC, self.win_position, self.min_num, self.max_num)
+
+    def __load(self, cache_path):
+        """
+        Maps the distances cached for the same board and dice, copied on write so repairs stay in memory.
+
+        Parameters
+        ----------
+        cache_path: str
+            File of the cached distances
+
+        Returns
+        -------
+        bool
+            Whether the file held the distances of the board and dice
+        """
+        if not os_path.exists(cache_path):
+            return False
+        data = memmap(cache_path, dtype=uint8, mode='c')
+        size = REACHABILITY_HEADER.size
+        if bytes(data[:size]) != self.__header() or len(data) != size + 4 * 8 * (self.victory + 1):
+            return False
+        self.__from_start, self.__parents, self.__to_victory, self.__nexts = data[size:].view(int64).reshape(4, -1)
+        return True
+
+    def __save(self, cache_path):
+        temp_path = f'{cache_path}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(self.__header())
+            file.write(stack([self.__from_start, self.__parents, self.__to_victory, self.__nexts]).astype('<i8')
+                       .tobytes())
+        replace(temp_path, cache_path)
+
+    def __build(self):
+        """
+        Computes the distances from the start and to the victory of every cell, with their shortest path trees.
+        """
+        # SciPy is only needed to build the index, so it is not loaded with the game
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import dijkstra
+
+        num_of_nodes = self.victory + 1
+        standing = nonzero(self.destinations == arange(self.win_position + 1))[0]
+        sources, targets, weights = [], [], []
+        for dice_roll in range(self.min_num, self.max_num + 1):
+            landings = standing + dice_roll
+            moved = landings <= self.win_position
+            moved[standing == self.win_position] = False
+            finals = self.destinations[landings[moved]].astype(int64)
+            if dice_roll != self.max_num:
+                finals[finals == self.win_position] = self.victory
+            sources.append(standing[moved])
+            targets.append(finals)
+            weights.append(full(len(finals), 1 if dice_roll == self.max_num else self.turn, dtype=int64))
+        sources.append([self.win_position])
+        targets.append([self.victory])
+        weights.append([self.turn])
+        sources, targets, weights = concatenate(sources), concatenate(targets), concatenate(weights)
+        # Rolls leading to the same cell are a single edge, with the lightest weight
+        order = lexsort((weights, targets, sources))
+        sources, targets, weights = sources[order], targets[order], weights[order]
+        first = ones(len(order), dtype=bool)
+        first[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+        graph = csr_matrix((weights[first], (sources[first], targets[first])), shape=(num_of_nodes, num_of_nodes))
+
+        self.__from_start, self.__parents = self.__distances(dijkstra(graph, indices=0, return_predecessors=True))
+        self.__to_victory, self.__nexts = self.__distances(dijkstra(graph.T.tocsr(), indices=self.victory,
+                                                                    return_predecessors=True))
+
+    @staticmethod
+    def __distances(shortest_paths):
+        distances, predecessors = shortest_paths
+        reached = distances != float('inf')
+        exact = full(len(distances), UNREACHABLE, dtype=int64)
+        exact[reached] = distances[reached].astype(int64)
+        return exact, predecessors.astype(int64)
+
+    def __is_standing(self, cell):
+        return cell <= self.win_position and self.destinations[cell] == cell
+
+    def __successors(self, cell, destinations=None):
+        """
+        Cells a player standing on a cell ends up on with every roll, with the weight of the roll.
+
+        Parameters
+        ----------
+        cell: int
+            Position of the player
+        destinations: numpy.ndarray
+            Final position indexed by the landing position, default value is the current one
+
+        Returns
+        -------
+        dict
+            Weight of the lightest roll indexed by the final position
+        """
+        destinations = self.destinations if destinations is None else destinations
+        successors = {}
+        if cell == self.win_position:
+            successors[self.victory] = self.turn
+        elif cell < self.win_position and destinations[cell] == cell:
+            for dice_roll in range(self.min_num, min(self.max_num, self.win_position - cell) + 1):
+                final = int(destinations[cell + dice_roll])
+                weight = 1 if dice_roll == self.max_num else self.turn
+                if final == self.win_position and weight == self.turn:
+                    final = self.victory
+                successors[final] = min(weight, successors.get(final, weight))
+        return successors
+
+    def __predecessors(self, cell):
+        """
+        Cells a player can stand on to end up on a cell with a single roll, with the weight of the lightest roll.
+
+        Parameters
+        ----------
+        cell: int
+            Final position
+
+        Returns
+        -------
+        dict
+            Weight of the lightest roll indexed by the starting position
+        """
+        final = self.win_position if cell == self.victory else cell
+        landings = self.__landings.get(final, [])
+        if self.__is_standing(final):
+            landings = [final, *landings]
+        predecessors = {}
+        for landing in landings:
+            for dice_roll in range(self.min_num, self.max_num + 1):
+                source = landing - dice_roll
+                weight = 1 if dice_roll == self.max_num else self.turn
+                if source < 0 or not self.__is_standing(source) or source == self.win_position:
+                    continue
+                if final == self.win_position and (weight == self.turn) != (cell == self.victory):
+                    continue
+                predecessors[source] = min(weight, predecessors.get(source, weight))
+        if cell == self.victory:
+            predecessors[self.win_position] = self.turn
+        return predecessors
+
+    def update(self, landings):
+        """
+        Repairs the index after ladders or snakes were added from free landing positions, only recomputing the
+        cells whose shortest paths went through the changed rolls.
+
+        Parameters
+        ----------
+        landings: list
+            Landing positions of the added ladders and snakes
+        """
+        old_destinations = self.destinations.copy()
+        changed = {int(landing) for landing in landings}
+        for landing in changed:
+            final = int(self.board.jumps[landing])
+            self.destinations[landing] = final
+            self.__landings.setdefault(final, []).append(landing)
+
+        # Standing cells rolling onto a changed landing, and the changed landings no longer stood on
+        rolled = {landing - dice_roll for landing in changed for dice_roll in range(self.min_num, self.max_num + 1)}
+        sources = {cell for cell in rolled if cell >= 0 and old_destinations[cell] == cell} | changed
+        old_successors = {source: self.__successors(source, old_destinations) for source in sources}
+        new_successors = {source: self.__successors(source) for source in sources}
+        self.__repair_from_start(old_successors, new_successors)
+        self.__repair_to_victory(new_successors)
+
+    def __repair_from_start(self, old_successors, new_successors):
+        distances, parents = self.__from_start, self.__parents
+        roots = [cell for source, successors in old_successors.items() for cell, weight in successors.items()
+                 if parents[cell] == source and new_successors[source].get(cell) != weight]
+
+        def children(cell):
+            successors = new_successors[cell] if cell in new_successors else self.__successors(cell)
+            candidates = list(successors) + list(old_successors.get(cell, ()))
+            return [child for child in candidates if parents[child] == cell]
+
+        invalid = self.__subtree(roots, children)
+        for cell in invalid:
+            distances[cell], parents[cell] = UNREACHABLE, -1
+        queue = []
+        for cell in invalid:
+            for source, weight in self.__predecessors(cell).items():
+                self.__relax(queue, distances, parents, source, cell, weight)
+        for source, successors in new_successors.items():
+            for cell, weight in successors.items():
+                self.__relax(queue, distances, parents, source, cell, weight)
+        self.__propagate(queue, distances, parents, lambda cell: self.__successors(cell).items())
+
+    def __repair_to_victory(self, new_successors):
+        distances, nexts = self.__to_victory, self.__nexts
+        roots = []
+        for source, successors in new_successors.items():
+            following = int(nexts[source])
+            if following >= 0 and (following not in successors or
+                                   distances[source] != successors[following] + distances[following]):
+                roots.append(source)
+
+        def children(cell):
+            candidates = list(self.__predecessors(cell)) + list(new_successors)
+            return [child for child in candidates if nexts[child] == cell]
+
+        invalid = self.__subtree(roots, children)
+        for cell in invalid:
+            distances[cell], nexts[cell] = UNREACHABLE, -1
+        queue = []
+        for cell in invalid | set(new_successors):
+            for final, weight in self.__successors(cell).items():
+                self.__relax(queue, distances, nexts, final, cell, weight)
+        self.__propagate(queue, distances, nexts, lambda cell: self.__predecessors(cell).items())
+
+    @staticmethod
+    def __subtree(roots, children):
+        subtree = set()
+        pending = list(roots)
+        while pending:
+            cell = pending.pop()
+            if cell not in subtree:
+                subtree.add(cell)
+                pending.extend(children(cell))
+        return subtree
+
+    @staticmethod
+    def __relax(queue, distances, parents, source, cell, weight):
+        if distances[source] == UNREACHABLE:
+            return
+        distance = int(distances[source]) + weight
+        if distance < distances[cell]:
+            distances[cell], parents[cell] = distance, source
+            heappush(queue, (distance, cell))
+
+    @classmethod
+    def __propagate(cls, queue, distances, parents, neighbours):
+        while queue:
+            distance, cell = heappop(queue)
+            if distance != distances[cell]:
+                continue
+            for neighbour, weight in neighbours(cell):
+                cls.__relax(queue, distances, parents, cell, neighbour, weight)
+
+    @property
+    def reachable(self):
+        """
+        Bitmap of the positions a player can stand on, starting from 0.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        reachable = self.__from_start[:self.victory] != UNREACHABLE
+        # Ending a turn on the win position reaches the victory rather than the win position
+        reachable[self.win_position] |= self.__from_start[self.victory] != UNREACHABLE
+        return reachable
+
+    @property
+    def min_turns(self):
+        """
+        Minimum number of turns to win for a player starting a turn on every position, -1 where the game can no
+        longer be won and 0 on the win position. Landing positions of ladders and snakes take the value of their
+        final position.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        to_victory = self.__to_victory[self.destinations]
+        turns = full(self.victory, -1, dtype=int32)
+        winnable = to_victory != UNREACHABLE
+        turns[winnable] = to_victory[winnable] // self.turn
+        turns[self.destinations == self.win_position] = 0
+        return turns
+
+    def dead_cells(self):
+        """
+        Positions no player can ever stand on, leaving out the landing positions of ladders and snakes.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return nonzero(~self.reachable & (self.destinations == arange(self.victory)))[0]
+
+    def traps(self):
+        """
+        Positions a player can stand on, but can no longer win from.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return nonzero(self.reachable & (self.__to_victory[:self.victory] == UNREACHABLE))[0]
+
+    def __getitem__(self, position):
+        return int(self.destinations[position])
@@ -0,0 +1,173 @@
+from array import array
+from os import fsync
+from struct import Struct
+
+from numpy import dtype, frombuffer
+
+from .history import MoveHistory
+
+# A record file starts with a header, followed by one fixed size record per dice roll
+RECORD_MAGIC = b'SNLREC01'
+RECORD_HEADER = Struct('<8siii')
+RECORD_DTYPE = dtype([('player', '<i4'), ('roll', '<i4'), ('position', '<i4')])
+OUT_OF_BOARD = -1
+
+
+class GameRecorder:
+    def __init__(self, path, num_of_players, win_position, max_num, batch_size=64, sync=False):
+        """
+        Appends every move of a game to a binary record file as it happens.
+
+        Moves are buffered and written in batches, a crash loses at most the moves of the last unwritten batch.
+
+        Parameters
+        ----------
+        path: str
+            Path of the record file, overwritten if it already exists
+        num_of_players: int
+            Number of players
+        win_position: int
+            Win position of the board
+        max_num: int
+            Maximum number on the dice, rewarding one more dice roll
+        batch_size: int
+            Number of moves written to the file at once
+        sync: bool
+            Whether every batch is also synced to the disk, default value is to leave it to the operating system
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.sync = sync
+        self.__buffer = array('i')
+        self.__file = open(path, 'wb')
+        self.__file.write(RECORD_HEADER.pack(RECORD_MAGIC, num_of_players, win_position, max_num))
+        self.__file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record(self, player, dice_roll, position=OUT_OF_BOARD):
+        """
+        Records a move of a player.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+        dice_roll: int
+            Number got on rolling the dice
+        position: int
+            New position of the player, default value is for a roll moving the player out of the board
+        """
+        self.__buffer.extend((player, dice_roll, position))
+        if len(self.__buffer) >= 3 * self.batch_size:
+            self.flush()
+
+    def extend(self, moves):
+        """
+        Records a sequence of moves at once, like the moves of a resumed game.
+
+        Parameters
+        ----------
+        moves: numpy.ndarray
+            Structured array of the player, roll and position of every move
+        """
+        self.__buffer.frombytes(moves.astype(RECORD_DTYPE).tobytes())
+        if len(self.__buffer) >= 3 * self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered moves to the record file.
+        """
+        if self.__buffer:
+            self.__file.write(self.__buffer.tobytes())
+            del self.__buffer[:]
+        self.__file.flush()
+        if self.sync:
+            fsync(self.__file.fileno())
+
+    def close(self):
+        """
+        Writes the remaining moves and closes the record file.
+        """
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+
+class GameRecordReader:
+    def __init__(self, path, data=None):
+        """
+        Reads a record file written by a GameRecorder, a batch of moves at a time.
+
+        Parameters
+        ----------
+        path: str
+            Path of the record file
+        data: bytes
+            Content of the record file already read, default value reads the moves from the file
+        """
+        self.path = path
+        self.data = data
+        if data is None:
+            with open(path, 'rb') as file:
+                header = file.read(RECORD_HEADER.size)
+        else:
+            header = data[:RECORD_HEADER.size]
+        if len(header) != RECORD_HEADER.size or header[:len(RECORD_MAGIC)] != RECORD_MAGIC:
+            raise ValueError(f'{path} is not a game record file')
+        _, self.num_of_players, self.win_position, self.max_num = RECORD_HEADER.unpack(header)
+
+    def batches(self, batch_size=65536):
+        """
+        Iterates over the recorded moves.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of moves read at once
+
+        Yields
+        ------
+        numpy.ndarray
+            Structured array of the player, roll and position of every move in the batch
+        """
+        if self.data is not None:
+            # A partially written record at the end of the file is left out
+            count = (len(self.data) - RECORD_HEADER.size) // RECORD_DTYPE.itemsize
+            moves = frombuffer(self.data, dtype=RECORD_DTYPE, count=count, offset=RECORD_HEADER.size)
+            for start in range(0, count, batch_size):
+                yield moves[start:start + batch_size]
+            return
+        with open(self.path, 'rb') as file:
+            file.seek(RECORD_HEADER.size)
+            while True:
+                data = file.read(batch_size * RECORD_DTYPE.itemsize)
+                # A partially written record at the end of the file is left out
+                moves = frombuffer(data, dtype=RECORD_DTYPE, count=len(data) // RECORD_DTYPE.itemsize)
+                if len(moves):
+                    yield moves
+                if len(data) < batch_size * RECORD_DTYPE.itemsize:
+                    return
+
+    def to_history(self, batch_size=65536):
+        """
+        Loads the recorded moves in a move history.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of moves read at once
+
+        Returns
+        -------
+        MoveHistory
+        """
+        history = MoveHistory(num_of_players=self.num_of_players)
+        for moves in self.batches(batch_size):
+            history.extend(moves['player'], moves['roll'], moves['position'])
+        return history
@@ -0,0 +1,172 @@
+from sys import stdout
+
+from numpy import arange, full, int32
+
+from .board import LADDER_BOTTOM, SNAKE_MOUTH
+
+
+class BoardRenderer:
+    def __init__(self, board, viewport_rows=10, viewport_columns=10, cell_width=7):
+        """
+        Draws a board on the terminal, only the cells of a viewport scrolled around the active player.
+
+        Cells are numbered in a serpentine from the bottom left corner, the first row going right, the second one
+        going left and so on. Ladder bottoms are marked with ^ and snake mouths with v.
+
+        Parameters
+        ----------
+        board: Board
+            Board to draw
+        viewport_rows: int
+            Number of rows shown at once
+        viewport_columns: int
+            Number of columns shown at once
+        cell_width: int
+            Number of characters of a cell
+        """
+        self.board = board
+        self.viewport_rows = min(viewport_rows, board.rows)
+        self.viewport_columns = min(viewport_columns, board.columns)
+        self.cell_width = cell_width
+        self.top = 0
+        self.left = 0
+
+        # Screen coordinates of every cell, counting rows from the top, cell 0 is off the board
+        cells = arange(board.win_position)
+        from_bottom = cells // board.columns
+        along = cells % board.columns
+        self.cell_rows = full(board.win_position + 1, -1, dtype=int32)
+        self.cell_columns = full(board.win_position + 1, -1, dtype=int32)
+        self.cell_rows[1:] = board.rows - 1 - from_bottom
+        self.cell_columns[1:] = along + (from_bottom % 2) * (board.columns - 1 - 2 * along)
+        self.grid = full((board.rows, board.columns), 0, dtype=int32)
+        self.grid[self.cell_rows[1:], self.cell_columns[1:]] = cells + 1
+
+        self.__shown = None
+        self.__shown_at = None
+        self.__positions = None
+
+    def cell_coordinates(self, cell):
+        """
+        Screen coordinates of a cell, counting rows from the top of the board.
+
+        Parameters
+        ----------
+        cell: int
+            Position on the board
+
+        Returns
+        -------
+        (int, int)
+            row and column of the cell
+        """
+        return int(self.cell_rows[cell]), int(self.cell_columns[cell])
+
+    def follow(self, player):
+        """
+        Scrolls the viewport to keep a player in it, centring the player once outside of it.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+        """
+        cell = self.board.history.position(player)
+        row, column = self.cell_coordinates(max(cell, 1))
+        if not self.top <= row < self.top + self.viewport_rows:
+            self.top = min(max(row - self.viewport_rows // 2, 0), self.board.rows - self.viewport_rows)
+        if not self.left <= column < self.left + self.viewport_columns:
+            self.left = min(max(column - self.viewport_columns // 2, 0), self.board.columns - self.viewport_columns)
+
+    def __label(self, cell, players, flags):
+        if players:
+            label = f'P{players[0]}' + ('+' if len(players) > 1 else '')
+        else:
+            label = f"{cell}{'^' if flags & LADDER_BOTTOM else 'v' if flags & SNAKE_MOUTH else ''}"
+        return label[-self.cell_width:].rjust(self.cell_width)
+
+    def __players_by_cell(self, positions):
+        players_by_cell = {}
+        for player, cell in enumerate(positions.tolist(), 1):
+            players_by_cell.setdefault(cell, []).append(player)
+        return players_by_cell
+
+    def frame(self):
+        """
+        Text of the whole viewport.
+
+        Returns
+        -------
+        str
+        """
+        players_by_cell = self.__players_by_cell(self.board.current_positions)
+        return '\n'.join(''.join(self.__label(cell, players_by_cell.get(cell), flags) for cell, flags in row)
+                         for row in self.__viewport())
+
+    def __viewport(self):
+        """
+        Cells of the viewport with their occupancy flags, row by row.
+
+        Returns
+        -------
+        list
+        """
+        cells = self.grid[self.top:self.top + self.viewport_rows, self.left:self.left + self.viewport_columns]
+        return [list(zip(row_cells, row_flags))
+                for row_cells, row_flags in zip(cells.tolist(), self.board.occupancy[cells].tolist())]
+
+    def changes(self):
+        """
+        Cells of the viewport which changed since the last call, every cell of it after scrolling.
+
+        Only the cells left or reached by a player are checked between two calls on the same viewport.
+
+        Returns
+        -------
+        list
+            Row and column in the viewport and new text of every changed cell
+        """
+        positions = self.board.current_positions
+        players_by_cell = self.__players_by_cell(positions)
+        changed = []
+        if self.__shown_at != (self.top, self.left):
+            self.__shown_at = (self.top, self.left)
+            self.__shown = {}
+            for row, cells in enumerate(self.__viewport()):
+                for column, (cell, flags) in enumerate(cells):
+                    label = self.__label(cell, players_by_cell.get(cell), flags)
+                    self.__shown[(row, column)] = label
+                    changed.append((row, column, label))
+        else:
+            for cell in set(self.__positions.tolist()) | set(players_by_cell):
+                if cell == 0:
+                    continue
+                row, column = int(self.cell_rows[cell]) - self.top, int(self.cell_columns[cell]) - self.left
+                if not (0 <= row < self.viewport_rows and 0 <= column < self.viewport_columns):
+                    continue
+                label = self.__label(cell, players_by_cell.get(cell), self.board.occupancy[cell])
+                if self.__shown[(row, column)] != label:
+                    self.__shown[(row, column)] = label
+                    changed.append((row, column, label))
+        self.__positions = positions
+        return changed
+
+    def draw(self, stream=None):
+        """
+        Draws the changed cells of the viewport on a terminal, moving the cursor with ANSI escape codes.
+
+        Parameters
+        ----------
+        stream: io.TextIOBase
+            Terminal to draw on, default value is the standard output
+
+        Returns
+        -------
+        int
+            Number of drawn cells
+        """
+        changed = self.changes()
+        if changed:
+            (stream or stdout).write(''.join(f'\x1b[{row + 1};{column * self.cell_width + 1}H{label}'
+                                             for row, column, label in changed))
+        return len(changed)
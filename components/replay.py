@@ -0,0 +1,189 @@
+from bisect import bisect_right
+
+from numpy import arange, argsort, array, concatenate, int32, maximum, minimum, nonzero, repeat, where, zeros
+
+from .recorder import OUT_OF_BOARD
+
+
+class GameReplay:
+    def __init__(self, board, dice, checkpoint_interval=64):
+        """
+        Replays recorded games on a board, and audits recorded moves against the rules.
+
+        Parameters
+        ----------
+        board: Board
+            Board the games were played on
+        dice: Dice
+            Dice the games were played with
+        checkpoint_interval: int
+            Number of turns between two checkpoints of the players' positions
+        """
+        self.num_of_players = board.num_of_players
+        self.win_position = board.win_position
+        self.max_num = dice.max_num
+        self.checkpoint_interval = checkpoint_interval
+        self.jumps = board.jump_table()
+        self.__jump_list = self.jumps.tolist()
+        self.players = zeros(0, dtype=int32)
+        self.positions = zeros(0, dtype=int32)
+        self.winner = 0
+        self.__checkpoints = []
+        self.__checkpoint_turns = []
+        self.__dice_rolls = []
+
+    def replay(self, dice_rolls):
+        """
+        Replays a game from its dice rolls, checkpointing the positions every few turns.
+
+        Parameters
+        ----------
+        dice_rolls: list
+            Every dice roll of the game, in the order they were rolled
+
+        Returns
+        -------
+        list
+            Final position of every player, starting from the first player at index 0
+        """
+        self.__dice_rolls = list(dice_rolls)
+        self.__checkpoints, self.__checkpoint_turns = [], []
+        players, new_positions = [], []
+        positions, player, turn, winner = self.__play(self.__dice_rolls, 0, [0] * self.num_of_players, 0, 0,
+                                                      players, new_positions)
+        self.players = array(players, dtype=int32)
+        self.positions = array(new_positions, dtype=int32)
+        self.winner = winner
+        return positions
+
+    def __play(self, dice_rolls, start, positions, player, turn, players=None, new_positions=None, stop_turn=None):
+        """
+        Plays dice rolls from a given state, the moves are collected when lists are given for them.
+
+        Returns
+        -------
+        (list, int, int, int)
+            positions of the players, player whose turn it is, number of played turns and winner
+        """
+        jumps, win_position, max_num = self.__jump_list, self.win_position, self.max_num
+        winner = 0
+        for index in range(start, len(dice_rolls)):
+            if turn == stop_turn:
+                break
+            if players is not None and turn % self.checkpoint_interval == 0 and (
+                    not self.__checkpoint_turns or self.__checkpoint_turns[-1] != turn):
+                self.__checkpoint_turns.append(turn)
+                self.__checkpoints.append((index, tuple(positions), player))
+            dice_roll = dice_rolls[index]
+            updated_position = positions[player] + dice_roll
+            moved = updated_position <= win_position
+            if moved:
+                positions[player] = jumps[updated_position]
+            if players is not None:
+                players.append(player + 1)
+                new_positions.append(positions[player] if moved else OUT_OF_BOARD)
+            if moved and dice_roll == max_num:
+                continue
+            turn += 1
+            if positions[player] == win_position:
+                winner = player + 1
+                break
+            player = (player + 1) % self.num_of_players
+        return positions, player, turn, winner
+
+    def seek(self, turn):
+        """
+        Finds the positions of the players after a number of turns of the replayed game.
+
+        Starts from the closest checkpoint, so at most a checkpoint interval of turns is replayed.
+
+        Parameters
+        ----------
+        turn: int
+            Number of turns played
+
+        Returns
+        -------
+        list
+            Position of every player, starting from the first player at index 0
+        """
+        checkpoint = bisect_right(self.__checkpoint_turns, turn) - 1
+        start, positions, player = self.__checkpoints[checkpoint]
+        positions, _, _, _ = self.__play(self.__dice_rolls, start, list(positions), player,
+                                         self.__checkpoint_turns[checkpoint], stop_turn=turn)
+        return positions
+
+    def verify(self, players, dice_rolls, positions, lengths=None):
+        """
+        Checks recorded moves against the rules of the board, for many games at once.
+
+        Parameters
+        ----------
+        players: numpy.ndarray
+            Player id of every move
+        dice_rolls: numpy.ndarray
+            Number got on the dice in every move
+        positions: numpy.ndarray
+            Recorded position of the player after every move, negative when the roll moved the player out of the board
+        lengths: numpy.ndarray
+            Number of moves of every game, default value is a single game
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of every move breaking the rules, either by its position or by the player making it
+        """
+        players, dice_rolls, positions = (array(column, dtype=int) for column in (players, dice_rolls, positions))
+        num_of_moves = len(players)
+        lengths = array([num_of_moves] if lengths is None else lengths, dtype=int)
+        games = repeat(arange(len(lengths)), lengths)
+        game_starts = concatenate([[0], lengths.cumsum()[:-1]])
+
+        # The position before a move is the last recorded position of the same player in the same game
+        groups = games * (self.num_of_players + 1) + players
+        order = argsort(groups, kind='stable')
+        sorted_groups, sorted_positions = groups[order], positions[order]
+        index = arange(num_of_moves)
+        group_start = maximum.accumulate(where(concatenate([[True], sorted_groups[1:] != sorted_groups[:-1]]),
+                                               index, 0)) if num_of_moves else index
+        last_moved = maximum.accumulate(where(sorted_positions >= 0, index, -1)) if num_of_moves else index
+        previous = concatenate([[-1], last_moved[:-1]])[:num_of_moves]
+        current_positions = zeros(num_of_moves, dtype=int)
+        current_positions[order] = where(previous >= group_start, sorted_positions[previous], 0)
+
+        updated_positions = current_positions + dice_rolls
+        moved = updated_positions <= self.win_position
+        expected_positions = where(moved, self.jumps[minimum(updated_positions, self.win_position)], OUT_OF_BOARD)
+        wrong_position = expected_positions != positions
+
+        # A player keeps the turn only after moving with the maximum number on the dice
+        bonus = (dice_rolls == self.max_num) & (positions >= 0)
+        expected_players = concatenate([[1], where(bonus[:-1], players[:-1], players[:-1] % self.num_of_players + 1)])
+        expected_players[game_starts[lengths > 0]] = 1
+        wrong_player = expected_players[:num_of_moves] != players
+        return nonzero(wrong_position | wrong_player)[0]
+
+    def audit(self, archive, start=0, stop=None):
+        """
+        Checks a range of archived games played on this board against its rules.
+
+        Parameters
+        ----------
+        archive: GameArchive
+            Archive of games
+        start: int
+            Id of the first game to check
+        stop: int
+            Id after the last game to check, default value is the end of the archive
+
+        Returns
+        -------
+        numpy.ndarray
+            Id of every game with a move breaking the rules
+        """
+        stop = len(archive) if stop is None else stop
+        moves = archive.moves(start, stop)
+        lengths = archive.index['length'][start:stop]
+        wrong_moves = self.verify(moves['player'], moves['roll'], moves['position'], lengths)
+        games = repeat(arange(start, stop), lengths)
+        return array(sorted(set(games[wrong_moves].tolist())), dtype=int)
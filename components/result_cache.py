@@ -0,0 +1,201 @@
+from collections import OrderedDict
+from hashlib import sha256
+from os import makedirs, path as os_path, replace
+
+from numpy import asarray, load, savez
+
+from .board_config import board_config_hash, load_board_config
+from .optimizer import board_analysis, round_moments
+from shared.constants import DEFAULT_DICE
+
+
+class ResultCache:
+    def __init__(self, max_bytes=64 * 1024 ** 2, directory=None):
+        """
+        Keeps the results of board analyses by the content hash of the board, the dice and the number of players.
+
+        Results are kept in memory up to a total size, evicting the least recently used ones first, and written
+        to an optional directory, where evicted results are found again after a restart.
+
+        Parameters
+        ----------
+        max_bytes: int
+            Total size of the results kept in memory
+        directory: str
+            Directory of the results written on disk, default value keeps the results in memory only
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.num_of_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+
+    @staticmethod
+    def key(name, board_config, dice_config=DEFAULT_DICE, num_of_players=2):
+        """
+        Canonical key of the result of an analysis, the order of the ladders and snakes does not matter.
+
+        Parameters
+        ----------
+        name: str
+            Name of the analysis
+        board_config: dict
+            Configuration of the board, shaped like ``DEFAULT_BOARD``
+        dice_config: dict
+            Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+        num_of_players: int
+            Number of players in every game
+
+        Returns
+        -------
+        str
+        """
+        return sha256(f'{name}:{num_of_players}:{board_config_hash(board_config, dice_config)}'.encode()).hexdigest()
+
+    def __file(self, key):
+        return os_path.join(self.directory, f'{key}.npz')
+
+    def get(self, key):
+        """
+        Result kept for a key, looked up in memory and then on disk.
+
+        Parameters
+        ----------
+        key: str
+            Key of the result
+
+        Returns
+        -------
+        dict
+            Result as read-only arrays keyed by name, None when the result is not kept
+        """
+        if key in self.__entries:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return self.__entries[key][0]
+        if self.directory is not None and os_path.exists(self.__file(key)):
+            with load(self.__file(key)) as data:
+                result = {name: data[name] for name in data.files}
+            self.disk_hits += 1
+            return self.__keep(key, result)
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        """
+        Keeps the result of an analysis.
+
+        Parameters
+        ----------
+        key: str
+            Key of the result
+        result: dict
+            Numbers and arrays keyed by name
+
+        Returns
+        -------
+        dict
+            Result as read-only arrays keyed by name
+        """
+        result = {name: asarray(value) for name, value in result.items()}
+        if self.directory is not None:
+            makedirs(self.directory, exist_ok=True)
+            # Written at once, so a result is never seen half written
+            temp_path = f'{self.__file(key)}.tmp'
+            with open(temp_path, 'wb') as file:
+                savez(file, **result)
+            replace(temp_path, self.__file(key))
+        return self.__keep(key, result)
+
+    def __keep(self, key, result):
+        for value in result.values():
+            value.setflags(write=False)
+        size = sum(value.nbytes for value in result.values())
+        if key in self.__entries:
+            self.num_of_bytes -= self.__entries.pop(key)[1]
+        self.__entries[key] = (result, size)
+        self.num_of_bytes += size
+        while self.num_of_bytes > self.max_bytes and len(self.__entries) > 1:
+            self.num_of_bytes -= self.__entries.popitem(last=False)[1][1]
+        return result
+
+    def cached(self, name, board_config, dice_config, num_of_players, compute):
+        """
+        Result of an analysis, only computed when it is not kept yet.
+
+        Parameters
+        ----------
+        name: str
+            Name of the analysis
+        board_config: dict
+            Configuration of the board, shaped like ``DEFAULT_BOARD``
+        dice_config: dict
+            Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+        num_of_players: int
+            Number of players in every game
+        compute: callable
+            Computes the result as numbers and arrays keyed by name, when it is not kept
+
+        Returns
+        -------
+        dict
+            Result as read-only arrays keyed by name
+        """
+        key = self.key(name, board_config, dice_config, num_of_players)
+        result = self.get(key)
+        if result is None:
+            result = self.put(key, compute())
+        return result
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def clear(self):
+        """
+        Drops the results kept in memory, the results written on disk are kept.
+        """
+        self.__entries.clear()
+        self.num_of_bytes = 0
+
+
+RESULT_CACHE = ResultCache()
+
+
+def analyse_board(board_config, dice_config=DEFAULT_DICE, num_of_players=2, cache=RESULT_CACHE):
+    """
+    Expected length and distributions of a game on a board, answered from the cache for an already analysed board.
+
+    Parameters
+    ----------
+    board_config: dict or str
+        Configuration of the board shaped like ``DEFAULT_BOARD``, or the path of a JSON or TOML configuration file
+    dice_config: dict
+        Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+    num_of_players: int
+        Number of players in every game
+    cache: ResultCache
+        Cache of the results, None to always compute them
+
+    Returns
+    -------
+    dict
+        ``expected_turns`` of a player, ``expected_rounds`` and ``variance`` of the number of rounds of a game,
+        ``turn_distribution`` of a player, ``round_distribution`` of a game and ``win_probabilities`` of every
+        player seat
+    """
+    if isinstance(board_config, str):
+        board_config = load_board_config(board_config)
+
+    def compute():
+        analysis = board_analysis(board_config, dice_config, num_of_players)
+        rounds = analysis.round_distribution(num_of_players)
+        mean, variance = round_moments(rounds)
+        return {'expected_turns': analysis.expected_turns(), 'expected_rounds': mean, 'variance': variance,
+                'turn_distribution': analysis.turn_distribution(), 'round_distribution': rounds,
+                'win_probabilities': analysis.win_probabilities(num_of_players)}
+
+    if cache is None:
+        return compute()
+    return cache.cached('analysis', board_config, dice_config, num_of_players, compute)
@@ -0,0 +1,402 @@
+from asyncio import create_task, get_running_loop, open_connection, Queue, start_server
+from itertools import count
+from json import dumps, loads
+
+from .board_config import build_board
+from .dice import Dice
+from shared.constants import DEFAULT_BOARD, DEFAULT_DICE
+from shared.exception import BoardException, TableException
+from shared.narration import NULL_SINK
+
+
+class Table:
+    def __init__(self, board, dice):
+        """
+        A game played on the server, where turns are driven by roll messages instead of console inputs.
+
+        Parameters
+        ----------
+        board: Board
+            Board of the game
+        dice: Dice
+            Dice of the game
+        """
+        self.board = board
+        self.dice = dice
+        self.player = 1
+        self.winner = 0
+
+    def roll(self, player):
+        """
+        Rolls the dice for the player whose turn it is and moves the player.
+
+        Parameters
+        ----------
+        player: int
+            Player id asking to roll
+
+        Returns
+        -------
+        dict
+            Outcome of the roll
+        """
+        if self.winner:
+            raise TableException(f'The game is already won by Player {self.winner}')
+        if player != self.player:
+            raise TableException(f"It is Player {self.player}'s turn")
+        dice_roll = self.dice.roll()
+        current_position = self.board.history.position(player)
+        new_position = self.board.advance(player, dice_roll)
+        if new_position is None:
+            event = 'overshoot'
+        elif new_position > current_position + dice_roll:
+            event = 'ladder'
+        elif new_position < current_position + dice_roll:
+            event = 'snake'
+        else:
+            event = 'move'
+        bonus = new_position is not None and self.dice.got_one_more_roll(dice_roll)
+        if not bonus:
+            if self.board.history.position(player) == self.board.win_position:
+                self.winner = player
+            else:
+                self.player = player % self.board.num_of_players + 1
+        return {'player': player, 'roll': dice_roll, 'from': current_position,
+                'to': self.board.history.position(player), 'event': event, 'bonus': bonus,
+                'next_player': self.player, 'winner': self.winner}
+
+    def state(self):
+        """
+        Current state of the game.
+
+        Returns
+        -------
+        dict
+        """
+        return {'positions': [self.board.history.position(player)
+                              for player in range(1, self.board.num_of_players + 1)],
+                'win_position': self.board.win_position, 'next_player': self.player, 'winner': self.winner}
+
+
+class GameServer:
+    def __init__(self, board_config=DEFAULT_BOARD, dice_config=DEFAULT_DICE):
+        """
+        Hosts many games in a single event loop, clients play them by exchanging messages.
+
+        A message is a dict with an action, either create, roll, state or close, and its parameters. The reply is
+        a dict, holding an error message when the action could not be done.
+
+        Parameters
+        ----------
+        board_config: dict
+            Configuration of the boards, shaped like ``DEFAULT_BOARD``
+        dice_config: dict
+            Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+        """
+        self.board_config = board_config
+        self.dice_config = dice_config
+        self.tables = {}
+        self.inbox = None
+        self.__table_ids = count(1)
+
+    def handle(self, message):
+        """
+        Handles a message of a client.
+
+        Parameters
+        ----------
+        message: dict
+            Action asked by the client and its parameters
+
+        Returns
+        -------
+        dict
+            Reply to the client
+        """
+        if not isinstance(message, dict):
+            return {'error': 'Messages should be JSON objects'}
+        action = message.get('action')
+        try:
+            if action == 'create':
+                return self.__create_table(self.__integer(message, 'num_of_players', 2),
+                                           self.__integer(message, 'seed'))
+            table_id = self.__integer(message, 'table')
+            if table_id not in self.tables:
+                raise TableException(f'No table found with id {table_id}')
+            if action == 'roll':
+                return {'table': table_id, **self.tables[table_id].roll(self.__integer(message, 'player'))}
+            if action == 'state':
+                return {'table': table_id, **self.tables[table_id].state()}
+            if action == 'close':
+                del self.tables[table_id]
+                return {'table': table_id, 'closed': True}
+            raise TableException(f'Unknown action {action}')
+        except (BoardException, TableException) as e:
+            return {'error': e.message}
+        except Exception as e:
+            # Any other failure is replied to the client, so the server keeps handling the other messages
+            return {'error': f'Could not {action}: {e}'}
+
+    @staticmethod
+    def __integer(message, name, default=None):
+        """
+        Integer field of a message.
+
+        Parameters
+        ----------
+        message: dict
+            Message of a client
+        name: str
+            Name of the field
+        default: int
+            Value of a missing field
+
+        Returns
+        -------
+        int
+        """
+        value = message.get(name, default)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+            raise TableException(f'{name} should be an integer, got {value!r}')
+        return value
+
+    def __create_table(self, num_of_players, seed):
+        if num_of_players < 2:
+            raise TableException('You need at least 2 players to play a game')
+        table_id = next(self.__table_ids)
+        dice = Dice(min_num=self.dice_config['min'], max_num=self.dice_config['max'], seed=seed,
+                    narrator=NULL_SINK)
+        self.tables[table_id] = Table(build_board(self.board_config, num_of_players, narrator=NULL_SINK), dice)
+        return {'table': table_id, **self.tables[table_id].state()}
+
+    async def run(self):
+        """
+        Handles the messages sent by the local clients, until cancelled.
+        """
+        if self.inbox is None:
+            self.inbox = Queue()
+        while True:
+            message, reply = await self.inbox.get()
+            if not reply.cancelled():
+                reply.set_result(self.handle(message))
+
+    def connect(self):
+        """
+        Connects a client living in the same process, the server has to be running to reply.
+
+        Returns
+        -------
+        LocalClient
+        """
+        if self.inbox is None:
+            self.inbox = Queue()
+        return LocalClient(self.inbox)
+
+    async def serve(self, host='127.0.0.1', port=0):
+        """
+        Listens for clients on a socket, exchanging one JSON message per line.
+
+        Parameters
+        ----------
+        host: str
+            Address to listen on
+        port: int
+            Port to listen on, default value picks a free port
+
+        Returns
+        -------
+        asyncio.Server
+        """
+        return await start_server(self.__serve_connection, host, port)
+
+    async def __serve_connection(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = self.handle(loads(line))
+                except ValueError:
+                    reply = {'error': 'Messages should be JSON objects, one per line'}
+                writer.write(dumps(reply).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+class LocalClient:
+    def __init__(self, inbox):
+        """
+        Client exchanging messages with a server of the same process through a queue.
+
+        Parameters
+        ----------
+        inbox: asyncio.Queue
+            Queue of messages handled by the server
+        """
+        self.inbox = inbox
+
+    async def request(self, message):
+        """
+        Sends a message to the server and waits for its reply.
+
+        Parameters
+        ----------
+        message: dict
+            Action asked to the server and its parameters
+
+        Returns
+        -------
+        dict
+        """
+        reply = get_running_loop().create_future()
+        await self.inbox.put((message, reply))
+        return await reply
+
+
+class SocketClient:
+    def __init__(self, reader, writer):
+        """
+        Client exchanging messages with a server over a socket.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            Stream of replies
+        writer: asyncio.StreamWriter
+            Stream of messages
+        """
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port):
+        """
+        Connects to a server.
+
+        Parameters
+        ----------
+        host: str
+            Address of the server
+        port: int
+            Port of the server
+
+        Returns
+        -------
+        SocketClient
+        """
+        return cls(*await open_connection(host, port))
+
+    async def request(self, message):
+        """
+        Sends a message to the server and waits for its reply.
+
+        Parameters
+        ----------
+        message: dict
+            Action asked to the server and its parameters
+
+        Returns
+        -------
+        dict
+        """
+        self.writer.write(dumps(message).encode() + b'\n')
+        await self.writer.drain()
+        return loads(await self.reader.readline())
+
+    async def close(self):
+        """
+        Closes the connection to the server.
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class ConsoleClient:
+    def __init__(self, client):
+        """
+        Console front end playing a game on a server, the players share the console.
+
+        Parameters
+        ----------
+        client: LocalClient, SocketClient
+            Connection to the server
+        """
+        self.client = client
+
+    async def play(self, num_of_players):
+        """
+        Creates a table and plays it until a player wins.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players
+        """
+        loop = get_running_loop()
+        table = await self.client.request({'action': 'create', 'num_of_players': num_of_players})
+        if 'error' in table:
+            print(f">>>> {table['error']}")
+            return
+        print(f">>>> Joined table {table['table']}, reach {table['win_position']} on the board to win the game")
+        player = table['next_player']
+        print(f"\n>>>> Player {player}'s turn")
+        while True:
+            roll = await loop.run_in_executor(None, input, '\tPress enter to roll a dice ')
+            if roll != '':
+                print('>>>> Please roll a dice to move forward')
+                continue
+            outcome = await self.client.request({'action': 'roll', 'table': table['table'], 'player': player})
+            if 'error' in outcome:
+                print(f">>>> {outcome['error']}")
+                # The turn is taken again from the state of the table, unless the table is gone
+                outcome = await self.client.request({'action': 'state', 'table': table['table']})
+                if 'error' in outcome or outcome['winner']:
+                    return
+                if outcome['next_player'] != player:
+                    player = outcome['next_player']
+                    print(f"\n>>>> Player {player}'s turn")
+                continue
+            print(f">>>> Player {player} rolled a dice and got {outcome['roll']}")
+            if outcome['event'] == 'overshoot':
+                print(f'>>>> This dice roll is moving the Player {player} out of the board, try again')
+            else:
+                print(f">>>> Moving Player {player} from {outcome['from']} to {outcome['to']} on the board")
+            if outcome['winner']:
+                print(f">>>> HURRAYYYYY! Player {outcome['winner']} won the game")
+                return
+            if outcome['bonus']:
+                print(f'>>>> GREAT! One more turn for Player {player}')
+            elif outcome['next_player'] != player:
+                player = outcome['next_player']
+                print(f"\n>>>> Player {player}'s turn")
+
+
+async def play_on_server(num_of_players, host=None, port=None):
+    """
+    Plays a game from the console as a client of a game server.
+
+    Parameters
+    ----------
+    num_of_players: int
+        Number of players
+    host: str
+        Address of the server, default value hosts the game on a server of this process
+    port: int
+        Port of the server
+    """
+    if host is not None:
+        client = await SocketClient.connect(host, port)
+        try:
+            await ConsoleClient(client).play(num_of_players)
+        finally:
+            await client.close()
+        return
+    server = GameServer()
+    client = server.connect()
+    dispatcher = create_task(server.run())
+    try:
+        await ConsoleClient(client).play(num_of_players)
+    finally:
+        dispatcher.cancel()
@@ -0,0 +1,171 @@
+from array import array as typed_array
+from random import Random
+
+from numpy import arange, array, bincount, int32, minimum, where, zeros
+from numpy.random import default_rng
+
+
+class SimulationResult:
+    def __init__(self, winners, rounds, rolls):
+        """
+        Holds the compact per-game results of a batch simulation.
+
+        Parameters
+        ----------
+        winners: numpy.ndarray
+            Winning player id of every game, 0 if the game was abandoned
+        rounds: numpy.ndarray
+            Number of rounds played in every game
+        rolls: numpy.ndarray
+            Number of dice rolls made by all the players in every game
+        """
+        self.winners = winners
+        self.rounds = rounds
+        self.rolls = rolls
+
+    def __len__(self):
+        return len(self.winners)
+
+    def win_counts(self, num_of_players):
+        """
+        Counts the games won by every player seat.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players in every game
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of won games indexed by player id, index 0 counts the abandoned games
+        """
+        return bincount(self.winners, minlength=num_of_players + 1)
+
+
+def simulate(board, dice, num_games, seed=None, max_rounds=None):
+    """
+    Plays complete games on a board without any console interaction.
+
+    The rules are the ones of the interactive game: a roll moving a player out of the board ends the turn,
+    ladders and snakes are followed from the landing position, and rolling the maximum number on the dice
+    rewards one more roll.
+
+    Parameters
+    ----------
+    board: Board
+        Board to play on, its number of players is used for every game
+    dice: Dice
+        Dice to play with
+    num_games: int
+        Number of games to play
+    seed: int
+        Seed for the random number generator, games are reproducible for the same seed
+    max_rounds: int
+        Number of rounds after which a game is abandoned, default value is to play until a player wins
+
+    Returns
+    -------
+    SimulationResult
+    """
+    num_of_players = board.num_of_players
+    win_position = board.win_position
+    jumps = board.jump_table().tolist()
+    min_num, max_num = dice.min_num, dice.max_num
+    randint = Random(seed).randint
+
+    winners = typed_array('i')
+    rounds = typed_array('i')
+    rolls = typed_array('i')
+    for _ in range(num_games):
+        positions = [0] * num_of_players
+        winner = 0
+        num_of_rounds = 0
+        num_of_rolls = 0
+        while not winner and num_of_rounds != max_rounds:
+            num_of_rounds += 1
+            for player in range(num_of_players):
+                position = positions[player]
+                while True:
+                    dice_roll = randint(min_num, max_num)
+                    num_of_rolls += 1
+                    updated_position = position + dice_roll
+                    if updated_position > win_position:
+                        break
+                    position = jumps[updated_position]
+                    if dice_roll != max_num:
+                        break
+                positions[player] = position
+                if position == win_position:
+                    winner = player + 1
+                    break
+        winners.append(winner)
+        rounds.append(num_of_rounds)
+        rolls.append(num_of_rolls)
+    return SimulationResult(winners=array(winners, dtype=int32),
+                            rounds=array(rounds, dtype=int32),
+                            rolls=array(rolls, dtype=int32))
+
+
+def simulate_batch(board, dice, num_games, seed=None, max_rounds=None):
+    """
+    Plays complete games on a board in lockstep using NumPy.
+
+    Every step draws one dice roll for all the unfinished games and applies it to the player whose turn it is,
+    following the same rules as ``simulate``. Finished games are dropped from the working set.
+
+    Parameters
+    ----------
+    board: Board
+        Board to play on, its number of players is used for every game
+    dice: Dice
+        Dice to play with
+    num_games: int
+        Number of games to play
+    seed: int, numpy.random.SeedSequence
+        Seed for the random number generator, games are reproducible for the same seed
+    max_rounds: int
+        Number of rounds after which a game is abandoned, default value is to play until a player wins
+
+    Returns
+    -------
+    SimulationResult
+    """
+    num_of_players = board.num_of_players
+    win_position = board.win_position
+    jumps = board.jump_table()
+    min_num, max_num = dice.min_num, dice.max_num
+    rng = default_rng(seed)
+
+    winners = zeros(num_games, dtype=int32)
+    rounds = zeros(num_games, dtype=int32)
+    rolls = zeros(num_games, dtype=int32)
+    turns = zeros(num_games, dtype=int32)
+    positions = zeros((num_games, num_of_players), dtype=jumps.dtype)
+    players = zeros(num_games, dtype=int32)
+    active = arange(num_games)
+    while len(active):
+        dice_rolls = rng.integers(min_num, max_num, size=len(active), endpoint=True)
+        current_players = players[active]
+        current_positions = positions[active, current_players]
+        updated_positions = current_positions + dice_rolls
+        moved = updated_positions <= win_position
+        new_positions = where(moved, jumps[minimum(updated_positions, win_position)], current_positions)
+        positions[active, current_players] = new_positions
+        rolls[active] += 1
+
+        turn_over = ~moved | (dice_rolls != max_num)
+        won = turn_over & (new_positions == win_position)
+        finished = won
+        if won.any():
+            winners[active[won]] = current_players[won] + 1
+        ended_turns = active[turn_over]
+        turns[ended_turns] += 1
+        players[ended_turns] = turns[ended_turns] % num_of_players
+        if max_rounds is not None:
+            finished = finished | (turns[active] >= max_rounds * num_of_players)
+        if finished.any():
+            done = active[finished]
+            rounds[done] = (turns[done] + num_of_players - 1) // num_of_players
+            active = active[~finished]
+    return SimulationResult(winners=winners, rounds=rounds, rolls=rolls)
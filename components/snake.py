@@ -1,4 +1,6 @@
 class Snake:
+    __slots__ = ('mouth', 'tail')
+
     def __init__(self, mouth, tail):
         """
         Initializes a snake for the game.
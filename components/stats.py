@@ -1,27 +1,66 @@
 from math import ceil
-from json import load
+from os import makedirs, path as os_path
 
-import matplotlib.pyplot as plt
-from pandas import option_context, read_json
-from seaborn import lineplot, countplot
-
-from shared.constants import GAME_DATA_FILE
+from components.stats_cache import ANALYTICS_CACHE, GameAnalytics
+from shared.constants import DEFAULT_DICE, GAME_ARCHIVE_DIR, GAME_DATA_FILE, GAME_EXPORT_FILE, GAME_RECORD_FILE
+from shared.exception import ExportException
 
 
 class GameStats:
-    def __init__(self):
+    def __init__(self, history=None, win_position=None, max_num=DEFAULT_DICE['max'], analytics_cache=ANALYTICS_CACHE):
         """
         Provides visual data of the last saved game for analysis.
+
+        Parameters
+        ----------
+        history: MoveHistory
+            History of a game to analyse directly, default value is to load the last saved game
+        win_position: int
+            Win position of the board the history was played on
+        max_num: int
+            Maximum number on the dice the history was played with
+        analytics_cache: AnalyticsCache
+            Cache of the analytics of the saved games, only read again once they changed
         """
-        self.game_json = None
+        self.analytics = None
+        self.__frames = None
+        if history is not None:
+            self.analytics = GameAnalytics.from_history(history, max_num, win_position)
+            return
         try:
-            with open(GAME_DATA_FILE) as file:
-                self.game_json = load(file)
+            self.analytics = analytics_cache.load(GAME_RECORD_FILE)
+            return
+        except FileNotFoundError:
+            pass
+        except Exception:
+            print('Some error occurred while reading the game record file.')
+        try:
+            self.analytics = analytics_cache.load(GAME_DATA_FILE)
         except FileNotFoundError:
             print('No game data file found. Please play a game to save a new one.')
         except Exception:
             print('Some error occurred while reading the game data file.')
 
+    @classmethod
+    def from_archive(cls, archive, game_id):
+        """
+        Provides visual data of a game kept in an archive.
+
+        Parameters
+        ----------
+        archive: GameArchive
+            Archive of games
+        game_id: int
+            Id of the game, in the order the games were archived
+
+        Returns
+        -------
+        GameStats
+        """
+        entry = archive.index[game_id]
+        return cls(history=archive.history(game_id), win_position=int(entry['win_position']),
+                   max_num=int(entry['max_num']))
+
     def load_menu(self):
         """
         Loads menu for statistical analysis.
@@ -29,26 +68,52 @@ class GameStats:
         while True:
             print('\t1. Show as a plot')
             print('\t2. Print directly on console')
-            print('\t3. Exit')
-            user_selection = input('\nEnter your choice (1-3): ')
+            print('\t3. Export all archived games to Parquet')
+            print('\t4. Exit')
+            user_selection = input('\nEnter your choice (1-4): ')
             print()
             if user_selection == '1':
                 self.load_graphs()
             elif user_selection == '2':
                 self.pretty_print()
             elif user_selection == '3':
+                self.export()
+            elif user_selection == '4':
                 exit()
             else:
-                print('Select an available choice between 1 and 3')
+                print('Select an available choice between 1 and 4')
+
+    @staticmethod
+    def export(path=GAME_EXPORT_FILE):
+        """
+        Exports the moves of all the archived games to a columnar file, streamed in row groups.
+
+        Parameters
+        ----------
+        path: str
+            Path of the exported file, a .parquet or .arrow file
+        """
+        from components.archive import GameArchive
+        from components.export import HistoryExporter
+
+        try:
+            makedirs(os_path.dirname(path), exist_ok=True)
+            with HistoryExporter(path) as exporter:
+                exporter.add_archive(GameArchive(GAME_ARCHIVE_DIR))
+        except ExportException as e:
+            print(f'>>>> {e.message}\n')
+            return
+        print(f'>>>> Exported {exporter.num_of_moves} moves of {exporter.num_of_games} games to {path}\n')
 
     def load_graphs(self):
         """
         Loads menu to load different plots based on user choice.
         """
-        rolls_data = read_json(self.game_json['rolls'])
-        moves_data = read_json(self.game_json['moves'])
-        moves_data.index += 1
-        rolls_data.index += 1
+        # The plotting stack is slow to import, so it is only loaded once plots are asked for
+        import matplotlib.pyplot as plt
+        from seaborn import lineplot, countplot
+
+        moves_data, rolls_data = self.__load_data()
         while True:
             print('\t1. Show all players game play as line plot')
             print('\t2. Show all players dice rolls as count plot')
@@ -79,11 +144,32 @@ class GameStats:
             else:
                 print('Select an available choice between 1 and 3')
 
+    def __load_data(self):
+        """
+        Loads the players' positions and dice rolls as dataframes indexed from 1, built once per game.
+
+        Returns
+        -------
+        (pandas.DataFrame, pandas.DataFrame)
+            players' positions and dice rolls
+        """
+        if self.__frames is None:
+            from pandas import DataFrame, Series
+
+            players = range(1, self.analytics.num_of_players + 1)
+            moves_data = DataFrame(data={f'Player {player}': Series(self.analytics.progress(player))
+                                         for player in players})
+            rolls_data = DataFrame(data={f'Player {player}': Series(self.analytics.rolls[player - 1])
+                                         for player in players})
+            moves_data.index += 1
+            rolls_data.index += 1
+            self.__frames = moves_data, rolls_data
+        return self.__frames
+
     def pretty_print(self):
-        rolls_data = read_json(self.game_json['rolls'])
-        moves_data = read_json(self.game_json['moves'])
-        moves_data.index += 1
-        rolls_data.index += 1
+        from pandas import option_context
+
+        moves_data, rolls_data = self.__load_data()
         with option_context('display.max_rows', None, 'display.max_columns', None):
             print("\t\tPlayers' position data")
             print(moves_data)
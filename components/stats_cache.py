@@ -0,0 +1,303 @@
+from hashlib import sha256
+from json import loads
+from os import stat
+
+from numpy import arange, array, bincount, cumsum, flatnonzero, int32, int64, minimum, ones, repeat, where, zeros
+
+from .export import export_columns
+from .recorder import GameRecordReader
+from shared.constants import DEFAULT_DICE
+
+
+class GameAnalytics:
+    def __init__(self, rolls, positions, max_num, win_position=None):
+        """
+        Typed arrays of a single game with memoized aggregates, every aggregate is computed at most once.
+
+        Parameters
+        ----------
+        rolls: list
+            Dice rolls of every player as an int array, starting from the first player at index 0
+        positions: list
+            Positions of every player starting from 0 as an int array, starting from the first player at index 0
+        max_num: int
+            Maximum number on the dice, rewarding one more dice roll
+        win_position: int
+            Win position of the board, default value is the furthest position reached
+        """
+        self.rolls = [array(player_rolls, dtype=int32) for player_rolls in rolls]
+        self.positions = [array(player_positions, dtype=int32) for player_positions in positions]
+        self.num_of_players = len(self.rolls)
+        if win_position is None:
+            win_position = max((int(player_positions.max()) for player_positions in self.positions
+                                if len(player_positions)), default=0)
+        self.win_position = win_position
+        self.max_num = max_num
+        self.__memo = {}
+
+    @classmethod
+    def from_history(cls, history, max_num, win_position=None):
+        """
+        Analytics of a game kept in a move history.
+
+        Parameters
+        ----------
+        history: MoveHistory
+            History of the game
+        max_num: int
+            Maximum number on the dice the game was played with
+        win_position: int
+            Win position of the board, default value is the furthest position reached
+
+        Returns
+        -------
+        GameAnalytics
+        """
+        players = range(1, history.num_of_players + 1)
+        return cls([history.rolls(player) for player in players], [history.positions(player) for player in players],
+                   max_num, win_position)
+
+    @classmethod
+    def from_game_json(cls, game_json):
+        """
+        Analytics of a game saved in the legacy JSON game data, the win position is the furthest position reached.
+
+        Parameters
+        ----------
+        game_json: dict
+            Game data with the moves and rolls of every player as JSON records, and the maximum number on the dice
+
+        Returns
+        -------
+        GameAnalytics
+        """
+        columns = []
+        for key in ('rolls', 'moves'):
+            records = loads(game_json[key])
+            players = list(records[0]) if records else []
+            # Shorter columns are padded with nulls in the records
+            columns.append([[int(record[player]) for record in records if record.get(player) is not None]
+                            for player in players])
+        rolls, positions = columns
+        # Game data saved before the maximum number on the dice was kept was played with the default dice
+        return cls(rolls, positions, game_json.get('max_num', DEFAULT_DICE['max']))
+
+    def __memoized(self, name, compute):
+        if name not in self.__memo:
+            self.__memo[name] = compute()
+        return self.__memo[name]
+
+    def roll_counts(self):
+        """
+        Number of dice rolls of every player.
+
+        Returns
+        -------
+        numpy.ndarray
+            Counts indexed by player id minus one
+        """
+        return self.__memoized('roll_counts', lambda: array([len(rolls) for rolls in self.rolls], dtype=int))
+
+    def roll_histogram(self):
+        """
+        Occurrences of every number on the dice for every player.
+
+        Returns
+        -------
+        numpy.ndarray
+            Counts indexed by player id minus one, then by the number on the dice
+        """
+        def compute():
+            size = max((int(rolls.max()) + 1 for rolls in self.rolls if len(rolls)), default=0)
+            return array([bincount(rolls, minlength=size) for rolls in self.rolls], dtype=int).reshape(-1, size)
+        return self.__memoized('roll_histogram', compute)
+
+    def progress(self, player):
+        """
+        Positions of a player throughout the game, starting from 0.
+
+        Parameters
+        ----------
+        player: int
+            Player id
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.positions[player - 1]
+
+    def __moves(self):
+        """
+        Lines up the rolls of every player with the positions, which have no entry for the overshooting rolls.
+
+        Returns
+        -------
+        list
+            Landing position of every roll and final position, equal to the starting one when overshooting
+        """
+        def compute():
+            return [self.__player_moves(rolls, positions) for rolls, positions in zip(self.rolls, self.positions)]
+        return self.__memoized('moves', compute)
+
+    def __player_moves(self, rolls, positions):
+        num_of_rolls = len(rolls)
+        positions = positions if len(positions) else zeros(1, dtype=int32)
+        # Rolls are lined up with the positions they start from assuming none overshoots, the alignment is shifted
+        # after every overshooting roll found, so there is one pass over the remaining rolls per overshoot
+        moved = ones(num_of_rolls, dtype=bool)
+        first = shift = 0
+        while first < num_of_rolls:
+            starts = arange(first, num_of_rolls) - shift
+            landings = positions[minimum(starts, len(positions) - 1)] + rolls[first:]
+            stuck = flatnonzero((landings > self.win_position) | (starts + 1 >= len(positions)))
+            if not len(stuck):
+                break
+            first = first + int(stuck[0])
+            if first - shift + 1 >= len(positions):
+                # No position is left, the player stays on the last one for the remaining rolls
+                moved[first:] = False
+                break
+            moved[first] = False
+            first, shift = first + 1, shift + 1
+        starts = arange(num_of_rolls) - (cumsum(~moved) - ~moved)
+        current = positions[minimum(starts, len(positions) - 1)]
+        landings = (current + rolls).astype(int32)
+        finals = where(moved, positions[minimum(starts + 1, len(positions) - 1)], current).astype(int32)
+        return landings, finals
+
+    def hit_counts(self):
+        """
+        Number of ladders climbed, snakes fallen down and rolls overshooting the board, for every player.
+
+        Returns
+        -------
+        dict
+            Counts indexed by player id minus one, keyed by ladder, snake and overshoot
+        """
+        def compute():
+            counts = {'ladder': [], 'snake': [], 'overshoot': []}
+            for landings, finals in self.__moves():
+                overshoot = landings > self.win_position
+                counts['ladder'].append(int((finals > landings).sum()))
+                counts['snake'].append(int(((finals < landings) & ~overshoot).sum()))
+                counts['overshoot'].append(int(overshoot.sum()))
+            return {name: array(values, dtype=int) for name, values in counts.items()}
+        return self.__memoized('hit_counts', compute)
+
+    def turn_counts(self):
+        """
+        Number of turns of every player, rolls rewarded with one more roll belong to the same turn.
+
+        Returns
+        -------
+        numpy.ndarray
+            Counts indexed by player id minus one
+        """
+        def compute():
+            return array([int(((rolls != self.max_num) | (landings > self.win_position)).sum())
+                          for rolls, (landings, _) in zip(self.rolls, self.__moves())], dtype=int)
+        return self.__memoized('turn_counts', compute)
+
+
+class AnalyticsCache:
+    def __init__(self):
+        """
+        Keeps the analytics of saved games, reading a file again only once it changed.
+
+        A file is first checked by its modification time, and only read and hashed when it changed, so rewriting
+        the same content keeps the analytics. A changed file is read once, and parsed from the bytes hashed.
+        """
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path):
+        """
+        Analytics of the game saved in a record file or a JSON game data file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file, record files end with .rec
+
+        Returns
+        -------
+        GameAnalytics
+        """
+        modified = stat(path).st_mtime_ns
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == modified:
+            self.hits += 1
+            return entry[2]
+        with open(path, 'rb') as file:
+            data = file.read()
+        digest = sha256(data).hexdigest()
+        if entry is not None and entry[1] == digest:
+            self.hits += 1
+            self.entries[path] = (modified, digest, entry[2])
+            return entry[2]
+        self.misses += 1
+        if path.endswith('.rec'):
+            reader = GameRecordReader(path, data)
+            analytics = GameAnalytics.from_history(reader.to_history(), reader.max_num, reader.win_position)
+        else:
+            analytics = GameAnalytics.from_game_json(loads(data))
+        self.entries[path] = (modified, digest, analytics)
+        return analytics
+
+
+class ArchiveAnalytics:
+    def __init__(self, archive):
+        """
+        Aggregates over all the games of an archive, updated with the games archived since the last update only.
+
+        Parameters
+        ----------
+        archive: GameArchive
+            Archive of games
+        """
+        self.archive = archive
+        self.num_of_games = 0
+        self.num_of_turns = 0
+        self.roll_histogram = zeros(0, dtype=int)
+        self.win_counts = zeros(1, dtype=int)
+        self.hit_counts = {'ladder': 0, 'snake': 0, 'overshoot': 0}
+
+    def update(self):
+        """
+        Ingests the games archived since the last update.
+
+        Returns
+        -------
+        int
+            Number of ingested games
+        """
+        self.archive.refresh()
+        start, stop = self.num_of_games, len(self.archive)
+        if start < stop:
+            games = self.archive.index[start:stop]
+            moves = self.archive.moves(start, stop)
+            columns = export_columns(repeat(arange(start, stop, dtype=int64), games['length']), moves['player'],
+                                     moves['roll'], moves['position'], repeat(games['max_num'], games['length']))
+            moved = moves['position'] >= 0
+            landings = columns['from'] + columns['roll']
+            bonus = moved & (columns['roll'] == repeat(games['max_num'], games['length']))
+            self.num_of_turns += int((~bonus).sum())
+            self.roll_histogram = self.__add(self.roll_histogram, bincount(columns['roll']))
+            self.win_counts = self.__add(self.win_counts, bincount(games['winner']))
+            self.hit_counts['ladder'] += int((moved & (columns['to'] > landings)).sum())
+            self.hit_counts['snake'] += int((moved & (columns['to'] < landings)).sum())
+            self.hit_counts['overshoot'] += int((~moved).sum())
+        self.num_of_games = stop
+        return stop - start
+
+    @staticmethod
+    def __add(total, counts):
+        if len(counts) > len(total):
+            total, counts = counts.copy(), total
+        total[:len(counts)] += counts
+        return total
+
+
+ANALYTICS_CACHE = AnalyticsCache()
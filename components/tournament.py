@@ -0,0 +1,156 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+
+from numpy import bincount, zeros
+from numpy.random import SeedSequence
+
+from .board_config import build_board
+from .dice import Dice
+from .simulation import simulate_batch
+from shared.narration import NULL_SINK
+
+
+class TournamentStats:
+    def __init__(self, num_of_players):
+        """
+        Aggregate statistics of many games, which can be merged without keeping any move.
+
+        Parameters
+        ----------
+        num_of_players: int
+            Number of players in every game
+        """
+        self.num_of_players = num_of_players
+        self.num_of_games = 0
+        self.num_of_rolls = 0
+        self.win_counts = zeros(num_of_players + 1, dtype=int)
+        self.round_counts = zeros(1, dtype=int)
+
+    def add(self, result):
+        """
+        Adds the results of simulated games.
+
+        Parameters
+        ----------
+        result: SimulationResult
+            Results of the simulated games
+        """
+        self.num_of_games += len(result)
+        self.num_of_rolls += int(result.rolls.sum())
+        self.win_counts += result.win_counts(self.num_of_players)
+        self.__add_round_counts(bincount(result.rounds))
+
+    def merge(self, other):
+        """
+        Merges the statistics of other games into these ones.
+
+        Parameters
+        ----------
+        other: TournamentStats
+            Statistics of the other games
+        """
+        self.num_of_games += other.num_of_games
+        self.num_of_rolls += other.num_of_rolls
+        self.win_counts += other.win_counts
+        self.__add_round_counts(other.round_counts)
+
+    def __add_round_counts(self, round_counts):
+        if len(round_counts) > len(self.round_counts):
+            round_counts, self.round_counts = self.round_counts, round_counts.copy()
+        self.round_counts[:len(round_counts)] += round_counts
+
+    def mean_rounds(self):
+        """
+        Average number of rounds of the games.
+
+        Returns
+        -------
+        float
+        """
+        return float((self.round_counts * range(len(self.round_counts))).sum() / self.num_of_games)
+
+    def win_rates(self):
+        """
+        Share of the games won by every player seat.
+
+        Returns
+        -------
+        numpy.ndarray
+            Share of won games indexed by player id, index 0 is the share of abandoned games
+        """
+        return self.win_counts / self.num_of_games
+
+
+def play_shard(board, dice, num_games, seed_sequence, max_rounds=None):
+    """
+    Plays a shard of the games of a tournament.
+
+    Parameters
+    ----------
+    board: Board
+        Board to play on
+    dice: Dice
+        Dice to play with
+    num_games: int
+        Number of games in the shard
+    seed_sequence: numpy.random.SeedSequence
+        Independent seed of the shard
+    max_rounds: int
+        Number of rounds after which a game is abandoned
+
+    Returns
+    -------
+    TournamentStats
+    """
+    stats = TournamentStats(num_of_players=board.num_of_players)
+    stats.add(simulate_batch(board, dice, num_games, seed=seed_sequence, max_rounds=max_rounds))
+    return stats
+
+
+def run_tournament(board_config, dice_config, num_games, num_of_players=2, seed=None, workers=None,
+                   shard_size=10000, max_rounds=None):
+    """
+    Plays games over a pool of processes and merges their statistics.
+
+    Games are split in shards of a fixed size, each with its own seed spawned from the tournament seed, so the
+    statistics only depend on the seed and not on the number of workers.
+
+    Parameters
+    ----------
+    board_config: dict
+        Configuration of the board, shaped like ``DEFAULT_BOARD``
+    dice_config: dict
+        Minimum and maximum numbers of the dice, shaped like ``DEFAULT_DICE``
+    num_games: int
+        Number of games to play
+    num_of_players: int
+        Number of players in every game
+    seed: int
+        Seed of the tournament
+    workers: int
+        Number of processes, default value is the number of cores
+    shard_size: int
+        Number of games played at once by a process
+    max_rounds: int
+        Number of rounds after which a game is abandoned
+
+    Returns
+    -------
+    TournamentStats
+    """
+    board = build_board(board_config, num_of_players, narrator=NULL_SINK)
+    dice = Dice(min_num=dice_config['min'], max_num=dice_config['max'], narrator=NULL_SINK)
+    shards = [min(shard_size, num_games - start) for start in range(0, num_games, shard_size)]
+    seed_sequences = SeedSequence(seed).spawn(len(shards))
+    workers = workers or cpu_count()
+
+    stats = TournamentStats(num_of_players=num_of_players)
+    if workers == 1:
+        for shard, seed_sequence in zip(shards, seed_sequences):
+            stats.merge(play_shard(board, dice, shard, seed_sequence, max_rounds))
+        return stats
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard_stats in executor.map(play_shard, [board] * len(shards), [dice] * len(shards), shards,
+                                        seed_sequences, [max_rounds] * len(shards)):
+            stats.merge(shard_stats)
+    return stats
@@ -1,4 +1,10 @@
 GAME_DATA_FILE = 'data/last_game.json'
+GAME_RECORD_FILE = 'data/last_game.rec'
+GAME_ARCHIVE_DIR = 'data/archive'
+GAME_CHECKPOINT_FILE = 'data/checkpoint.npz'
+GAME_EXPORT_FILE = 'data/export/moves.parquet'
+BOARD_CACHE_DIR = 'data/cache/boards'
+RESULT_CACHE_DIR = 'data/cache/results'
 
 DEFAULT_BOARD = {
     'num_of_rows': 10,
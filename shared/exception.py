@@ -9,3 +9,29 @@ class BoardException(Exception):
             Message to be shown if exception is raised
         """
         self.message = message
+
+
+class TableException(Exception):
+    def __init__(self, message):
+        """
+        Custom exception related to a game table of the server.
+
+        Parameters
+        ----------
+        message: str
+            Message to be shown if exception is raised
+        """
+        self.message = message
+
+
+class ExportException(Exception):
+    def __init__(self, message):
+        """
+        Custom exception related to exporting game data.
+
+        Parameters
+        ----------
+        message: str
+            Message to be shown if exception is raised
+        """
+        self.message = message
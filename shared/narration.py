@@ -0,0 +1,120 @@
+from atexit import register
+
+# Console message of every narrated event, formatted with the fields of the event
+NARRATION = {
+    'default_board': '>>>> Loading with default board configurations - {rows} rows and {columns} columns',
+    'manual_board': '>>>> Manually configuring the board with {rows} rows and {columns} columns',
+    'loaded_board': '>>>> Loading the board configuration {path} - {rows} rows and {columns} columns',
+    'single_block_board': '>>>> Since there is only one block on the board, skipping the snakes and ladders '
+                          'configuration',
+    'board_ready': '>>>> Board setup completed\n>>>> Reach {win_position} on the board to win the game',
+    'dice_ready': '>>>> Setting up a dice with {min_num} and {max_num} as minimum and maximum numbers to get, '
+                  'also getting a {max_num} will reward one more dice roll',
+    'turn': "\n>>>> Player {player}'s turn",
+    'roll_prompt': '>>>> Please roll a dice to move forward',
+    'roll': '>>>> Player {player} rolled a dice and got {dice_roll}',
+    'position': '>>>> Player {player} is currently at {position} on the board',
+    'overshoot': '>>>> This dice roll is moving the Player {player} out of the board, try again',
+    'move': '>>>> Moving Player {player} from {position} to new position: {updated_position} on the board',
+    'ladder': '>>>> WOW! Found a ladder at the new position {updated_position}, jumping to {new_position} on the board',
+    'snake': '>>>> OUCH! Found a snake at the new position {updated_position}, falling to {new_position} on the board',
+    'bonus_roll': '>>>> GREAT! One more turn for Player {player}',
+    'victory': '>>>> HURRAYYYYY! Player {player} won the game',
+}
+
+
+class ConsoleSink:
+    def __init__(self, max_buffered=64):
+        """
+        Narrates the game on the console, buffering the messages until flushed so a turn is written at once.
+
+        Parameters
+        ----------
+        max_buffered: int
+            Number of buffered messages written without waiting for a flush
+        """
+        self.buffer = []
+        self.max_buffered = max_buffered
+        register(self.flush)
+
+    def emit(self, event, **fields):
+        """
+        Narrates an event.
+
+        Parameters
+        ----------
+        event: str
+            Name of the event, one of the keys of ``NARRATION``
+        fields: dict
+            Fields of the event
+        """
+        self.buffer.append(NARRATION[event].format(**fields))
+        if len(self.buffer) >= self.max_buffered:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered messages to the console.
+        """
+        if self.buffer:
+            print('\n'.join(self.buffer))
+            self.buffer = []
+
+
+class NullSink:
+    """
+    Drops the narration without formatting any message, for games played without anyone watching.
+    """
+
+    def emit(self, event, **fields):
+        """
+        Drops an event.
+
+        Parameters
+        ----------
+        event: str
+            Name of the event
+        fields: dict
+            Fields of the event
+        """
+
+    def flush(self):
+        """
+        Nothing to write.
+        """
+
+
+class StructuredSink:
+    def __init__(self, handler=None):
+        """
+        Narrates the game as event tuples for logs.
+
+        Parameters
+        ----------
+        handler: function
+            Called with every (event, fields) tuple, default value keeps the tuples in ``events``
+        """
+        self.events = []
+        self.handler = self.events.append if handler is None else handler
+
+    def emit(self, event, **fields):
+        """
+        Narrates an event.
+
+        Parameters
+        ----------
+        event: str
+            Name of the event, one of the keys of ``NARRATION``
+        fields: dict
+            Fields of the event
+        """
+        self.handler((event, fields))
+
+    def flush(self):
+        """
+        Nothing to write, every event is handled as it is emitted.
+        """
+
+
+CONSOLE = ConsoleSink()
+NULL_SINK = NullSink()
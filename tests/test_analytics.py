@@ -0,0 +1,64 @@
+from numpy import arange, sqrt
+from pytest import fixture, mark, raises
+
+from benchmarks.vectorized import play_with_move_player
+from components.analytics import MarkovAnalysis
+from components.board import Board
+from components.dice import Dice
+from components.simulation import simulate, simulate_batch
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+NUM_OF_PLAYERS = 3
+
+
+def new_board():
+    board = Board(num_of_players=NUM_OF_PLAYERS, rows=6, columns=8, narrator=NULL_SINK)
+    board.add_ladders([(3, 22), (11, 30), (27, 41)])
+    # The dice never rolls a 1, so the cell before the win position is a snake rather than a dead end
+    board.add_snakes([(19, 4), (35, 13), (47, 25)])
+    return board
+
+
+def new_dice(seed=None):
+    return Dice(min_num=2, max_num=5, seed=seed, narrator=NULL_SINK)
+
+
+def played_through_board(board, dice, num_games, seed):
+    """
+    Games played through ``Board.move_player`` like the console game, with a seeded dice like the simulations.
+    """
+    seeded_dice = Dice(min_num=dice.min_num, max_num=dice.max_num, seed=seed, narrator=NULL_SINK)
+    return play_with_move_player(board, seeded_dice, num_games)
+
+
+@fixture(scope='module')
+def analysis():
+    return MarkovAnalysis(new_board(), new_dice())
+
+
+@mark.parametrize('play, num_games', [(played_through_board, 5000), (simulate, 20000), (simulate_batch, 200000)])
+def test_markov_analysis_agrees_with_played_games(analysis, play, num_games):
+    played = play(new_board(), new_dice(), num_games, seed=7)
+
+    rounds_error = played.rounds.std() / sqrt(num_games)
+    assert abs(played.rounds.mean() - analysis.expected_rounds(NUM_OF_PLAYERS)) < 4 * rounds_error
+    wins = played.win_counts(NUM_OF_PLAYERS)[1:] / num_games
+    for seat, probability in enumerate(analysis.win_probabilities(NUM_OF_PLAYERS)):
+        assert abs(wins[seat] - probability) < 4 * sqrt(probability * (1 - probability) / num_games)
+
+
+def test_win_probabilities_sum_to_one(analysis):
+    assert abs(analysis.win_probabilities(NUM_OF_PLAYERS).sum() - 1) < 1e-9
+
+
+def test_expected_turns_is_the_mean_of_the_turn_distribution(analysis):
+    distribution = analysis.turn_distribution()
+    assert abs(analysis.expected_turns() - (distribution * arange(len(distribution))).sum()) < 1e-6
+
+
+def test_expected_turns_of_a_board_that_cannot_be_won():
+    # Without a 1 on the dice, a player on the cell before the win position is stuck
+    board = Board(num_of_players=NUM_OF_PLAYERS, rows=6, columns=8, narrator=NULL_SINK)
+    with raises(BoardException):
+        MarkovAnalysis(board, new_dice()).expected_turns()
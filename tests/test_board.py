@@ -0,0 +1,87 @@
+from numpy.random import default_rng
+from pytest import mark, raises
+
+from components.board import Board
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+
+def new_board():
+    return Board(num_of_players=2, rows=5, columns=5, narrator=NULL_SINK)
+
+
+def one_at_a_time(add, pairs):
+    """
+    Messages of the entities rejected when adding them one at a time, skipping the rejected ones.
+    """
+    messages = []
+    for i, (first_end, second_end) in enumerate(pairs):
+        try:
+            add(first_end, second_end)
+        except BoardException as e:
+            messages.append(f'{i + 1} ({first_end}, {second_end}): {e.message}')
+    return messages
+
+
+def in_a_batch(add, pairs):
+    """
+    Messages of the entities rejected when adding them in a batch.
+    """
+    try:
+        add(pairs)
+    except BoardException as e:
+        return [line.split(' ', 1)[1] for line in e.message.split('\n')]
+    return []
+
+
+@mark.parametrize('name, pairs, message', [
+    ('ladders', [(5, 20), (20, 30)], 'A ladder top already present at the specified bottom location - 20'),
+    ('ladders', [(20, 30), (5, 20)], 'A ladder bottom already present at the specified top location - 20'),
+    ('ladders', [(5, 20), (5, 21)], 'A ladder bottom already present at the specified bottom location - 5'),
+    ('snakes', [(50, 20), (20, 10)], 'A snake tail already exists at the specified mouth location - 20'),
+    ('snakes', [(20, 10), (50, 20)], 'A snake mouth already exists at the specified tail location - 20'),
+    ('snakes', [(50, 20), (50, 10)], 'A snake mouth already exists at the specified mouth location - 50'),
+])
+def test_batch_reports_the_same_message_as_one_at_a_time(name, pairs, message):
+    board = Board(num_of_players=2, narrator=NULL_SINK)
+    add_one = board.add_ladder if name == 'ladders' else board.add_snake
+    expected = one_at_a_time(add_one, pairs)
+    assert expected == [f'2 {pairs[1]}: {message}']
+
+    board = Board(num_of_players=2, narrator=NULL_SINK)
+    with raises(BoardException) as error:
+        (board.add_ladders if name == 'ladders' else board.add_snakes)(pairs)
+    assert error.value.message.endswith(message)
+
+
+@mark.parametrize('seed', range(20))
+def test_batch_rejects_the_same_entities_as_one_at_a_time(seed):
+    rng = default_rng(seed)
+    ladders = [tuple(pair) for pair in rng.integers(0, 27, size=(12, 2)).tolist()]
+    snakes = [tuple(pair) for pair in rng.integers(0, 27, size=(12, 2)).tolist()]
+    board = new_board()
+    expected_ladders = one_at_a_time(board.add_ladder, ladders)
+    expected_snakes = one_at_a_time(board.add_snake, snakes)
+
+    board = new_board()
+    assert in_a_batch(board.add_ladders, ladders) == expected_ladders
+    if expected_ladders:
+        # A rejected batch adds nothing, so the snakes are checked against the ladders placed one at a time
+        board = new_board()
+        one_at_a_time(board.add_ladder, ladders)
+    assert in_a_batch(board.add_snakes, snakes) == expected_snakes
+
+
+@mark.parametrize('name', ['ladders', 'snakes'])
+def test_chained_batch_rejects_the_same_entities_as_one_at_a_time(name):
+    # Every entity collides with the one before it, which is only placed when the one before it is not
+    if name == 'ladders':
+        pairs = [(position, position + 1) for position in range(2, 602)]
+    else:
+        pairs = [(position + 1, position) for position in range(2, 602)]
+    board = Board(num_of_players=2, rows=100, columns=100, narrator=NULL_SINK)
+    expected = one_at_a_time(board.add_ladder if name == 'ladders' else board.add_snake, pairs)
+    assert len(expected) == 300
+
+    board = Board(num_of_players=2, rows=100, columns=100, narrator=NULL_SINK)
+    assert in_a_batch(board.add_ladders if name == 'ladders' else board.add_snakes, pairs) == expected
@@ -0,0 +1,40 @@
+from pytest import raises
+
+from components.board import Board
+from components.board_config import load_board
+from components.dice import Dice
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+BOARD_CONFIG = {'num_of_rows': 8, 'num_of_columns': 8, 'ladders': [(3, 22), (11, 30), (27, 41)],
+                'snakes': [(19, 4), (35, 13), (63, 25)]}
+
+
+def built_board():
+    board = Board(num_of_players=2, rows=8, columns=8, narrator=NULL_SINK)
+    board.add_ladders(BOARD_CONFIG['ladders'])
+    board.add_snakes(BOARD_CONFIG['snakes'])
+    return board
+
+
+def test_compiled_board_and_reachability_index_are_reused(tmp_path):
+    dice = Dice(min_num=2, max_num=5, narrator=NULL_SINK)
+    expected = built_board().reachability(dice)
+    for _ in range(2):
+        board = load_board(BOARD_CONFIG, num_of_players=2, cache_dir=str(tmp_path), narrator=NULL_SINK, dice=dice)
+        assert (board.jumps == built_board().jumps).all()
+        index = board.reachability(dice)
+        assert (index.min_turns == expected.min_turns).all() and (index.reachable == expected.reachable).all()
+    assert len(list(tmp_path.glob('*.bin'))) == 1 and len(list(tmp_path.glob('*.reach'))) == 1
+
+    # A loaded index is still repaired as ladders and snakes are added
+    board.add_ladder(5, 60)
+    rebuilt = Board(num_of_players=2, rows=8, columns=8, narrator=NULL_SINK)
+    rebuilt.add_ladders([*BOARD_CONFIG['ladders'], (5, 60)])
+    rebuilt.add_snakes(BOARD_CONFIG['snakes'])
+    assert (board.reachability(dice).min_turns == rebuilt.reachability(dice).min_turns).all()
+
+
+def test_invalid_board_config_is_reported(tmp_path):
+    with raises(BoardException):
+        load_board({**BOARD_CONFIG, 'ladders': [(3, 'top')]}, num_of_players=2, cache_dir=str(tmp_path))
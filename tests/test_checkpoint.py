@@ -0,0 +1,72 @@
+from os import path as os_path
+
+from pytest import mark
+
+from components.board import Board
+from components.checkpoint import GameCheckpoint
+from components.dice import Dice
+from components.recorder import OUT_OF_BOARD
+from shared.narration import NULL_SINK
+
+NUM_OF_PLAYERS = 3
+NUM_OF_MOVES = 700
+
+
+def new_board():
+    board = Board(num_of_players=NUM_OF_PLAYERS, rows=10, columns=10, narrator=NULL_SINK)
+    board.add_ladders([(4, 25), (13, 46), (33, 49), (50, 69), (62, 81), (74, 92)])
+    board.add_snakes([(27, 5), (40, 3), (43, 18), (54, 31), (66, 45), (89, 53), (95, 77), (99, 41)])
+    return board
+
+
+def play(board, dice, num_of_moves, player=1, checkpoint=None):
+    """
+    Plays moves turn after turn like the console game, without checking for a victory.
+
+    Returns
+    -------
+    int
+        Id of the player to roll next
+    """
+    for _ in range(num_of_moves):
+        dice_roll = dice.roll()
+        player_moved = board.move_player(player, dice_roll)
+        if checkpoint is not None:
+            checkpoint.record(player, dice_roll, board.history.position(player) if player_moved else OUT_OF_BOARD)
+        if not player_moved or not dice.got_one_more_roll(dice_roll):
+            player = player % board.num_of_players + 1
+    return player
+
+
+def moves_of(board):
+    return [(board.history.rolls(player).tolist(), board.history.positions(player).tolist())
+            for player in range(1, NUM_OF_PLAYERS + 1)]
+
+
+@mark.parametrize('backend', ['random', 'pcg64'])
+@mark.parametrize('cut', [1, 7, 8, 9, 100, 257, 600])
+@mark.parametrize('torn', [False, True])
+def test_restored_game_goes_on_like_an_uninterrupted_one(tmp_path, backend, cut, torn):
+    uninterrupted = new_board()
+    play(uninterrupted, Dice(seed=11, backend=backend, narrator=NULL_SINK), NUM_OF_MOVES)
+    played_until_cut = new_board()
+    next_player = play(played_until_cut, Dice(seed=11, backend=backend, narrator=NULL_SINK), cut)
+
+    path = os_path.join(tmp_path, 'checkpoint.npz')
+    board, dice = new_board(), Dice(seed=11, backend=backend, narrator=NULL_SINK)
+    checkpoint = GameCheckpoint(path, snapshot_every=8)
+    checkpoint.start(board, dice)
+    play(board, dice, cut, checkpoint=checkpoint)
+    if torn:
+        # The game is interrupted while the next move is written to the delta file
+        with open(checkpoint.delta_path, 'ab') as file:
+            file.write(b'\x01\x00\x00\x00\x04')
+
+    # The game is interrupted without clearing the checkpoint, and resumed from the files alone
+    resumed = GameCheckpoint(path, snapshot_every=8)
+    player, _ = resumed.restore(narrator=NULL_SINK)
+    assert player == next_player
+    assert moves_of(resumed.board) == moves_of(played_until_cut)
+    play(resumed.board, resumed.dice, NUM_OF_MOVES - cut, player, resumed)
+    assert moves_of(resumed.board) == moves_of(uninterrupted)
+    assert len(resumed.moves()) == NUM_OF_MOVES
@@ -0,0 +1,92 @@
+from numpy import array, int32
+from numpy.random import default_rng
+from pytest import mark
+
+import components.simulation
+from components.board import Board
+from components.dice import Dice
+from components.multiplayer import MultiplayerGame
+from components.simulation import simulate
+from shared.narration import NULL_SINK
+
+
+class RecordedGenerator:
+    def __init__(self, seed):
+        """
+        NumPy generator keeping the dice rolls it draws, one array per draw.
+        """
+        self.generator = default_rng(seed)
+        self.draws = []
+
+    def integers(self, *args, **kwargs):
+        draws = self.generator.integers(*args, **kwargs)
+        self.draws.append(draws.copy())
+        return draws
+
+
+class ScriptedGenerator:
+    def __init__(self, draws):
+        """
+        NumPy generator drawing scripted dice rolls, one array per draw.
+        """
+        self.draws = iter(draws)
+
+    def integers(self, low, high, size, endpoint=False, dtype=int32):
+        return array(next(self.draws)[:size], dtype=dtype)
+
+
+class ScriptedRandom:
+    def __init__(self, rolls):
+        """
+        Random number generator of ``simulate`` drawing scripted dice rolls one at a time.
+        """
+        self.rolls = iter(rolls)
+
+    def randint(self, low, high):
+        return next(self.rolls)
+
+
+def new_board(num_of_players):
+    board = Board(num_of_players=num_of_players, rows=6, columns=8, narrator=NULL_SINK)
+    board.add_ladders([(3, 22), (11, 30), (27, 41)])
+    board.add_snakes([(19, 4), (35, 13), (47, 25)])
+    return board
+
+
+def test_first_winner_in_turn_order_wins():
+    board = Board(num_of_players=3, rows=2, columns=3, narrator=NULL_SINK)
+    game = MultiplayerGame(board, Dice(narrator=NULL_SINK))
+    # The second and third players both reach the win position with a bonus roll, which then overshoots
+    game.rng = ScriptedGenerator([[3, 6, 6], [1, 1]])
+    assert game.play_round() == 2
+    assert game.positions.tolist() == [3, 6, 0]
+    assert game.roll_counts.tolist() == [1, 2, 0]
+    assert game.bonus_rolls.tolist() == [0, 1, 0]
+    assert game.rounds == 1
+
+
+@mark.parametrize('seed', range(30))
+def test_rounds_match_a_player_by_player_game_with_the_same_rolls(seed, monkeypatch):
+    board = new_board(num_of_players=4)
+    dice = Dice(min_num=1, max_num=3, narrator=NULL_SINK)
+    game = MultiplayerGame(board, dice)
+    game.rng = RecordedGenerator(seed)
+    # The rolls of every round in the order a player by player game draws them
+    rolls = []
+    while not game.winner:
+        roll_counts = game.roll_counts.copy()
+        game.rng.draws.clear()
+        game.play_round()
+        rolled = (game.roll_counts - roll_counts).tolist()
+        for player, num_of_rolls in enumerate(rolled):
+            # Players still rolling draw in turn order, players after the winner never come first
+            rolls.extend(int(game.rng.draws[step][sum(count > step for count in rolled[:player])])
+                         for step in range(num_of_rolls))
+
+    scripted = ScriptedRandom(rolls)
+    monkeypatch.setattr(components.simulation, 'Random', lambda seed: scripted)
+    result = simulate(board, dice, num_games=1)
+    assert next(scripted.rolls, None) is None
+    assert result.winners.tolist() == [game.winner]
+    assert result.rounds.tolist() == [game.rounds]
+    assert result.rolls.tolist() == [int(game.roll_counts.sum())]
@@ -0,0 +1,37 @@
+from numpy import array_equal
+from numpy.random import default_rng
+from pytest import mark
+
+from components.board import Board
+from components.dice import Dice
+from components.reachability import ReachabilityIndex
+from shared.exception import BoardException
+from shared.narration import NULL_SINK
+
+
+def assert_same_index(repaired, built):
+    assert array_equal(repaired.destinations, built.destinations)
+    assert array_equal(repaired.reachable, built.reachable)
+    assert array_equal(repaired.min_turns, built.min_turns)
+    assert array_equal(repaired.dead_cells(), built.dead_cells())
+    assert array_equal(repaired.traps(), built.traps())
+
+
+@mark.parametrize('seed', range(60))
+def test_repaired_index_equals_a_freshly_built_one(seed):
+    rng = default_rng(seed)
+    rows, columns = rng.integers(2, 9, size=2).tolist()
+    board = Board(num_of_players=2, rows=rows, columns=columns, narrator=NULL_SINK)
+    min_num = int(rng.integers(1, 3))
+    dice = Dice(min_num=min_num, max_num=min_num + int(rng.integers(1, 6)), narrator=NULL_SINK)
+    index = board.reachability(dice)
+    for _ in range(int(rng.integers(1, 3 * rows * columns))):
+        start, end = rng.integers(1, board.win_position + 1, size=2).tolist()
+        try:
+            if rng.random() < 0.5:
+                board.add_ladder(min(start, end), max(start, end))
+            else:
+                board.add_snake(max(start, end), min(start, end))
+        except BoardException:
+            continue
+        assert_same_index(index, ReachabilityIndex(board, dice))
@@ -0,0 +1,48 @@
+from asyncio import create_task, run, wait_for
+
+from pytest import mark
+
+from components.server import ConsoleClient, GameServer
+
+
+async def replies(messages):
+    """
+    Replies of a running server to messages sent one after the other by a local client.
+    """
+    server = GameServer()
+    client = server.connect()
+    dispatcher = create_task(server.run())
+    try:
+        return [await wait_for(client.request(message), timeout=5) for message in messages]
+    finally:
+        dispatcher.cancel()
+
+
+@mark.parametrize('message', [
+    {'action': 'create', 'num_of_players': '3'},
+    {'action': 'create', 'num_of_players': 1},
+    {'action': 'create', 'seed': 'seed'},
+    {'action': 'roll', 'table': '1', 'player': 1},
+    {'action': 'roll', 'table': 1, 'player': [1]},
+    {'action': 'state', 'table': None},
+    {'action': 'unknown', 'table': 1},
+    ['create'],
+])
+def test_malformed_messages_get_an_error_reply(message):
+    created, error, state = run(replies([{'action': 'create'}, message, {'action': 'state', 'table': 1}]))
+    assert 'error' in error
+    # The server keeps handling the messages after the malformed one
+    assert state == created
+
+
+def test_console_client_reports_error_replies(capsys):
+    async def play():
+        server = GameServer()
+        dispatcher = create_task(server.run())
+        try:
+            await wait_for(ConsoleClient(server.connect()).play(1), timeout=5)
+        finally:
+            dispatcher.cancel()
+
+    run(play())
+    assert '>>>> You need at least 2 players to play a game' in capsys.readouterr().out